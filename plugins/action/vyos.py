@@ -23,6 +23,9 @@ __metaclass__ = type
 import sys
 import copy
 
+from ansible.module_utils._text import to_text
+from ansible.module_utils.connection import Connection, ConnectionError
+from ansible.module_utils.parsing.convert_bool import boolean
 from ansible_collections.ansible.netcommon.plugins.action.network import (
     ActionModule as ActionNetworkModule,
 )
@@ -48,13 +51,22 @@ class ActionModule(ActionNetworkModule):
         persistent_connection = self._play_context.connection.split(".")[-1]
         warnings = []
 
-        if persistent_connection == "network_cli":
+        if persistent_connection in ("network_cli", "httpapi"):
             provider = self._task.args.get("provider", {})
             if any(provider.values()):
                 display.warning(
-                    "provider is unnecessary when using network_cli and will be ignored"
+                    "provider is unnecessary when using %s and will be ignored"
+                    % persistent_connection
                 )
                 del self._task.args["provider"]
+            if persistent_connection == "network_cli":
+                try:
+                    self._defer_commit(task_vars)
+                except ConnectionError as exc:
+                    return {
+                        "failed": True,
+                        "msg": to_text(exc, errors="surrogate_then_replace"),
+                    }
         elif self._play_context.connection == "local":
             provider = load_provider(vyos_provider_spec, self._task.args)
             pc = copy.deepcopy(self._play_context)
@@ -130,3 +142,20 @@ class ActionModule(ActionNetworkModule):
             else:
                 result["warnings"] = warnings
         return result
+
+    def _defer_commit(self, task_vars):
+        """
+        Start or stop deferring the commits of the connection when it is
+        set for the task, stopping commits the changes pending on the
+        device before the task runs.
+        """
+        defer = task_vars.get("ansible_vyos_commit_deferred")
+        if defer is None:
+            return
+        defer = boolean(self._templar.template(defer), strict=False)
+        diff = Connection(self._connection.socket_path).defer_commit(defer)
+        if diff:
+            display.vvv(
+                "committed the deferred changes:\n%s" % diff,
+                self._play_context.remote_addr,
+            )
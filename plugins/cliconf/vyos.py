@@ -29,6 +29,46 @@ description:
   commands from VyOS network devices.
 version_added: 1.0.0
 options:
+  commit_deferred:
+    description:
+    - Defer the commits of the configuration loaded by the modules and keep
+      a single configuration session open across the tasks, so that the
+      changes of several tasks are committed at once. The pending changes
+      are committed at the first task run with this option set to false.
+    - The option is read by the vyos action plugin at the start of every
+      task it is set for, it can be set for the play, a block or a single
+      task. The tasks it is not set for leave the connection as it is.
+    - The changes still pending when the connection is closed, at the end
+      of the play or after a failed task, are discarded. A play deferring
+      its commits ends with a task run with this option set to false, such
+      as a I(vyos_command) task running C(show system commit).
+    - While changes are pending, the C(show configuration commands) views
+      are read from the candidate configuration of the session, so that the
+      following tasks see the changes of the previous ones, and the other
+      C(show) commands are run from the session. Any other command commits
+      the pending changes first.
+    - When the commit of the pending changes fails, they are all discarded
+      and the task that committed them fails.
+    version_added: 2.4.0
+    type: boolean
+    default: false
+    vars:
+    - name: ansible_vyos_commit_deferred
+  config_batch_size:
+    description:
+    - Number of configuration lines pasted to the device in a single write
+      when loading a candidate configuration. The responses are read back
+      until the device acknowledged every line of the batch with its
+      C([edit]) marker, and a failing line is reported with the command
+      that caused it.
+    - The default of C(1) sends the configuration line by line and waits
+      for the prompt after every line.
+    - Commands that expect a prompt are always sent on their own.
+    version_added: 2.4.0
+    type: int
+    default: 1
+    vars:
+    - name: ansible_vyos_config_batch_size
   config_commands:
     description:
     - Specifies a list of commands that can make configuration changes
@@ -40,34 +80,146 @@ options:
     default: []
     vars:
     - name: ansible_vyos_config_commands
+  config_json:
+    description:
+    - Fetch the configuration with C(show configuration json) when the
+      device can emit it, VyOS 1.3 and later, so that the network resource
+      facts are parsed from its json tree rather than from the
+      C(show configuration commands) output.
+    - When enabled, C(json) is listed in the configuration formats of the
+      capabilities of the device and accepted by C(get_config).
+    - Only the static_routes, lldp_global and lldp_interfaces facts read the
+      json tree, the others still fetch C(show configuration commands), so
+      gathering every resource then fetches the configuration twice.
+    version_added: 2.4.0
+    type: boolean
+    default: false
+    vars:
+    - name: ansible_vyos_config_json
+  config_minimize:
+    description:
+    - Before a candidate configuration is loaded, drop its C(set) and
+      C(delete) commands made redundant by a later C(delete) of their path
+      or of a parent path, such as the child deletes of a deleted node.
+    - The commands are also dropped from before the first C(delete) under
+      the deleted path when the configuration snapshot has the path, so
+      only enable it along with I(config_snapshot) when the device is
+      configured by the play alone.
+    version_added: 2.4.0
+    type: boolean
+    default: false
+    vars:
+    - name: ansible_vyos_config_minimize
+  config_snapshot:
+    description:
+    - Keep a snapshot of the C(show configuration commands) output for the
+      lifetime of the persistent connection and serve the filtered views
+      requested by the modules, such as C(| grep interfaces) or
+      C(| match "set protocols bgp"), from it without another device round-trip.
+    - The C(show configuration json) output is kept the same way.
+    - The snapshot is discarded when the configuration mode is entered, on
+      commit or discard, and when a command present in I(config_commands)
+      is sent to the device.
+    - The changes made to the device outside of the connection, from
+      another session or by a command missing from I(config_commands), are
+      not seen while the snapshot is kept. Only enable it when the device
+      is configured by the play alone.
+    version_added: 2.4.0
+    type: boolean
+    default: false
+    vars:
+    - name: ansible_vyos_config_snapshot
+  facts_cache:
+    description:
+    - Directory on the controller where the parsed network resource facts
+      of the device are stored, along with the revision and time of the
+      latest commit they were gathered at.
+    - Before gathering the network resource facts, I(vyos_facts) and the
+      resource modules read the latest commit with C(show system commit) and
+      reuse the stored facts when the device was not committed to since.
+    - The facts are stored in one file per device address and port, in a
+      directory created readable by its owner only. The facts of the
+      resources that hold no_log values, such as the BGP neighbor
+      passwords, are not stored and are gathered on every run.
+    - The cache is disabled when this option is not set.
+    version_added: 2.4.0
+    type: path
+    vars:
+    - name: ansible_vyos_facts_cache
 """
 
+import os
 import re
 import json
+import base64
+import tempfile
+import uuid
 
 from ansible.errors import AnsibleConnectionFailure
-from ansible.module_utils._text import to_text
+from ansible.module_utils._text import to_bytes, to_text
 from ansible.module_utils.common._collections_compat import Mapping
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import (
-    NetworkConfig,
-)
+from ansible.module_utils.six import string_types
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     to_list,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.config_diff import (
+    to_commands,
+    diff_commands,
+    find_set_command,
+    minimize_commands,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.utils import (
+    filter_config,
+    parse_commits,
+)
 from ansible.plugins.cliconf import CliconfBase
 
+# commands that can change the running configuration and therefore
+# make the configuration snapshot stale
+SNAPSHOT_INVALIDATE_COMMANDS = (
+    "configure",
+    "commit",
+    "commit-confirm",
+    "confirm",
+    "discard",
+    "load",
+    "merge",
+    "rollback",
+)
+
+# printed by the device in configuration mode after every command
+CONFIG_ACK_RE = re.compile(r"^\s*\[edit\]\s*$", re.M)
+CONFIG_PATH_RE = re.compile(r"Configuration path: \[([^\]]+)\]")
+
+# sent as they are while the deferred configuration session is open
+SESSION_COMMANDS = ("set", "delete", "compare", "commit", "exit", "run")
+
+# a configuration file uploaded for a replace is removed after it is loaded
+UPLOAD_PATH = "/tmp/ansible-%s.config"
+UPLOAD_MARKER = "ANSIBLE_EOF"
+
+# first release that can show the configuration in json
+CONFIG_JSON_VERSION = (1, 3)
+
 
 class Cliconf(CliconfBase):
     __rpc__ = CliconfBase.__rpc__ + [
         "commit",
+        "defer_commit",
         "discard_changes",
         "get_diff",
+        "get_facts_cache",
         "run_commands",
+        "set_facts_cache",
     ]
 
     def __init__(self, *args, **kwargs):
         super(Cliconf, self).__init__(*args, **kwargs)
         self._device_info = {}
+        self._config_snapshot = {}
+        self._facts_commit = None
+        self._commit_deferred = False
+        self._pending_commit = None
 
     def get_device_info(self):
         if not self._device_info:
@@ -106,11 +258,22 @@ class Cliconf(CliconfBase):
         if not flags:
             flags = []
 
-        if format == "text":
+        if format == "json":
+            if flags:
+                raise ValueError(
+                    "'flags' are not supported with the json format"
+                )
+            command = "show configuration json"
+        elif format == "text":
             command = "show configuration"
         else:
             command = "show configuration commands"
 
+        if self._snapshot_enabled():
+            out = self._get_filtered_config(command, to_list(flags))
+            if out is not None:
+                return out
+
         command += " ".join(to_list(flags))
         command = command.strip()
 
@@ -126,20 +289,52 @@ class Cliconf(CliconfBase):
             operations, candidate, commit, replace, comment
         )
 
-        results = []
-        requests = []
-        self.send_command("configure")
-        for cmd in to_list(candidate):
-            if not isinstance(cmd, Mapping):
-                cmd = {"command": cmd}
-
-            results.append(self.send_command(**cmd))
-            requests.append(cmd["command"])
-        out = self.get("compare")
+        if replace:
+            return self._replace_config(candidate, commit, replace, comment)
+
+        if self._minimize_enabled():
+            candidate = self._minimize_config(candidate)
+        pending = self._pending_commit
+        if pending and not commit:
+            # the candidate cannot be loaded and discarded again without
+            # discarding the changes pending in the session along with it
+            resp["response"] = []
+            resp["request"] = [
+                cmd["command"] if isinstance(cmd, Mapping) else cmd
+                for cmd in to_list(candidate)
+            ]
+            return resp
+
+        if not pending:
+            self.send_command("configure")
+        try:
+            results, requests = self._load_config(candidate)
+            out = self.get("compare")
+        except AnsibleConnectionFailure as e:
+            if not pending:
+                raise
+            self._pending_commit = None
+            self.discard_changes()
+            raise AnsibleConnectionFailure(
+                "%s\nthe changes pending in the configuration session were "
+                "discarded" % e.message
+            )
         out = to_text(out, errors="surrogate_or_strict")
         diff_config = out if not out.startswith("No changes") else None
 
-        if diff_config:
+        if diff_config and self._commit_deferred and commit:
+            # the changes are committed along with those of the next tasks
+            if pending is None:
+                pending = self._pending_commit = {"comments": [], "diff": None}
+            if diff_config == pending["diff"]:
+                diff_config = None
+            else:
+                pending["diff"] = diff_config
+                if comment and comment not in pending["comments"]:
+                    pending["comments"].append(comment)
+            self._config_snapshot = {}
+        elif diff_config:
+            self._pending_commit = None
             if commit:
                 try:
                     self.commit(comment)
@@ -152,15 +347,8 @@ class Cliconf(CliconfBase):
             else:
                 self.discard_changes()
         else:
-            self.send_command("exit")
-            if (
-                to_text(
-                    self._connection.get_prompt(), errors="surrogate_or_strict"
-                )
-                .strip()
-                .endswith("#")
-            ):
-                self.discard_changes()
+            self._pending_commit = None
+            self._exit_unchanged()
 
         if diff_config:
             resp["diff"] = diff_config
@@ -185,6 +373,19 @@ class Cliconf(CliconfBase):
                 "'output' value %s is not supported for get" % output
             )
 
+        if (
+            prompt is None
+            and answer is None
+            and command.startswith("show configuration commands")
+            and self._snapshot_enabled()
+        ):
+            flags = command.partition("show configuration commands")[2]
+            out = self._get_filtered_config(
+                "show configuration commands", [flags]
+            )
+            if out is not None:
+                return out
+
         return self.send_command(
             command=command,
             prompt=prompt,
@@ -194,6 +395,15 @@ class Cliconf(CliconfBase):
             check_all=check_all,
         )
 
+    def send_command(self, command=None, *args, **kwargs):
+        if self._pending_commit:
+            command = self._session_command(command)
+        if self._config_snapshot and self._needs_snapshot_invalidation(
+            command
+        ):
+            self._config_snapshot = {}
+        return super(Cliconf, self).send_command(command, *args, **kwargs)
+
     def commit(self, comment=None):
         if comment:
             command = 'commit comment "{0}"'.format(comment)
@@ -204,6 +414,32 @@ class Cliconf(CliconfBase):
     def discard_changes(self):
         self.send_command("exit discard")
 
+    def discard_deferred(self):
+        """
+        Discard the changes pending in the deferred configuration session
+        and leave the configuration mode.
+        :return: the diff of the discarded changes, None when no change
+                 was pending.
+        """
+        pending, self._pending_commit = self._pending_commit, None
+        if not pending:
+            return None
+        self.discard_changes()
+        return pending["diff"]
+
+    def defer_commit(self, defer=True):
+        """
+        Start or stop deferring the commits of edit_config, stopping commits
+        the changes pending in the configuration session.
+        :param defer: whether the commits are deferred.
+        :return: the diff of the committed changes, None when no change
+                 was pending.
+        """
+        self._commit_deferred = bool(defer)
+        if defer:
+            return None
+        return self._commit_pending()
+
     def get_diff(
         self,
         candidate=None,
@@ -237,60 +473,13 @@ class Cliconf(CliconfBase):
         if path:
             raise ValueError("'path' in diff is not supported")
 
-        set_format = candidate.startswith("set") or candidate.startswith(
-            "delete"
-        )
-        candidate_obj = NetworkConfig(indent=4, contents=candidate)
-        if not set_format:
-            config = [c.line for c in candidate_obj.items]
-            commands = list()
-            # this filters out less specific lines
-            for item in config:
-                for index, entry in enumerate(commands):
-                    if item.startswith(entry):
-                        del commands[index]
-                        break
-                commands.append(item)
-
-            candidate_commands = [
-                "set %s" % cmd.replace(" {", "") for cmd in commands
-            ]
-
-        else:
-            candidate_commands = str(candidate).strip().split("\n")
+        candidate_commands = to_commands(candidate)
 
         if diff_match == "none":
             diff["config_diff"] = list(candidate_commands)
             return diff
 
-        running_commands = [
-            str(c).replace("'", "") for c in running.splitlines()
-        ]
-
-        updates = list()
-        visited = set()
-
-        for line in candidate_commands:
-            item = str(line).replace("'", "")
-
-            if not item.startswith("set") and not item.startswith("delete"):
-                raise ValueError(
-                    "line must start with either `set` or `delete`"
-                )
-
-            elif item.startswith("set") and item not in running_commands:
-                updates.append(line)
-
-            elif item.startswith("delete"):
-                if not running_commands:
-                    updates.append(line)
-                else:
-                    item = re.sub(r"delete", "set", item)
-                    for entry in running_commands:
-                        if entry.startswith(item) and line not in visited:
-                            updates.append(line)
-                            visited.add(line)
-
+        updates = diff_commands(candidate_commands, running)
         diff["config_diff"] = list(updates)
         return diff
 
@@ -321,6 +510,73 @@ class Cliconf(CliconfBase):
 
         return responses
 
+    def get_facts_cache(self):
+        """
+        Read the latest commit of the device and return the network resource
+        facts stored for it.
+        :return: dict with the latest `commit` and the stored `resources`,
+                 None when the facts cache is disabled.
+        """
+        path = self._facts_cache_path()
+        if path is None or self._pending_commit:
+            # the configuration of the session is ahead of the last commit
+            return None
+
+        commits = parse_commits(
+            to_text(
+                self.send_command("show system commit"),
+                errors="surrogate_or_strict",
+            )
+        )
+        commit = None
+        if commits:
+            commit = dict(
+                revision=commits[0]["revision"],
+                datetime=commits[0]["datetime"],
+            )
+        if commit != self._facts_commit:
+            # the snapshot may predate the commit, the facts gathered
+            # for it must be parsed from a configuration read after it
+            self._config_snapshot = {}
+            self._facts_commit = commit
+
+        resources = {}
+        if commit:
+            stored = self._read_facts_cache(path)
+            if stored.get("commit") == commit:
+                resources = stored.get("resources") or {}
+        return {"commit": commit, "resources": resources}
+
+    def set_facts_cache(self, commit=None, resources=None):
+        """
+        Store the network resource facts gathered at a commit, along with
+        the facts already stored for that commit.
+        :param commit: commit returned by get_facts_cache.
+        :param resources: dict of resource name to facts.
+        """
+        path = self._facts_cache_path()
+        if path is None or not commit:
+            return
+
+        stored = self._read_facts_cache(path)
+        cached = {}
+        if stored.get("commit") == commit:
+            cached = stored.get("resources") or {}
+        cached.update(resources or {})
+
+        directory = os.path.dirname(path)
+        try:
+            if not os.path.isdir(directory):
+                os.makedirs(directory, 0o700)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"commit": commit, "resources": cached}, f)
+            os.rename(tmp_path, path)
+        except (IOError, OSError) as exc:
+            self._connection.queue_message(
+                "warning", "unable to store the facts cache: %s" % exc
+            )
+
     def get_device_operations(self):
         return {
             "supports_diff_replace": False,
@@ -333,12 +589,15 @@ class Cliconf(CliconfBase):
             "supports_diff_match": True,
             "supports_diff_ignore_lines": False,
             "supports_generate_diff": False,
-            "supports_replace": False,
+            "supports_replace": True,
         }
 
     def get_option_values(self):
+        formats = ["text", "set"]
+        if not self._pending_commit and self._supports_config_json():
+            formats.append("json")
         return {
-            "format": ["text", "set"],
+            "format": formats,
             "diff_match": ["line", "none"],
             "diff_replace": [],
             "output": [],
@@ -350,11 +609,366 @@ class Cliconf(CliconfBase):
         result.update(self.get_option_values())
         return json.dumps(result)
 
+    def _minimize_enabled(self):
+        try:
+            return self.get_option("config_minimize")
+        except (AttributeError, KeyError):
+            return False
+
+    def _snapshot_enabled(self):
+        try:
+            return self.get_option("config_snapshot")
+        except (AttributeError, KeyError):
+            return False
+
+    def _supports_config_json(self):
+        try:
+            if not self.get_option("config_json"):
+                return False
+        except (AttributeError, KeyError):
+            return False
+        version = self.get_device_info().get("network_os_version", "")
+        match = re.search(r"(\d+)\.(\d+)", version)
+        if not match:
+            return False
+        return tuple(int(x) for x in match.groups()) >= CONFIG_JSON_VERSION
+
+    def _facts_cache_path(self):
+        try:
+            directory = self.get_option("facts_cache")
+        except (AttributeError, KeyError):
+            return None
+        if not directory:
+            return None
+        device = "%s_%s" % (
+            self._connection.get_option("host"),
+            self._connection.get_option("port"),
+        )
+        return os.path.join(
+            directory, "%s.json" % re.sub(r"[^\w.-]", "_", device)
+        )
+
+    def _read_facts_cache(self, path):
+        try:
+            with open(path) as f:
+                stored = json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+        return stored if isinstance(stored, dict) else {}
+
+    def _config_batch_size(self):
+        try:
+            return max(int(self.get_option("config_batch_size") or 1), 1)
+        except (AttributeError, KeyError):
+            return 1
+
+    def _is_batchable(self, cmd):
+        """
+        Only plain configuration lines can be pasted, commands that expect
+        a prompt or that are not waited for are sent on their own.
+        """
+        if any(
+            cmd.get(key)
+            for key in ("prompt", "answer", "sendonly", "check_all")
+        ):
+            return False
+        return "\n" not in to_text(cmd["command"])
+
+    def _minimize_config(self, candidate):
+        """
+        Drop the commands of a candidate that a later `delete` makes
+        redundant. The configuration snapshot, when there is one, tells
+        which deleted paths exist before the candidate is loaded.
+        """
+        return minimize_commands(
+            to_list(candidate),
+            running=self._config_snapshot.get("show configuration commands"),
+        )
+
+    def _load_config(self, candidate):
+        """
+        Send the lines of a candidate configuration to the device in
+        configuration mode, pasted in batches when enabled.
+        :param candidate: list of commands.
+        :return: tuple of the responses and the commands sent.
+        """
+        results = []
+        requests = []
+        batch_size = self._config_batch_size()
+        batch = []
+        for cmd in to_list(candidate):
+            if not isinstance(cmd, Mapping):
+                cmd = {"command": cmd}
+
+            if batch_size > 1 and self._is_batchable(cmd):
+                batch.append(cmd["command"])
+                if len(batch) == batch_size:
+                    results.extend(self._send_config_batch(batch))
+                    requests.extend(batch)
+                    batch = []
+                continue
+
+            if batch:
+                results.extend(self._send_config_batch(batch))
+                requests.extend(batch)
+                batch = []
+            results.append(self.send_command(**cmd))
+            requests.append(cmd["command"])
+        if batch:
+            results.extend(self._send_config_batch(batch))
+            requests.extend(batch)
+        return results, requests
+
+    def _send_config_batch(self, batch):
+        """
+        Paste a batch of configuration lines to the device in one write and
+        read the responses until every line was acknowledged.
+        :param batch: list of configuration lines.
+        :return: list of responses, one per line.
+        """
+        if len(batch) == 1:
+            return [self.send_command(batch[0])]
+
+        try:
+            out = to_text(
+                self.send_command("\n".join(batch)),
+                errors="surrogate_or_strict",
+            )
+            while len(CONFIG_ACK_RE.findall(out)) < len(batch):
+                out += "\n" + to_text(
+                    self._connection.receive(), errors="surrogate_or_strict"
+                )
+        except AnsibleConnectionFailure as exc:
+            err = to_text(
+                getattr(exc, "message", exc), errors="surrogate_or_strict"
+            )
+            self._drain_config_batch(len(batch))
+            failed = self._find_failed_command(batch, err)
+            if failed:
+                err = "%s\nfailed command: %s" % (err, failed)
+            raise AnsibleConnectionFailure(err)
+
+        segments = CONFIG_ACK_RE.split(out)
+        results = []
+        for command, segment in zip(batch, segments):
+            lines = [
+                line
+                for line in segment.strip().splitlines()
+                if line.strip() != command.strip()
+            ]
+            lines.append("[edit]")
+            results.append("\n".join(lines).strip())
+        return results
+
+    def _drain_config_batch(self, count):
+        """
+        Read the responses of the lines pasted after a failing line, so the
+        next command sent on the connection gets its own response.
+        """
+        marker = "ansible-batch-end"
+        self.send_command("run echo %s" % marker, sendonly=True)
+        for _i in range(count + 1):
+            try:
+                out = self._connection.receive()
+            except AnsibleConnectionFailure as exc:
+                out = getattr(exc, "message", exc)
+            if marker in to_text(out, errors="surrogate_or_strict"):
+                break
+
+    def _find_failed_command(self, batch, err):
+        """
+        Map an error response back to the pasted line that caused it, using
+        the configuration path reported by the device or else the last line
+        echoed before the error.
+        """
+        match = CONFIG_PATH_RE.search(err)
+        if match:
+            path = match.group(1).split()
+            end = len(path) + 1
+            for command in batch:
+                tokens = command.replace("'", "").split()
+                if tokens[1:end] == path:
+                    return command
+
+        failed = None
+        position = -1
+        for command in batch:
+            index = err.rfind(command.strip())
+            if index > position:
+                failed, position = command, index
+        return failed
+
+    def _exit_unchanged(self):
+        """
+        Leave the configuration mode when there is nothing to commit.
+        """
+        self.send_command("exit")
+        if (
+            to_text(
+                self._connection.get_prompt(), errors="surrogate_or_strict"
+            )
+            .strip()
+            .endswith("#")
+        ):
+            self.discard_changes()
+
+    def _replace_config(self, candidate, commit, replace, comment):
+        """
+        Replace the whole configuration of the device with a configuration
+        in the curly-brace format and commit it in one step. The candidate
+        is uploaded to the device first, unless `replace` is the path of a
+        configuration file already present on the device.
+        :return: dict of the diff, the responses and the commands sent.
+        """
+        if not isinstance(replace, string_types):
+            lines = []
+            for item in to_list(candidate):
+                lines.extend(to_text(item).split("\n"))
+            command = find_set_command(lines)
+            if command is not None:
+                raise ValueError(
+                    "'replace' requires the configuration in the "
+                    "curly-brace format, found: %s" % command
+                )
+
+        # loading a file overwrites the changes of the deferred session
+        self._commit_pending()
+        resp = {}
+        if isinstance(replace, string_types):
+            path, uploaded = replace, False
+        else:
+            path, uploaded = UPLOAD_PATH % uuid.uuid4().hex, True
+            self._upload_config(candidate, path)
+
+        try:
+            self.send_command("configure")
+            try:
+                results = [self.send_command("load %s" % path)]
+                out = self.get("compare")
+            except AnsibleConnectionFailure:
+                self.discard_changes()
+                raise
+            out = to_text(out, errors="surrogate_or_strict")
+            diff_config = out if not out.startswith("No changes") else None
+
+            if diff_config and commit:
+                try:
+                    self.commit(comment)
+                except AnsibleConnectionFailure as e:
+                    msg = "commit failed: %s" % e.message
+                    self.discard_changes()
+                    raise AnsibleConnectionFailure(msg)
+                self.send_command("exit")
+            elif diff_config:
+                self.discard_changes()
+            else:
+                self._exit_unchanged()
+        finally:
+            if uploaded:
+                try:
+                    self.send_command("rm -f %s" % path)
+                except AnsibleConnectionFailure:
+                    # a leftover file in /tmp does not deserve to hide the
+                    # outcome of the replace
+                    pass
+
+        if diff_config:
+            resp["diff"] = diff_config
+        resp["response"] = results
+        resp["request"] = ["load %s" % path]
+        return resp
+
+    def _upload_config(self, candidate, path):
+        """
+        Write a configuration to `path` on the device in one transfer over
+        the CLI session. The contents are base64 encoded so that none of
+        the echoed lines can be taken for a prompt or an error.
+        """
+        text = "\n".join(to_list(candidate)).strip() + "\n"
+        data = to_text(base64.b64encode(to_bytes(text)))
+        lines = []
+        for idx in range(0, len(data), 76):
+            end = idx + 76
+            lines.append(data[idx:end])
+        self.send_command(
+            "base64 -d > %s << '%s'\n%s\n%s"
+            % (path, UPLOAD_MARKER, "\n".join(lines), UPLOAD_MARKER)
+        )
+
+    def _commit_pending(self):
+        """
+        Commit the changes pending in the deferred configuration session
+        and leave the configuration mode. The changes are all discarded
+        when the commit fails.
+        """
+        pending, self._pending_commit = self._pending_commit, None
+        if not pending:
+            return None
+        comment = "; ".join(pending["comments"]) or None
+        try:
+            self.commit(comment)
+        except AnsibleConnectionFailure as e:
+            self.discard_changes()
+            raise AnsibleConnectionFailure(
+                "commit of the deferred changes failed: %s" % e.message
+            )
+        self.send_command("exit")
+        return pending["diff"]
+
+    def _session_command(self, command):
+        """
+        Map a command sent while the deferred configuration session is open.
+        The `show configuration commands` views read the candidate
+        configuration, the other `show` commands are run from the session
+        and any other command but the configuration ones is sent after the
+        pending changes are committed.
+        """
+        text = to_text(command, errors="surrogate_or_strict").strip()
+        word = text.split(" ", 1)[0]
+        if word in SESSION_COMMANDS:
+            return command
+        if text.startswith("show configuration commands"):
+            return "show | %s" % text.partition("show configuration ")[2]
+        if word == "show":
+            return "run %s" % text
+        self._commit_pending()
+        return command
+
+    def _needs_snapshot_invalidation(self, command):
+        command = to_text(command, errors="surrogate_or_strict").strip()
+        if command.split(" ", 1)[0] in SNAPSHOT_INVALIDATE_COMMANDS:
+            return True
+        if command == "exit discard":
+            return True
+        try:
+            cfg_cmds = self.get_option("config_commands") or []
+        except (AttributeError, KeyError):
+            cfg_cmds = []
+        return command in cfg_cmds
+
+    def _get_filtered_config(self, command, flags):
+        """
+        Serve `command` followed by `flags` from the configuration snapshot.
+        Only `| grep` and `| match` filters are applied locally, None is
+        returned for anything else so that the caller asks the device.
+        """
+        if filter_config("", flags) is None:
+            return None
+
+        if command not in self._config_snapshot:
+            self._config_snapshot[command] = to_text(
+                self.send_command(command), errors="surrogate_or_strict"
+            )
+        return filter_config(self._config_snapshot[command], flags)
+
     def set_cli_prompt_context(self):
         """
         Make sure we are in the operational cli mode
         :return: None
         """
+        if self._pending_commit:
+            # the deferred configuration session is kept open across tasks
+            return
         if self._connection.connected:
             self._update_cli_prompt_context(
                 config_context="#", exit_command="exit discard"
@@ -0,0 +1,515 @@
+#
+# (c) 2021 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+author: Ansible Networking Team
+name: vyos
+short_description: Use the VyOS HTTP API to run commands on VyOS platform
+description:
+- This vyos plugin provides the low level abstraction apis of the vyos cliconf
+  plugin, C(get_config), C(edit_config), C(run_commands) and C(get_diff), over
+  the HTTP API of VyOS 1.3 and later, so that the modules of the collection can
+  be used with the C(ansible.netcommon.httpapi) connection unchanged.
+- A candidate configuration is sent to the device in a single request with
+  the C(set) and C(delete) commands that change the running configuration,
+  and the device commits them at once. Commit comments are not recorded.
+- Only the C(show) operational commands can be run.
+- The facts cache of the cliconf plugin is not supported, the facts are
+  always gathered from the device.
+version_added: 2.4.0
+options:
+  api_key:
+    description:
+    - Key of the HTTP API of the device, configured with
+      C(set service https api keys id <id> key <key>).
+    - The password of the connection is used when it is not set.
+    type: str
+    vars:
+    - name: ansible_vyos_api_key
+  config_minimize:
+    description:
+    - Before a candidate configuration is sent, drop its C(set) and
+      C(delete) commands made redundant by a later C(delete) of their path
+      or of a parent path, such as the child deletes of a deleted node.
+    type: boolean
+    default: false
+    vars:
+    - name: ansible_vyos_config_minimize
+  config_snapshot:
+    description:
+    - Keep the configuration read from the device for the lifetime of the
+      persistent connection and serve the C(show configuration commands)
+      views requested by the modules, such as C(| grep interfaces), from it
+      without another request.
+    - The snapshot is discarded when a configuration is loaded.
+    - The changes made to the device outside of the connection, from
+      another session, are not seen while the snapshot is kept. Only enable
+      it when the device is configured by the play alone.
+    type: boolean
+    default: false
+    vars:
+    - name: ansible_vyos_config_snapshot
+"""
+
+import json
+import re
+
+from ansible.module_utils._text import to_text
+from ansible.module_utils.common._collections_compat import Mapping
+from ansible.module_utils.connection import ConnectionError
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.six.moves.urllib.parse import urlencode
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    to_list,
+)
+from ansible_collections.ansible.netcommon.plugins.plugin_utils.httpapi_base import (
+    HttpApiBase,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.config_diff import (
+    PathTrie,
+    diff_commands,
+    minimize_commands,
+    normalize,
+    to_commands,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.config_tree import (
+    JsonConfigTree,
+    tokenize,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.utils import (
+    filter_config,
+)
+
+CONTENT_TYPE = "application/x-www-form-urlencoded"
+
+SHOW_CONFIG_COMMAND = "show configuration"
+
+
+class HttpApi(HttpApiBase):
+    __rpc__ = [
+        "commit",
+        "discard_changes",
+        "edit_config",
+        "get",
+        "get_capabilities",
+        "get_config",
+        "get_device_info",
+        "get_device_operations",
+        "get_diff",
+        "get_facts_cache",
+        "get_option_values",
+        "run_commands",
+        "set_facts_cache",
+    ]
+
+    def __init__(self, connection):
+        super(HttpApi, self).__init__(connection)
+        self._device_info = {}
+        self._config_snapshot = None
+
+    def login(self, username, password):
+        # the key is sent along with every request, setting the auth of the
+        # connection keeps it from sending basic auth credentials instead
+        self.connection._auth = {"Accept": "application/json"}
+
+    def handle_httperror(self, exc):
+        # the device rejects a wrong key, logging in again does not help
+        return exc
+
+    def send_request(self, data, path="/retrieve", **message_kwargs):
+        """
+        Send an API request to the device.
+        :param data: operation or list of operations of the request.
+        :param path: endpoint of the request.
+        :return: data of the response.
+        """
+        body = urlencode({"data": json.dumps(data), "key": self._api_key()})
+        response, response_data = self.connection.send(
+            path,
+            body,
+            method="POST",
+            headers={"Content-Type": CONTENT_TYPE},
+        )
+        return handle_response(response, response_data)
+
+    def get_device_info(self):
+        if not self._device_info:
+            device_info = {}
+
+            device_info["network_os"] = "vyos"
+            data = to_text(
+                self.get("show version"), errors="surrogate_or_strict"
+            ).strip()
+
+            match = re.search(r"Version:\s*(.*)", data)
+            if match:
+                device_info["network_os_version"] = match.group(1)
+
+            match = re.search(r"HW model:\s*(\S+)", data)
+            if match:
+                device_info["network_os_model"] = match.group(1)
+
+            device_info["network_os_hostname"] = to_text(
+                self.get("show host name"), errors="surrogate_or_strict"
+            ).strip()
+
+            self._device_info = device_info
+
+        return self._device_info
+
+    def get_config(self, flags=None, format=None):
+        if format:
+            option_values = self.get_option_values()
+            if format not in option_values["format"]:
+                raise ValueError(
+                    "'format' value %s is invalid. Valid values of format are %s"
+                    % (format, ", ".join(option_values["format"]))
+                )
+
+        flags = to_list(flags)
+        if format == "json":
+            if flags:
+                raise ValueError(
+                    "'flags' are not supported with the json format"
+                )
+            return json.dumps(self._get_running_config())
+
+        if format == "text":
+            config = to_text(
+                self.send_request(
+                    {"op": "showConfig", "path": [], "configFormat": "raw"}
+                ),
+                errors="surrogate_or_strict",
+            )
+        else:
+            config = "\n".join(
+                JsonConfigTree(self._get_running_config()).lines([])
+            )
+
+        out = filter_config(config, flags)
+        if out is None:
+            raise ValueError(
+                "'flags' value %s is not supported by the vyos http api"
+                % " ".join(flags)
+            )
+        return out
+
+    def edit_config(
+        self, candidate=None, commit=True, replace=None, comment=None
+    ):
+        if replace:
+            raise ValueError("'replace' is not supported")
+
+        requests = []
+        for cmd in to_list(candidate):
+            if isinstance(cmd, Mapping):
+                cmd = cmd["command"]
+            if tokenize(cmd)[:1] not in (["set"], ["delete"]):
+                raise ValueError(
+                    "command %s is not supported by the vyos http api, only "
+                    "`set` and `delete` commands can be loaded" % cmd
+                )
+            requests.append(cmd)
+
+        # the diff is computed against the configuration the device has now
+        self._config_snapshot = None
+        running = JsonConfigTree(self._get_running_config()).lines([])
+        if self._minimize_enabled():
+            requests = minimize_commands(requests, running)
+        requests, updates = self._sequence_config(requests, running)
+
+        if updates and commit:
+            if comment:
+                self.connection.queue_message(
+                    "vvvv", "commit comment not recorded: %s" % comment
+                )
+            operations = []
+            for cmd in requests:
+                tokens = tokenize(cmd)
+                operations.append({"op": tokens[0], "path": tokens[1:]})
+            self._config_snapshot = None
+            try:
+                self.send_request(operations, path="/configure")
+            except ConnectionError as exc:
+                raise ConnectionError("commit failed: %s" % exc)
+
+        resp = {}
+        if updates:
+            resp["diff"] = "\n".join(updates)
+        resp["response"] = ["" for cmd in requests]
+        resp["request"] = requests
+        return resp
+
+    def get(
+        self,
+        command=None,
+        prompt=None,
+        answer=None,
+        sendonly=False,
+        output=None,
+        newline=True,
+        check_all=False,
+    ):
+        if not command:
+            raise ValueError("must provide value of command to execute")
+        if output:
+            raise ValueError(
+                "'output' value %s is not supported for get" % output
+            )
+        if prompt or answer or sendonly:
+            raise ValueError(
+                "interactive commands are not supported by the vyos http api"
+            )
+
+        command = to_text(command, errors="surrogate_or_strict").strip()
+        if command.startswith(SHOW_CONFIG_COMMAND):
+            words = command.partition(SHOW_CONFIG_COMMAND)[2].split("|", 1)
+            flags = ["|" + words[1]] if len(words) > 1 else []
+            view = words[0].strip()
+            if view == "commands":
+                return self.get_config(flags=flags)
+            if view in ("json", ""):
+                return self.get_config(
+                    flags=flags, format="json" if view else "text"
+                )
+
+        words = command.split()
+        if words[0] != "show" or "|" in words:
+            raise ValueError(
+                "command %s is not supported by the vyos http api" % command
+            )
+        return self.send_request(
+            {"op": "show", "path": words[1:]}, path="/show"
+        )
+
+    def commit(self, comment=None):
+        """
+        The device commits the configuration loaded by edit_config at once,
+        there is nothing left to commit.
+        """
+        pass
+
+    def discard_changes(self):
+        """
+        The configuration is never left uncommitted on the device, there
+        is nothing to discard.
+        """
+        pass
+
+    def get_diff(
+        self,
+        candidate=None,
+        running=None,
+        diff_match="line",
+        diff_ignore_lines=None,
+        path=None,
+        diff_replace=None,
+    ):
+        diff = {}
+        option_values = self.get_option_values()
+
+        if candidate is None:
+            raise ValueError(
+                "candidate configuration is required to generate diff"
+            )
+
+        if diff_match not in option_values["diff_match"]:
+            raise ValueError(
+                "'match' value %s in invalid, valid values are %s"
+                % (diff_match, ", ".join(option_values["diff_match"]))
+            )
+
+        if diff_replace:
+            raise ValueError("'replace' in diff is not supported")
+
+        if diff_ignore_lines:
+            raise ValueError("'diff_ignore_lines' in diff is not supported")
+
+        if path:
+            raise ValueError("'path' in diff is not supported")
+
+        candidate_commands = to_commands(candidate)
+
+        if diff_match == "none":
+            diff["config_diff"] = list(candidate_commands)
+            return diff
+
+        updates = diff_commands(candidate_commands, running)
+        diff["config_diff"] = list(updates)
+        return diff
+
+    def run_commands(self, commands=None, check_rc=True):
+        if commands is None:
+            raise ValueError("'commands' value is required")
+
+        responses = list()
+        for cmd in to_list(commands):
+            if not isinstance(cmd, Mapping):
+                cmd = {"command": cmd}
+
+            output = cmd.pop("output", None)
+            if output:
+                raise ValueError(
+                    "'output' value %s is not supported for run_commands"
+                    % output
+                )
+
+            try:
+                out = self.get(**cmd)
+            except ConnectionError as e:
+                if check_rc:
+                    raise
+                out = e
+
+            responses.append(out)
+
+        return responses
+
+    def get_facts_cache(self):
+        """
+        The facts cache is not supported over the http api.
+        :return: None, the facts cache is disabled.
+        """
+        return None
+
+    def set_facts_cache(self, commit=None, resources=None):
+        """
+        The facts cache is not supported over the http api.
+        """
+        pass
+
+    def get_device_operations(self):
+        return {
+            "supports_diff_replace": False,
+            "supports_commit": True,
+            "supports_rollback": False,
+            "supports_defaults": False,
+            "supports_onbox_diff": False,
+            "supports_commit_comment": False,
+            "supports_multiline_delimiter": False,
+            "supports_diff_match": True,
+            "supports_diff_ignore_lines": False,
+            "supports_generate_diff": False,
+            "supports_replace": False,
+        }
+
+    def get_option_values(self):
+        return {
+            "format": ["text", "set", "json"],
+            "diff_match": ["line", "none"],
+            "diff_replace": [],
+            "output": [],
+        }
+
+    def get_capabilities(self):
+        result = {}
+        result["rpc"] = self.__rpc__
+        result["device_info"] = self.get_device_info()
+        result["device_operations"] = self.get_device_operations()
+        result.update(self.get_option_values())
+        result["network_api"] = "httpapi"
+        return json.dumps(result)
+
+    def _api_key(self):
+        try:
+            key = self.get_option("api_key")
+        except (AttributeError, KeyError):
+            key = None
+        return key or self.connection.get_option("password")
+
+    def _minimize_enabled(self):
+        try:
+            return self.get_option("config_minimize")
+        except (AttributeError, KeyError):
+            return False
+
+    def _snapshot_enabled(self):
+        try:
+            return self.get_option("config_snapshot")
+        except (AttributeError, KeyError):
+            return False
+
+    def _sequence_config(self, candidate, running):
+        """
+        Follow the commands of a candidate on the running configuration.
+        Every `set` is sent, the `delete` of a path that is not configured
+        at that point is left out as the API fails the whole request on it,
+        where the CLI only warns.
+        :param candidate: list of commands.
+        :param running: running configuration as `set` lines.
+        :return: tuple of the commands to send and of those changing the
+            configuration.
+        """
+        paths = PathTrie()
+        for line in running:
+            paths.set(tuple(normalize(line).split()[1:]), True)
+
+        requests = []
+        updates = []
+        for cmd in candidate:
+            words = tuple(normalize(cmd).split())
+            path = words[1:]
+            if words[0] == "set":
+                requests.append(cmd)
+                if paths.get(path) is None:
+                    updates.append(cmd)
+                    paths.set(path, True)
+            elif paths.has_prefix(path):
+                requests.append(cmd)
+                updates.append(cmd)
+                paths.pop_all(path)
+        return requests, updates
+
+    def _get_running_config(self):
+        """
+        Read the whole configuration of the device as its json tree, it is
+        kept as the configuration snapshot when it is enabled.
+        """
+        if self._config_snapshot is not None:
+            return self._config_snapshot
+        config = self.send_request({"op": "showConfig", "path": []}) or {}
+        if self._snapshot_enabled():
+            self._config_snapshot = config
+        return config
+
+
+def handle_response(response, response_data):
+    """
+    Read the data of an API response, the failures of the request are
+    raised as ConnectionError.
+    """
+    raw = response_data.read()
+    try:
+        response_data = json.loads(to_text(raw, errors="surrogate_or_strict"))
+    except ValueError:
+        response_data = {"error": to_text(raw, errors="surrogate_or_strict")}
+    if not isinstance(response_data, Mapping):
+        response_data = {"error": response_data}
+
+    if isinstance(response, HTTPError) or not response_data.get("success"):
+        error = response_data.get("error") or to_text(response)
+        raise ConnectionError(
+            to_text(error, errors="surrogate_or_strict"),
+            code=getattr(response, "code", None),
+        )
+
+    return response_data.get("data")
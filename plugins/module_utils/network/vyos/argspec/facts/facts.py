@@ -21,4 +21,5 @@ class FactsArgs(object):  # pylint: disable=R0903
         ),
         "gather_network_resources": dict(type="list", elements="str"),
         "available_network_resources": {"type": "bool", "default": False},
+        "timing": {"type": "bool", "default": False},
     }
@@ -259,4 +259,5 @@ class Firewall_rulesArgs(object):  # pylint: disable=R0903
             "default": "merged",
             "type": "str",
         },
+        "verify_after": {"default": True, "type": "bool"},
     }  # pylint: disable=C0301
@@ -95,4 +95,5 @@ class Static_routesArgs(object):  # pylint: disable=R0903
             "default": "merged",
             "type": "str",
         },
+        "verify_after": {"default": True, "type": "bool"},
     }  # pylint: disable=C0301
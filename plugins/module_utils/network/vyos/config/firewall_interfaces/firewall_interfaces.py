@@ -26,6 +26,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.facts import (
     Facts,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.firewall_interfaces.firewall_interfaces import (  # noqa: F401
+    Firewall_interfacesFacts,
+)
 
 
 class Firewall_interfaces(ConfigBase):
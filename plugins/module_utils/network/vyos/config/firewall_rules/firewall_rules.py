@@ -25,10 +25,18 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.facts import (
     Facts,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.firewall_rules.firewall_rules import (
+    Firewall_rulesFacts,
+)
 from ansible.module_utils.six import iteritems
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.utils import (
     list_diff_want_only,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.config_diff import (
+    apply_commands,
+)
+
+TAG_NODES = ("name", "ipv6-name", "rule")
 
 
 class Firewall_rules(ConfigBase):
@@ -74,8 +82,15 @@ class Firewall_rules(ConfigBase):
         warnings = list()
         commands = list()
 
+        running_config = None
         if self.state in self.ACTION_STATES:
-            existing_firewall_rules_facts = self.get_firewall_rules_facts()
+            if not self._module.params.get("verify_after", True):
+                running_config = Firewall_rulesFacts(
+                    self._module
+                ).get_device_data(self._connection)
+            existing_firewall_rules_facts = self.get_firewall_rules_facts(
+                data=running_config
+            )
         else:
             existing_firewall_rules_facts = []
 
@@ -90,7 +105,17 @@ class Firewall_rules(ConfigBase):
         if self.state in self.ACTION_STATES:
             result["commands"] = commands
 
-        if self.state in self.ACTION_STATES or self.state == "gathered":
+        if self.state in self.ACTION_STATES and running_config:
+            # compute the result of the commands instead of gathering again
+            changed_config = apply_commands(
+                running_config, commands, TAG_NODES
+            )
+            changed_firewall_rules_facts = []
+            if changed_config:
+                changed_firewall_rules_facts = self.get_firewall_rules_facts(
+                    data=changed_config
+                )
+        elif self.state in self.ACTION_STATES or self.state == "gathered":
             changed_firewall_rules_facts = self.get_firewall_rules_facts()
         elif self.state == "rendered":
             result["rendered"] = commands
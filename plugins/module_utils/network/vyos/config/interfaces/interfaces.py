@@ -26,8 +26,11 @@ from ansible.module_utils.six import iteritems
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.facts import (
     Facts,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.interfaces.interfaces import (  # noqa: F401
+    InterfacesFacts,
+)
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.utils import (
-    search_obj_in_list,
+    ListIndex,
     get_interface_type,
     dict_delete,
 )
@@ -155,14 +158,16 @@ class Interfaces(ConfigBase):
                         self._state_deleted({"name": intf["name"]}, intf)
                     )
             else:
+                have_index = ListIndex(have)
                 for item in want:
-                    obj_in_have = search_obj_in_list(item["name"], have)
+                    obj_in_have = have_index.get(item["name"])
                     commands.extend(self._state_deleted(item, obj_in_have))
         else:
+            have_index = ListIndex(have)
             for item in want:
                 name = item["name"]
                 enable_state = item["enabled"]
-                obj_in_have = search_obj_in_list(name, have)
+                obj_in_have = have_index.get(name)
                 if not obj_in_have:
                     obj_in_have = {"name": name, "enabled": enable_state}
 
@@ -197,16 +202,18 @@ class Interfaces(ConfigBase):
                   to the desired configuration
         """
         commands = []
+        want_index = ListIndex(want)
+        have_index = ListIndex(have)
 
         for intf in have:
-            intf_in_want = search_obj_in_list(intf["name"], want)
+            intf_in_want = want_index.get(intf["name"])
             if not intf_in_want:
                 commands.extend(
                     self._state_deleted({"name": intf["name"]}, intf)
                 )
 
         for intf in want:
-            intf_in_have = search_obj_in_list(intf["name"], have)
+            intf_in_have = have_index.get(intf["name"])
             if not intf_in_have:
                 intf_in_have = {
                     "name": intf["name"],
@@ -241,10 +248,9 @@ class Interfaces(ConfigBase):
                 )
 
         if want_vifs:
+            have_vif_index = ListIndex(have_vifs, key="vlan_id")
             for want_vif in want_vifs:
-                have_vif = search_obj_in_list(
-                    want_vif["vlan_id"], have_vifs, key="vlan_id"
-                )
+                have_vif = have_vif_index.get(want_vif["vlan_id"])
                 if not have_vif:
                     have_vif = {
                         "vlan_id": want_vif["vlan_id"],
@@ -295,10 +301,9 @@ class Interfaces(ConfigBase):
             )
 
         if have_vifs:
+            want_vif_index = ListIndex(want_vifs, key="vlan_id")
             for have_vif in have_vifs:
-                want_vif = search_obj_in_list(
-                    have_vif["vlan_id"], want_vifs, key="vlan_id"
-                )
+                want_vif = want_vif_index.get(have_vif["vlan_id"])
                 if not want_vif:
                     want_vif = {
                         "vlan_id": have_vif["vlan_id"],
@@ -28,8 +28,11 @@ from ansible.module_utils.six import iteritems
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.facts import (
     Facts,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.l3_interfaces.l3_interfaces import (  # noqa: F401
+    L3_interfacesFacts,
+)
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.utils import (
-    search_obj_in_list,
+    ListIndex,
     get_interface_type,
     diff_list_of_dicts,
 )
@@ -165,13 +168,15 @@ class L3_interfaces(ConfigBase):
                         self._state_deleted({"name": intf["name"]}, intf)
                     )
             else:
+                have_index = ListIndex(have)
                 for item in want:
-                    obj_in_have = search_obj_in_list(item["name"], have)
+                    obj_in_have = have_index.get(item["name"])
                     commands.extend(self._state_deleted(item, obj_in_have))
         else:
+            have_index = ListIndex(have)
             for item in want:
                 name = item["name"]
-                obj_in_have = search_obj_in_list(name, have)
+                obj_in_have = have_index.get(name)
 
                 if not obj_in_have:
                     obj_in_have = {"name": item["name"]}
@@ -207,16 +212,18 @@ class L3_interfaces(ConfigBase):
                   to the desired configuration
         """
         commands = []
+        want_index = ListIndex(want)
+        have_index = ListIndex(have)
 
         for intf in have:
-            intf_in_want = search_obj_in_list(intf["name"], want)
+            intf_in_want = want_index.get(intf["name"])
             if not intf_in_want:
                 commands.extend(
                     self._state_deleted({"name": intf["name"]}, intf)
                 )
 
         for intf in want:
-            intf_in_have = search_obj_in_list(intf["name"], have)
+            intf_in_have = have_index.get(intf["name"])
             commands.extend(self._state_replaced(intf, intf_in_have))
 
         return commands
@@ -244,10 +251,9 @@ class L3_interfaces(ConfigBase):
                 )
 
         if want_vifs:
+            have_vif_index = ListIndex(have_vifs, key="vlan_id")
             for want_vif in want_vifs:
-                have_vif = search_obj_in_list(
-                    want_vif["vlan_id"], have_vifs, key="vlan_id"
-                )
+                have_vif = have_vif_index.get(want_vif["vlan_id"])
                 if not have_vif:
                     have_vif = {}
 
@@ -290,10 +296,9 @@ class L3_interfaces(ConfigBase):
                 )
 
         if have_vifs:
+            want_vif_index = ListIndex(want_vifs, key="vlan_id")
             for have_vif in have_vifs:
-                want_vif = search_obj_in_list(
-                    have_vif["vlan_id"], want_vifs, key="vlan_id"
-                )
+                want_vif = want_vif_index.get(have_vif["vlan_id"])
                 if not want_vif:
                     want_vif = {"vlan_id": have_vif["vlan_id"]}
 
@@ -17,13 +17,16 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.c
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.facts import (
     Facts,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.lag_interfaces.lag_interfaces import (  # noqa: F401
+    Lag_interfacesFacts,
+)
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     to_list,
     dict_diff,
 )
 from ansible.module_utils.six import iteritems
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.utils import (
-    search_obj_in_list,
+    ListIndex,
     get_lst_diff_for_dicts,
     list_diff_want_only,
     list_diff_have_only,
@@ -160,17 +163,19 @@ class Lag_interfaces(ConfigBase):
             commands.extend(self._state_overridden(want, have))
         elif self.state == "deleted":
             if want:
+                have_index = ListIndex(have)
                 for want_item in want:
                     name = want_item["name"]
-                    obj_in_have = search_obj_in_list(name, have)
+                    obj_in_have = have_index.get(name)
                     commands.extend(self._state_deleted(obj_in_have))
             else:
                 for have_item in have:
                     commands.extend(self._state_deleted(have_item))
         else:
+            have_index = ListIndex(have)
             for want_item in want:
                 name = want_item["name"]
-                obj_in_have = search_obj_in_list(name, have)
+                obj_in_have = have_index.get(name)
                 if self.state in ("merged", "rendered"):
                     commands.extend(self._state_merged(want_item, obj_in_have))
                 elif self.state == "replaced":
@@ -200,15 +205,17 @@ class Lag_interfaces(ConfigBase):
                   to the desired configuration
         """
         commands = []
+        want_index = ListIndex(want)
+        have_index = ListIndex(have)
         for have_item in have:
             lag_name = have_item["name"]
-            obj_in_want = search_obj_in_list(lag_name, want)
+            obj_in_want = want_index.get(lag_name)
             if not obj_in_want:
                 commands.extend(self._purge_attribs(have_item))
 
         for want_item in want:
             name = want_item["name"]
-            obj_in_have = search_obj_in_list(name, have)
+            obj_in_have = have_index.get(name)
             commands.extend(self._state_replaced(want_item, obj_in_have))
         return commands
 
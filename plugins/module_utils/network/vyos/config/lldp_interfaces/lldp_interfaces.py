@@ -21,14 +21,16 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.c
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.facts import (
     Facts,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.lldp_interfaces.lldp_interfaces import (  # noqa: F401
+    Lldp_interfacesFacts,
+)
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     to_list,
     dict_diff,
 )
 from ansible.module_utils.six import iteritems
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.utils import (
-    search_obj_in_list,
-    search_dict_tv_in_list,
+    ListIndex,
     key_value_in_dict,
     is_dict_element_present,
 )
@@ -157,9 +159,10 @@ class Lldp_interfaces(ConfigBase):
             commands.extend(self._state_overridden(want=want, have=have))
         elif self.state == "deleted":
             if want:
+                have_index = ListIndex(have)
                 for item in want:
                     name = item["name"]
-                    have_item = search_obj_in_list(name, have)
+                    have_item = have_index.get(name)
                     commands.extend(
                         self._state_deleted(want=None, have=have_item)
                     )
@@ -169,9 +172,10 @@ class Lldp_interfaces(ConfigBase):
                         self._state_deleted(want=None, have=have_item)
                     )
         else:
+            have_index = ListIndex(have)
             for want_item in want:
                 name = want_item["name"]
-                have_item = search_obj_in_list(name, have)
+                have_item = have_index.get(name)
                 if self.state in ("merged", "rendered"):
                     commands.extend(
                         self._state_merged(want=want_item, have=have_item)
@@ -203,9 +207,11 @@ class Lldp_interfaces(ConfigBase):
                   to the desired configuration
         """
         commands = []
+        want_index = ListIndex(want)
+        have_index = ListIndex(have)
         for have_item in have:
             lldp_name = have_item["name"]
-            lldp_in_want = search_obj_in_list(lldp_name, want)
+            lldp_in_want = want_index.get(lldp_name)
             if not lldp_in_want:
                 commands.append(
                     self._compute_command(have_item["name"], remove=True)
@@ -213,7 +219,7 @@ class Lldp_interfaces(ConfigBase):
 
         for want_item in want:
             name = want_item["name"]
-            lldp_in_have = search_obj_in_list(name, have)
+            lldp_in_have = have_index.get(name)
             commands.extend(self._state_replaced(want_item, lldp_in_have))
         return commands
 
@@ -411,12 +417,11 @@ class Lldp_interfaces(ConfigBase):
 
     def _add_civic_address(self, name, want, have):
         commands = []
+        have_index = ListIndex(have, key=("ca_type", "ca_value"))
         for item in want:
             ca_type = item["ca_type"]
             ca_value = item["ca_value"]
-            obj_in_have = search_dict_tv_in_list(
-                ca_type, ca_value, have, "ca_type", "ca_value"
-            )
+            obj_in_have = have_index.get((ca_type, ca_value))
             if not obj_in_have:
                 commands.append(
                     self._compute_command(
@@ -429,12 +434,11 @@ class Lldp_interfaces(ConfigBase):
 
     def _update_civic_address(self, name, want, have):
         commands = []
+        want_index = ListIndex(want, key=("ca_type", "ca_value"))
         for item in have:
             ca_type = item["ca_type"]
             ca_value = item["ca_value"]
-            in_want = search_dict_tv_in_list(
-                ca_type, ca_value, want, "ca_type", "ca_value"
-            )
+            in_want = want_index.get((ca_type, ca_value))
             if not in_want:
                 commands.append(
                     self._compute_command(
@@ -25,6 +25,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.facts import (
     Facts,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.ospfv2.ospfv2 import (  # noqa: F401
+    Ospfv2Facts,
+)
 from ansible.module_utils.six import iteritems
 
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.utils import (
@@ -26,6 +26,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.facts import (
     Facts,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.ospfv3.ospfv3 import (  # noqa: F401
+    Ospfv3Facts,
+)
 from ansible.module_utils.six import iteritems
 
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.utils import (
@@ -14,7 +14,6 @@ created
 from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
-from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.cfg.base import (
     ConfigBase,
 )
@@ -26,13 +25,33 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.facts import (
     Facts,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.static_routes.static_routes import (
+    Static_routesFacts,
+)
 from ansible.module_utils.six import iteritems
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.utils import (
+    ListIndex,
     get_route_type,
     get_lst_diff_for_dicts,
     get_lst_same_for_dicts,
     dict_delete,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.config_diff import (
+    apply_commands,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.config_tree import (
+    JsonConfigTree,
+    is_json,
+)
+
+TAG_NODES = (
+    "route",
+    "route6",
+    "next-hop",
+    "interface-route",
+    "interface-route6",
+    "next-hop-interface",
+)
 
 
 class Static_routes(ConfigBase):
@@ -46,6 +65,7 @@ class Static_routes(ConfigBase):
 
     def __init__(self, module):
         super(Static_routes, self).__init__(module)
+        self._route_types = {}
 
     def get_static_routes_facts(self, data=None):
         """Get the 'facts' (the current configuration)
@@ -73,8 +93,20 @@ class Static_routes(ConfigBase):
         warnings = list()
         commands = list()
 
+        running_config = None
         if self.state in self.ACTION_STATES:
-            existing_static_routes_facts = self.get_static_routes_facts()
+            if not self._module.params.get("verify_after", True):
+                running_config = Static_routesFacts(
+                    self._module
+                ).get_device_data(self._connection)
+                if is_json(running_config):
+                    # the commands are applied to the `set` lines
+                    running_config = "\n".join(
+                        JsonConfigTree(running_config).lines([])
+                    )
+            existing_static_routes_facts = self.get_static_routes_facts(
+                data=running_config
+            )
         else:
             existing_static_routes_facts = []
 
@@ -89,7 +121,17 @@ class Static_routes(ConfigBase):
         if self.state in self.ACTION_STATES:
             result["commands"] = commands
 
-        if self.state in self.ACTION_STATES or self.state == "gathered":
+        if self.state in self.ACTION_STATES and running_config:
+            # compute the result of the commands instead of gathering again
+            changed_config = apply_commands(
+                running_config, commands, TAG_NODES
+            )
+            changed_static_routes_facts = []
+            if changed_config:
+                changed_static_routes_facts = self.get_static_routes_facts(
+                    data=changed_config
+                )
+        elif self.state in self.ACTION_STATES or self.state == "gathered":
             changed_static_routes_facts = self.get_static_routes_facts()
         elif self.state == "rendered":
             result["rendered"] = commands
@@ -152,29 +194,16 @@ class Static_routes(ConfigBase):
         elif self.state == "deleted":
             commands.extend(self._state_deleted(want=want, have=have))
         elif want:
+            have_index = ListIndex(self._get_routes(have), key="dest")
             routes = self._get_routes(want)
             for r in routes:
-                h_item = self.search_route_in_have(have, r["dest"])
+                h_item = have_index.get(r["dest"])
                 if self.state in ("merged", "rendered"):
                     commands.extend(self._state_merged(want=r, have=h_item))
                 elif self.state == "replaced":
                     commands.extend(self._state_replaced(want=r, have=h_item))
         return commands
 
-    def search_route_in_have(self, have, want_dest):
-        """
-        This function  returns the route if its found in
-        have config.
-        :param have:
-        :param dest:
-        :return: the matched route
-        """
-        routes = self._get_routes(have)
-        for r in routes:
-            if r["dest"] == want_dest:
-                return r
-        return None
-
     def _state_replaced(self, want, have):
         """The command generator when state is replaced
 
@@ -203,14 +232,16 @@ class Static_routes(ConfigBase):
                   to the desired configuration
         """
         commands = []
-        routes = self._get_routes(have)
-        for r in routes:
-            route_in_want = self.search_route_in_have(want, r["dest"])
+        have_routes = self._get_routes(have)
+        want_routes = self._get_routes(want)
+        want_index = ListIndex(want_routes, key="dest")
+        have_index = ListIndex(have_routes, key="dest")
+        for r in have_routes:
+            route_in_want = want_index.get(r["dest"])
             if not route_in_want:
                 commands.append(self._compute_command(r["dest"], remove=True))
-        routes = self._get_routes(want)
-        for r in routes:
-            route_in_have = self.search_route_in_have(have, r["dest"])
+        for r in want_routes:
+            route_in_have = have_index.get(r["dest"])
             commands.extend(self._state_replaced(r, route_in_have))
         return commands
 
@@ -287,8 +318,8 @@ class Static_routes(ConfigBase):
         :return: list of commands
         """
         commands = []
-        want_copy = deepcopy(remove_empties(want))
-        have_copy = deepcopy(remove_empties(have))
+        want_copy = remove_empties(want)
+        have_copy = remove_empties(have)
 
         want_blackhole = want_copy.get(key) or {}
         have_blackhole = have_copy.get(key) or {}
@@ -324,8 +355,8 @@ class Static_routes(ConfigBase):
         :return: list of commands.
         """
         commands = []
-        want_copy = deepcopy(remove_empties(want))
-        have_copy = deepcopy(remove_empties(have))
+        want_copy = remove_empties(want)
+        have_copy = remove_empties(have)
         if not opr:
             diff_next_hops = get_lst_same_for_dicts(
                 want_copy, have_copy, "next_hops"
@@ -395,8 +426,8 @@ class Static_routes(ConfigBase):
         :return: list of commands
         """
         commands = []
-        want_copy = deepcopy(remove_empties(want))
-        have_copy = deepcopy(remove_empties(have))
+        want_copy = remove_empties(want)
+        have_copy = remove_empties(have)
 
         want_blackhole = want_copy.get(key) or {}
         have_blackhole = have_copy.get(key) or {}
@@ -435,8 +466,8 @@ class Static_routes(ConfigBase):
         """
         commands = []
 
-        want_copy = deepcopy(remove_empties(want))
-        have_copy = deepcopy(remove_empties(have))
+        want_copy = remove_empties(want)
+        have_copy = remove_empties(have)
 
         diff_next_hops = get_lst_diff_for_dicts(
             have_copy, want_copy, "next_hops"
@@ -582,7 +613,10 @@ class Static_routes(ConfigBase):
         :return:
         """
         if dest:
-            return get_route_type(dest)
+            route_type = self._route_types.get(dest)
+            if route_type is None:
+                route_type = self._route_types[dest] = get_route_type(dest)
+            return route_type
         elif afi == "ipv4":
             return "route"
         elif afi == "ipv6":
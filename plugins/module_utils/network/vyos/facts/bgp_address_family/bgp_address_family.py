@@ -24,6 +24,12 @@ from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.rm_template
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.argspec.bgp_address_family.bgp_address_family import (
     Bgp_address_familyArgs,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.profiler import (
+    get_timer,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.spec import (
+    validate_facts,
+)
 
 
 class Bgp_address_familyFacts(object):
@@ -52,8 +58,12 @@ class Bgp_address_familyFacts(object):
         objs = []
         config_lines = []
 
+        timer = get_timer(self)
         if not data:
+            timer.start("fetch")
             data = self.get_device_data(connection)
+        timer.data(data)
+        timer.start("parse")
 
         for resource in data.splitlines():
             if "address-family" in resource:
@@ -91,11 +101,13 @@ class Bgp_address_familyFacts(object):
             "bgp_address_family", None
         )
 
+        timer.start("validate")
         params = utils.remove_empties(
-            utils.validate_config(self.argument_spec, {"config": objs})
+            validate_facts(self.argument_spec, {"config": objs})
         )
 
         facts["bgp_address_family"] = params.get("config", [])
         ansible_facts["ansible_network_resources"].update(facts)
 
+        timer.stop()
         return ansible_facts
@@ -23,6 +23,12 @@ from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.rm_template
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.argspec.bgp_global.bgp_global import (
     Bgp_globalArgs,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.profiler import (
+    get_timer,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.spec import (
+    validate_facts,
+)
 import re
 
 
@@ -52,8 +58,12 @@ class Bgp_globalFacts(object):
         objs = {}
         config_lines = []
 
+        timer = get_timer(self)
         if not data:
+            timer.start("fetch")
             data = self.get_device_data(connection)
+        timer.data(data)
+        timer.start("parse")
 
         for resource in data.splitlines():
             if "address-family" not in resource:
@@ -80,13 +90,18 @@ class Bgp_globalFacts(object):
 
         ansible_facts["ansible_network_resources"].pop("bgp_global", None)
 
+        timer.start("validate")
         params = utils.remove_empties(
-            bgp_global_parser.validate_config(
-                self.argument_spec, {"config": objs}, redact=True
+            validate_facts(
+                self.argument_spec,
+                {"config": objs},
+                module=self._module,
+                redact=True,
             )
         )
 
         facts["bgp_global"] = params.get("config", [])
         ansible_facts["ansible_network_resources"].update(facts)
 
+        timer.stop()
         return ansible_facts
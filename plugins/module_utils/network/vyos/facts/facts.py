@@ -10,78 +10,77 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from collections import OrderedDict
+from importlib import import_module
+
+from ansible.module_utils.common._collections_compat import Mapping
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.facts.facts import (
     FactsBase,
 )
-from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.interfaces.interfaces import (
-    InterfacesFacts,
-)
-from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.l3_interfaces.l3_interfaces import (
-    L3_interfacesFacts,
-)
-from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.lag_interfaces.lag_interfaces import (
-    Lag_interfacesFacts,
-)
-from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.lldp_global.lldp_global import (
-    Lldp_globalFacts,
-)
-from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.lldp_interfaces.lldp_interfaces import (
-    Lldp_interfacesFacts,
-)
-from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.firewall_rules.firewall_rules import (
-    Firewall_rulesFacts,
-)
-from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.static_routes.static_routes import (
-    Static_routesFacts,
-)
-from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.firewall_global.firewall_global import (
-    Firewall_globalFacts,
-)
-from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.firewall_interfaces.firewall_interfaces import (
-    Firewall_interfacesFacts,
-)
-from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.ospfv3.ospfv3 import (
-    Ospfv3Facts,
-)
-from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.ospfv2.ospfv2 import (
-    Ospfv2Facts,
-)
-from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.ospf_interfaces.ospf_interfaces import (
-    Ospf_interfacesFacts,
-)
-from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.bgp_global.bgp_global import (
-    Bgp_globalFacts,
-)
-from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.bgp_address_family.bgp_address_family import (
-    Bgp_address_familyFacts,
-)
-from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.route_maps.route_maps import (
-    Route_mapsFacts,
-)
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.legacy.base import (
     Default,
     Neighbors,
     Config,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.profiler import (
+    FactsProfiler,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.spec import (
+    collect_no_log_values,
+)
+
+FACTS_PACKAGE = (
+    "ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts"
+)
+
+
+class ResourceFactsRegistry(Mapping):
+    """
+    The resource fact classes by resource name
+    A fact class is imported the first time it is looked up, so that a
+    module only loads the fact classes of the resources it gathers. The
+    payload of a module is built from its import statements, so the
+    resource config classes and the vyos_facts module import the fact
+    classes they gather (flagged ``noqa: F401``) for them to be shipped
+    with the module.
+    """
+
+    def __init__(self, **paths):
+        self._paths = OrderedDict(sorted(paths.items()))
+        self._classes = {}
+
+    def __getitem__(self, resource):
+        facts_cls = self._classes.get(resource)
+        if facts_cls is None:
+            module_name, cls_name = self._paths[resource].rsplit(".", 1)
+            module = import_module("%s.%s" % (FACTS_PACKAGE, module_name))
+            facts_cls = self._classes[resource] = getattr(module, cls_name)
+        return facts_cls
+
+    def __iter__(self):
+        return iter(self._paths)
+
+    def __len__(self):
+        return len(self._paths)
 
 
 FACT_LEGACY_SUBSETS = dict(default=Default, neighbors=Neighbors, config=Config)
-FACT_RESOURCE_SUBSETS = dict(
-    interfaces=InterfacesFacts,
-    l3_interfaces=L3_interfacesFacts,
-    lag_interfaces=Lag_interfacesFacts,
-    lldp_global=Lldp_globalFacts,
-    lldp_interfaces=Lldp_interfacesFacts,
-    static_routes=Static_routesFacts,
-    firewall_rules=Firewall_rulesFacts,
-    firewall_global=Firewall_globalFacts,
-    firewall_interfaces=Firewall_interfacesFacts,
-    ospfv3=Ospfv3Facts,
-    ospfv2=Ospfv2Facts,
-    ospf_interfaces=Ospf_interfacesFacts,
-    bgp_global=Bgp_globalFacts,
-    bgp_address_family=Bgp_address_familyFacts,
-    route_maps=Route_mapsFacts,
+FACT_RESOURCE_SUBSETS = ResourceFactsRegistry(
+    interfaces="interfaces.interfaces.InterfacesFacts",
+    l3_interfaces="l3_interfaces.l3_interfaces.L3_interfacesFacts",
+    lag_interfaces="lag_interfaces.lag_interfaces.Lag_interfacesFacts",
+    lldp_global="lldp_global.lldp_global.Lldp_globalFacts",
+    lldp_interfaces="lldp_interfaces.lldp_interfaces.Lldp_interfacesFacts",
+    static_routes="static_routes.static_routes.Static_routesFacts",
+    firewall_rules="firewall_rules.firewall_rules.Firewall_rulesFacts",
+    firewall_global="firewall_global.firewall_global.Firewall_globalFacts",
+    firewall_interfaces="firewall_interfaces.firewall_interfaces.Firewall_interfacesFacts",
+    ospfv3="ospfv3.ospfv3.Ospfv3Facts",
+    ospfv2="ospfv2.ospfv2.Ospfv2Facts",
+    ospf_interfaces="ospf_interfaces.ospf_interfaces.Ospf_interfacesFacts",
+    bgp_global="bgp_global.bgp_global.Bgp_globalFacts",
+    bgp_address_family="bgp_address_family.bgp_address_family.Bgp_address_familyFacts",
+    route_maps="route_maps.route_maps.Route_mapsFacts",
 )
 
 
@@ -93,6 +92,9 @@ class Facts(FactsBase):
 
     def __init__(self, module):
         super(Facts, self).__init__(module)
+        self.profiler = None
+        if module.params.get("timing"):
+            self.profiler = FactsProfiler()
 
     def get_facts(
         self, legacy_facts_type=None, resource_facts_type=None, data=None
@@ -104,12 +106,102 @@ class Facts(FactsBase):
         :rtype: dict
         :return: the facts gathered
         """
+        profiler = self.profiler
+        if profiler:
+            start = profiler.clock()
         if self.VALID_RESOURCE_SUBSETS:
+            resource_subsets = FACT_RESOURCE_SUBSETS
+            if profiler:
+                resource_subsets = dict(
+                    (key, profiler.profile(key, resource_subsets))
+                    for key in resource_subsets
+                )
             self.get_network_resources_facts(
-                FACT_RESOURCE_SUBSETS, resource_facts_type, data
+                resource_subsets, resource_facts_type, data
             )
         if self.VALID_LEGACY_GATHER_SUBSETS:
+            if profiler:
+                legacy_start = profiler.clock()
             self.get_network_legacy_facts(
                 FACT_LEGACY_SUBSETS, legacy_facts_type
             )
+            if profiler:
+                profiler.legacy = profiler.clock() - legacy_start
+        if profiler:
+            profiler.total = profiler.clock() - start
         return self.ansible_facts, self._warnings
+
+    def get_network_resources_facts(
+        self, facts_resource_obj_map, resource_facts_type=None, data=None
+    ):
+        """Gather the network resource facts, the facts stored in the facts
+        cache of the connection for the latest commit are reused and only
+        the other resources are gathered from the device. The facts holding
+        no_log values are not stored, they are gathered on every run
+        :param facts_resource_obj_map: resource name to fact class map
+        :param resource_facts_type: List of resource fact types
+        :param data: previously collected conf
+        """
+        if not resource_facts_type:
+            resource_facts_type = self._gather_network_resources
+        runable_subsets = self.gen_runable(
+            resource_facts_type,
+            frozenset(facts_resource_obj_map.keys()),
+            resource_facts=True,
+        )
+        # connections without a facts cache, such as the local one, gather
+        # every resource
+        get_facts_cache = getattr(self._connection, "get_facts_cache", None)
+        cache = None
+        if runable_subsets and data is None and get_facts_cache:
+            cache = get_facts_cache()
+        if not cache:
+            return super(Facts, self).get_network_resources_facts(
+                facts_resource_obj_map, resource_facts_type, data
+            )
+
+        cached = cache["resources"]
+        missing = [key for key in runable_subsets if key not in cached]
+        resources = self.ansible_facts["ansible_network_resources"]
+        if missing:
+            super(Facts, self).get_network_resources_facts(
+                facts_resource_obj_map, missing
+            )
+            stored = {}
+            for key in missing:
+                facts = resources.get(key)
+                if not self._list_no_log_values(key, facts):
+                    stored[key] = facts
+            self._connection.set_facts_cache(cache["commit"], stored)
+        for key in runable_subsets:
+            # the resources without facts are stored as None
+            if key not in missing and cached[key] is not None:
+                resources[key] = cached[key]
+                self._module.no_log_values.update(
+                    self._list_no_log_values(key, cached[key])
+                )
+        self.ansible_facts["ansible_net_gather_network_resources"] = list(
+            runable_subsets
+        )
+        if self.profiler:
+            self.profiler.cached = sorted(set(runable_subsets) - set(missing))
+
+    def _list_no_log_values(self, resource, facts):
+        no_log_values = set()
+        if facts:
+            argument_spec = FACT_RESOURCE_SUBSETS[resource](
+                self._module
+            ).argument_spec
+            collect_no_log_values(
+                argument_spec, {"config": facts}, no_log_values
+            )
+        return no_log_values
+
+    def get_timing(self):
+        """Return the timing report of the fact gathering
+        :rtype: dict
+        :return: the timings when the gathering is profiled, None otherwise
+        """
+        if self.profiler:
+            return self.profiler.report()
+        return None
@@ -13,7 +13,6 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-from copy import deepcopy
 from re import findall, search, M
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
@@ -21,6 +20,13 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.argspec.firewall_global.firewall_global import (
     Firewall_globalArgs,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.profiler import (
+    get_timer,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.spec import (
+    get_generated_spec,
+    validate_facts,
+)
 
 
 class Firewall_globalFacts(object):
@@ -29,16 +35,9 @@ class Firewall_globalFacts(object):
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = Firewall_globalArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_generated_spec(
+            self.argument_spec, subspec, options
+        )
 
     def get_device_data(self, connection):
         return connection.get_config()
@@ -51,19 +50,25 @@ class Firewall_globalFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        timer = get_timer(self)
         if not data:
+            timer.start("fetch")
             # typically data is populated from the current device configuration
             # data = connection.get('show running-config | section ^interface')
             # using mock data instead
             data = self.get_device_data(connection)
+        timer.data(data)
+        timer.start("parse")
         objs = {}
         firewalls = findall(r"^set firewall .*$", data, M)
         if firewalls:
             objs = self.render_config(firewalls)
         facts = {}
-        params = utils.validate_config(self.argument_spec, {"config": objs})
+        timer.start("validate")
+        params = validate_facts(self.argument_spec, {"config": objs})
         facts["firewall_global"] = utils.remove_empties(params["config"])
         ansible_facts["ansible_network_resources"].update(facts)
+        timer.stop()
         return ansible_facts
 
     def render_config(self, conf):
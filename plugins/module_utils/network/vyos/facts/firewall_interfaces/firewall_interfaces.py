@@ -14,13 +14,22 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from re import findall, search, M
-from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.argspec.firewall_interfaces.firewall_interfaces import (
     Firewall_interfacesArgs,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.interface_model import (
+    get_interface_model,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.profiler import (
+    get_timer,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.spec import (
+    get_generated_spec,
+    validate_facts,
+)
 
 
 class Firewall_interfacesFacts(object):
@@ -29,16 +38,9 @@ class Firewall_interfacesFacts(object):
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = Firewall_interfacesArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_generated_spec(
+            self.argument_spec, subspec, options
+        )
 
     def get_device_data(self, connection):
         return connection.get_config()
@@ -51,47 +53,44 @@ class Firewall_interfacesFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        timer = get_timer(self)
         if not data:
+            timer.start("fetch")
             # typically data is populated from the current device configuration
             # data = connection.get('show running-config | section ^interface')
             # using mock data instead
             data = self.get_device_data(connection)
-        objs = []
-        interfaces = findall(
-            r"^set interfaces ethernet (?:\'*)(\S+)(?:\'*)", data, M
-        )
-        if interfaces:
-            objs = self.get_names(data, interfaces)
+        timer.data(data)
+        timer.start("parse")
+        objs = self.get_names(get_interface_model(data))
         ansible_facts["ansible_network_resources"].pop(
             "firewall_interfaces", None
         )
         facts = {}
         if objs:
             facts["firewall_interfaces"] = []
-            params = utils.validate_config(
-                self.argument_spec, {"config": objs}
-            )
+            timer.start("validate")
+            params = validate_facts(self.argument_spec, {"config": objs})
             for cfg in params["config"]:
                 facts["firewall_interfaces"].append(utils.remove_empties(cfg))
 
         ansible_facts["ansible_network_resources"].update(facts)
+        timer.stop()
         return ansible_facts
 
-    def get_names(self, data, interfaces):
+    def get_names(self, model):
         """
         This function performs following:
-        - Form regex to fetch 'interface name' from  interfaces firewall data.
+        - Fetch the ethernet interfaces from the interface model.
         - Form the name list.
-        :param data: configuration.
-        :param rules: list of interfaces.
+        :param model: interface model of the configuration.
         :return: generated firewall interfaces configuration.
         """
         names = []
-        for r in set(interfaces):
-            int_regex = r" %s .+$" % r.strip("'")
-            cfg = findall(int_regex, data, M)
+        for intf in model.iter_interfaces(("ethernet",)):
+            cfg = [" %s %s" % (intf.name, conf) for conf in intf.config]
             fi = self.render_config(cfg)
-            fi["name"] = r.strip("'")
+            fi["name"] = intf.name
             names.append(fi)
         if names:
             names = sorted(names, key=lambda i: i["name"])
@@ -13,14 +13,29 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import re
 from re import findall, search, M
-from copy import deepcopy
+from collections import OrderedDict
+
+from ansible.module_utils.six import iteritems
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.argspec.firewall_rules.firewall_rules import (
     Firewall_rulesArgs,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.profiler import (
+    get_timer,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.spec import (
+    get_generated_spec,
+    validate_facts,
+)
+
+RULE_SET_REGEX = re.compile(
+    r"set firewall (name|ipv6-name) (?:\'*)(\S+)(?:\'*)(?: (.*))?$"
+)
+RULE_REGEX = re.compile(r"rule (?:\'*)(\d+)(?:\'*)(?: (.+))?$")
 
 
 class Firewall_rulesFacts(object):
@@ -29,16 +44,9 @@ class Firewall_rulesFacts(object):
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = Firewall_rulesArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_generated_spec(
+            self.argument_spec, subspec, options
+        )
 
     def get_device_data(self, connection):
         return connection.get_config()
@@ -51,67 +59,85 @@ class Firewall_rulesFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        timer = get_timer(self)
         if not data:
+            timer.start("fetch")
             # typically data is populated from the current device configuration
             # data = connection.get('show running-config | section ^interface')
             # using mock data instead
             data = self.get_device_data(connection)
+        timer.data(data)
+        timer.start("parse")
         # split the config into instances of the resource
         objs = []
-        v6_rules = findall(
-            r"^set firewall ipv6-name (?:\'*)(\S+)(?:\'*)", data, M
-        )
-        v4_rules = findall(r"^set firewall name (?:\'*)(\S+)(?:\'*)", data, M)
-        if v6_rules:
-            config = self.get_rules(data, v6_rules, type="ipv6")
-            if config:
-                config = utils.remove_empties(config)
-                objs.append(config)
-        if v4_rules:
-            config = self.get_rules(data, v4_rules, type="ipv4")
-            if config:
-                config = utils.remove_empties(config)
-                objs.append(config)
+        rule_sets = self.get_rule_sets(data)
+        for afi in ("ipv6", "ipv4"):
+            if rule_sets[afi]:
+                config = self.get_rules(rule_sets[afi], type=afi)
+                objs.append(utils.remove_empties(config))
 
         ansible_facts["ansible_network_resources"].pop("firewall_rules", None)
         facts = {}
         if objs:
             facts["firewall_rules"] = []
-            params = utils.validate_config(
-                self.argument_spec, {"config": objs}
-            )
+            timer.start("validate")
+            params = validate_facts(self.argument_spec, {"config": objs})
             for cfg in params["config"]:
                 facts["firewall_rules"].append(utils.remove_empties(cfg))
 
         ansible_facts["ansible_network_resources"].update(facts)
+        timer.stop()
         return ansible_facts
 
-    def get_rules(self, data, rules, type):
+    def get_rule_sets(self, data):
         """
         This function performs following:
-        - Form regex to fetch 'rule-sets' specific config from data.
-        - Form the rule-set list based on ip address.
+        - Bucket the firewall lines by ip address type, rule-set and rule
+          number in a single pass over the configuration.
+        - Keep the rule-set lines as ' <name> <attribute>' and the rule
+          lines as ' <number> <attribute>'.
         :param data: configuration.
-        :param rules: list of rule-sets.
+        :return: rule-set name -> (rule-set lines, rule number -> rule lines)
+                 for every ip address type.
+        """
+        rule_sets = {"ipv4": OrderedDict(), "ipv6": OrderedDict()}
+        for line in data.splitlines():
+            match = RULE_SET_REGEX.match(line)
+            if not match:
+                continue
+            name = match.group(2).strip("'")
+            afi = "ipv6" if match.group(1) == "ipv6-name" else "ipv4"
+            rule_set = rule_sets[afi].get(name)
+            if rule_set is None:
+                rule_set = rule_sets[afi][name] = ([], OrderedDict())
+            attrib = match.group(3)
+            if not attrib:
+                continue
+            rule = RULE_REGEX.match(attrib)
+            if rule:
+                r_lines = rule_set[1].setdefault(rule.group(1), [])
+                if rule.group(2):
+                    r_lines.append(" %s %s" % (rule.group(1), rule.group(2)))
+            else:
+                rule_set[0].append(" %s %s" % (name, attrib))
+        return rule_sets
+
+    def get_rules(self, rule_sets, type):
+        """
+        This function performs following:
+        - Parse the config of every rule-set and of every rule once.
+        - Form the rule-set list based on ip address.
+        :param rule_sets: rule-set name -> (rule-set lines, rule lines).
         :param type: ip address type.
         :return: generated rule-sets configuration.
         """
-        r_v4 = []
-        r_v6 = []
-        for r in set(rules):
-            rule_regex = r" %s .+$" % r.strip("'")
-            cfg = findall(rule_regex, data, M)
-            fr = self.render_config(cfg, r.strip("'"))
-            fr["name"] = r.strip("'")
-            if type == "ipv6":
-                r_v6.append(fr)
-            else:
-                r_v4.append(fr)
-        if r_v4:
-            config = {"afi": "ipv4", "rule_sets": r_v4}
-        if r_v6:
-            config = {"afi": "ipv6", "rule_sets": r_v6}
-        return config
+        r_lst = []
+        for name, (conf, rules) in iteritems(rule_sets):
+            fr = self.render_config(conf, re.escape(name))
+            fr["rules"] = self.parse_rules_lst(rules)
+            fr["name"] = name
+            r_lst.append(fr)
+        return {"afi": type, "rule_sets": r_lst}
 
     def render_config(self, conf, match):
         """
@@ -128,24 +154,19 @@ class Firewall_rulesFacts(object):
         config = self.parse_attr(conf, a_lst, match)
         if not config:
             config = {}
-        config["rules"] = self.parse_rules_lst(conf)
         return config
 
-    def parse_rules_lst(self, conf):
+    def parse_rules_lst(self, rules):
         """
-        This function forms the regex to fetch the 'rules' with in
-        'rule-sets'
-        :param conf: configuration data.
+        This function parses the 'rules' with in 'rule-sets'
+        :param rules: rule number -> rule configuration lines.
         :return: generated rule list configuration.
         """
         r_lst = []
-        rules = findall(r"rule (?:\'*)(\d+)(?:\'*)", conf, M)
         if rules:
             rules_lst = []
-            for r in set(rules):
-                r_regex = r" %s .+$" % r
-                cfg = "\n".join(findall(r_regex, conf, M))
-                obj = self.parse_rules(cfg)
+            for r, cfg in iteritems(rules):
+                obj = self.parse_rules("\n".join(cfg))
                 obj["number"] = int(r)
                 if obj:
                     rules_lst.append(obj)
@@ -332,7 +353,7 @@ class Firewall_rulesFacts(object):
                             config[attrib] = False
                         else:
                             config[attrib] = True
-                else:
+                elif attrib.replace("_", "-") in conf:
                     out = search(r"^.*" + regex + " (.+)", conf, M)
                     if out:
                         val = out.group(1).strip("'")
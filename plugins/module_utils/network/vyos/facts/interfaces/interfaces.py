@@ -15,14 +15,33 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 
-from re import findall, M
-from copy import deepcopy
+from ansible.module_utils.six import iteritems
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.argspec.interfaces.interfaces import (
     InterfacesArgs,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.interface_model import (
+    get_interface_model,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.profiler import (
+    get_timer,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.spec import (
+    get_generated_spec,
+    validate_facts,
+)
+
+INTERFACE_TYPES = (
+    "ethernet",
+    "bonding",
+    "vti",
+    "loopback",
+    "vxlan",
+    "openvpn",
+    "wireguard",
+)
 
 
 class InterfacesFacts(object):
@@ -31,16 +50,9 @@ class InterfacesFacts(object):
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = InterfacesArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_generated_spec(
+            self.argument_spec, subspec, options
+        )
 
     def get_device_data(self, connection):
 
@@ -55,63 +67,61 @@ class InterfacesFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        timer = get_timer(self)
         if not data:
+            timer.start("fetch")
             data = self.get_device_data(connection)
+        timer.data(data)
+        timer.start("parse")
 
         objs = []
-        interface_names = findall(
-            r"^set interfaces (?:ethernet|bonding|vti|loopback|vxlan|openvpn|wireguard) (?:\'*)(\S+)(?:\'*)",
-            data,
-            M,
-        )
-        if interface_names:
-            for interface in set(interface_names):
-                intf_regex = r" %s .+$" % interface.strip("'")
-                cfg = findall(intf_regex, data, M)
-                obj = self.render_config(cfg)
-                obj["name"] = interface.strip("'")
-                if obj:
-                    objs.append(obj)
+        model = get_interface_model(data)
+        for intf in model.iter_interfaces(INTERFACE_TYPES):
+            obj = self.render_config(intf)
+            obj["name"] = intf.name
+            if obj:
+                objs.append(obj)
         facts = {}
         if objs:
             facts["interfaces"] = []
-            params = utils.validate_config(
-                self.argument_spec, {"config": objs}
-            )
+            timer.start("validate")
+            params = validate_facts(self.argument_spec, {"config": objs})
             for cfg in params["config"]:
                 facts["interfaces"].append(utils.remove_empties(cfg))
 
         ansible_facts["ansible_network_resources"].update(facts)
+        timer.stop()
         return ansible_facts
 
-    def render_config(self, conf):
+    def render_config(self, intf):
         """
         Render config as dictionary structure and delete keys
           from spec for null values
 
         :param spec: The facts tree, generated from the argspec
-        :param conf: The configuration
+        :param intf: The interface of the interface model
         :rtype: dictionary
         :returns: The generated config
         """
-        vif_conf = "\n".join(filter(lambda x: ("vif" in x), conf))
-        eth_conf = "\n".join(filter(lambda x: ("vif" not in x), conf))
+        eth_conf = "\n".join(
+            " %s %s" % (intf.name, conf)
+            for conf in intf.config
+            if "vif" not in conf
+        )
         config = self.parse_attribs(
             ["description", "speed", "mtu", "duplex"], eth_conf
         )
-        config["vifs"] = self.parse_vifs(vif_conf)
+        config["vifs"] = self.parse_vifs(intf.vifs)
 
         return utils.remove_empties(config)
 
-    def parse_vifs(self, conf):
-        vif_names = findall(r"vif (?:\'*)(\d+)(?:\'*)", conf, M)
+    def parse_vifs(self, vifs):
         vifs_list = None
 
-        if vif_names:
+        if vifs:
             vifs_list = []
-            for vif in set(vif_names):
-                vif_regex = r" %s .+$" % vif
-                cfg = "\n".join(findall(vif_regex, conf, M))
+            for vif, conf in iteritems(vifs):
+                cfg = "\n".join(" %s %s" % (vif, line) for line in conf)
                 obj = self.parse_attribs(["description", "mtu"], cfg)
                 obj["vlan_id"] = int(vif)
                 if obj:
@@ -16,7 +16,6 @@ __metaclass__ = type
 
 
 import re
-from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
@@ -27,6 +26,18 @@ from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.utils
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.argspec.l3_interfaces.l3_interfaces import (
     L3_interfacesArgs,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.interface_model import (
+    get_interface_model,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.profiler import (
+    get_timer,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.spec import (
+    get_generated_spec,
+    validate_facts,
+)
+
+INTERFACE_TYPES = ("ethernet", "bonding", "vti", "vxlan")
 
 
 class L3_interfacesFacts(object):
@@ -35,16 +46,9 @@ class L3_interfacesFacts(object):
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = L3_interfacesArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_generated_spec(
+            self.argument_spec, subspec, options
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """Populate the facts for l3_interfaces
@@ -54,61 +58,59 @@ class L3_interfacesFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        timer = get_timer(self)
         if not data:
+            timer.start("fetch")
             data = connection.get_config()
+        timer.data(data)
+        timer.start("parse")
 
         # operate on a collection of resource x
         objs = []
-        interface_names = re.findall(
-            r"set interfaces (?:ethernet|bonding|vti|vxlan) (?:\'*)(\S+)(?:\'*)",
-            data,
-            re.M,
-        )
-        if interface_names:
-            for interface in set(interface_names):
-                intf_regex = r" %s .+$" % interface
-                cfg = re.findall(intf_regex, data, re.M)
-                obj = self.render_config(cfg)
-                obj["name"] = interface.strip("'")
-                if obj:
-                    objs.append(obj)
+        model = get_interface_model(data)
+        for intf in model.iter_interfaces(INTERFACE_TYPES):
+            obj = self.render_config(intf)
+            obj["name"] = intf.name
+            if obj:
+                objs.append(obj)
 
         ansible_facts["ansible_network_resources"].pop("l3_interfaces", None)
         facts = {}
         if objs:
             facts["l3_interfaces"] = []
-            params = utils.validate_config(
-                self.argument_spec, {"config": objs}
-            )
+            timer.start("validate")
+            params = validate_facts(self.argument_spec, {"config": objs})
             for cfg in params["config"]:
                 facts["l3_interfaces"].append(utils.remove_empties(cfg))
 
         ansible_facts["ansible_network_resources"].update(facts)
+        timer.stop()
         return ansible_facts
 
-    def render_config(self, conf):
+    def render_config(self, intf):
         """
         Render config as dictionary structure and delete keys from spec for null values
         :param spec: The facts tree, generated from the argspec
-        :param conf: The configuration
+        :param intf: The interface of the interface model
         :rtype: dictionary
         :returns: The generated config
         """
-        vif_conf = "\n".join(filter(lambda x: ("vif" in x), conf))
-        eth_conf = "\n".join(filter(lambda x: ("vif" not in x), conf))
+        eth_conf = "\n".join(
+            " %s %s" % (intf.name, conf)
+            for conf in intf.config
+            if "vif" not in conf
+        )
         config = self.parse_attribs(eth_conf)
-        config["vifs"] = self.parse_vifs(vif_conf)
+        config["vifs"] = self.parse_vifs(intf.vifs)
 
         return utils.remove_empties(config)
 
-    def parse_vifs(self, conf):
-        vif_names = re.findall(r"vif (\d+)", conf, re.M)
+    def parse_vifs(self, vifs):
         vifs_list = None
-        if vif_names:
+        if vifs:
             vifs_list = []
-            for vif in set(vif_names):
-                vif_regex = r" %s .+$" % vif
-                cfg = "\n".join(re.findall(vif_regex, conf, re.M))
+            for vif, conf in iteritems(vifs):
+                cfg = "\n".join(" %s %s" % (vif, line) for line in conf)
                 obj = self.parse_attribs(cfg)
                 obj["vlan_id"] = vif
                 if obj:
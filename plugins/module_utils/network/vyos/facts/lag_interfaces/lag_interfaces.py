@@ -14,7 +14,6 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from re import findall, search, M
-from copy import deepcopy
 
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
@@ -22,6 +21,16 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.argspec.lag_interfaces.lag_interfaces import (
     Lag_interfacesArgs,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.interface_model import (
+    get_interface_model,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.profiler import (
+    get_timer,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.spec import (
+    get_generated_spec,
+    validate_facts,
+)
 
 
 class Lag_interfacesFacts(object):
@@ -30,16 +39,9 @@ class Lag_interfacesFacts(object):
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = Lag_interfacesArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_generated_spec(
+            self.argument_spec, subspec, options
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """Populate the facts for lag_interfaces
@@ -49,43 +51,50 @@ class Lag_interfacesFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        timer = get_timer(self)
         if not data:
+            timer.start("fetch")
             data = connection.get_config()
+        timer.data(data)
+        timer.start("parse")
 
         objs = []
-        lag_names = findall(r"^set interfaces bonding (\S+)", data, M)
-        if lag_names:
-            for lag in set(lag_names):
-                lag_regex = r" %s .+$" % lag
-                cfg = findall(lag_regex, data, M)
-                obj = self.render_config(cfg)
-                members = []
-                member = {}
-
-                group_regex = r".*eth.* '%s'" % lag
-                g_cfg = findall(group_regex, data, M)
-                for item in g_cfg:
-                    output = search("^set interfaces ethernet (\\S+)", item, M)
-                    if output:
-                        member["member"] = output.group(1).strip("'")
-                        members.append(member)
-                obj["name"] = lag.strip("'")
-                if members:
-                    obj["members"] = members
-                if obj:
-                    objs.append(obj)
+        model = get_interface_model(data)
+        members = self.get_members(model)
+        for lag in model.iter_interfaces(("bonding",)):
+            cfg = [" %s %s" % (lag.name, conf) for conf in lag.config]
+            obj = self.render_config(cfg)
+            obj["name"] = lag.name
+            if lag.name in members:
+                obj["members"] = members[lag.name]
+            if obj:
+                objs.append(obj)
         facts = {}
         if objs:
             facts["lag_interfaces"] = []
-            params = utils.validate_config(
-                self.argument_spec, {"config": objs}
-            )
+            timer.start("validate")
+            params = validate_facts(self.argument_spec, {"config": objs})
             for cfg in params["config"]:
                 facts["lag_interfaces"].append(utils.remove_empties(cfg))
 
         ansible_facts["ansible_network_resources"].update(facts)
+        timer.stop()
         return ansible_facts
 
+    def get_members(self, model):
+        """
+        This function returns the ethernet interfaces of every bond group
+        :param model: interface model of the configuration.
+        :return: bond group name -> list of members.
+        """
+        members = {}
+        for intf in model.iter_interfaces(("ethernet",)):
+            for conf in intf.config:
+                if conf.startswith("bond-group "):
+                    group = conf.partition(" ")[2].strip("'")
+                    members.setdefault(group, []).append({"member": intf.name})
+        return members
+
     def render_config(self, conf):
         """
         Render config as dictionary structure and delete keys
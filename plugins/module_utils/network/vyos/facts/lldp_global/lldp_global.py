@@ -14,7 +14,6 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from re import findall, M
-from copy import deepcopy
 
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
@@ -22,6 +21,17 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.argspec.lldp_global.lldp_global import (
     Lldp_globalArgs,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.config_tree import (
+    get_config_tree,
+    get_device_config,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.profiler import (
+    get_timer,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.spec import (
+    get_generated_spec,
+    validate_facts,
+)
 
 
 class Lldp_globalFacts(object):
@@ -30,16 +40,9 @@ class Lldp_globalFacts(object):
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = Lldp_globalArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_generated_spec(
+            self.argument_spec, subspec, options
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """Populate the facts for lldp_global
@@ -49,30 +52,34 @@ class Lldp_globalFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        timer = get_timer(self)
         if not data:
-            data = connection.get_config()
+            timer.start("fetch")
+            data = get_device_config(connection)
+        timer.data(data)
+        timer.start("parse")
 
         objs = {}
-        lldp_output = findall(r"^set service lldp (\S+)", data, M)
-        if lldp_output:
-            for item in set(lldp_output):
-                lldp_regex = r" %s .+$" % item
-                cfg = findall(lldp_regex, data, M)
-                obj = self.render_config(cfg)
-                if obj:
-                    objs.update(obj)
-        lldp_service = findall(r"^set service (lldp)?('lldp')", data, M)
-        if lldp_service or lldp_output:
+        tree = get_config_tree(data)
+        lldp_output = tree.children(["service", "lldp"])
+        for item in lldp_output:
+            cfg = tree.lines(["service", "lldp", item])
+            obj = self.render_config(cfg)
+            if obj:
+                objs.update(obj)
+        if tree.exists(["service", "lldp"]):
             lldp_obj = {}
             lldp_obj["enable"] = True
             objs.update(lldp_obj)
 
         facts = {}
-        params = utils.validate_config(self.argument_spec, {"config": objs})
+        timer.start("validate")
+        params = validate_facts(self.argument_spec, {"config": objs})
         facts["lldp_global"] = utils.remove_empties(params["config"])
 
         ansible_facts["ansible_network_resources"].update(facts)
 
+        timer.stop()
         return ansible_facts
 
     def render_config(self, conf):
@@ -16,7 +16,6 @@ __metaclass__ = type
 
 
 from re import findall, search, M
-from copy import deepcopy
 
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
@@ -24,6 +23,16 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.argspec.lldp_interfaces.lldp_interfaces import (
     Lldp_interfacesArgs,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.config_tree import (
+    get_config_tree,
+    get_device_config,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.profiler import (
+    get_timer,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.spec import (
+    get_generated_spec,
+)
 
 
 class Lldp_interfacesFacts(object):
@@ -32,16 +41,9 @@ class Lldp_interfacesFacts(object):
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = Lldp_interfacesArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_generated_spec(
+            self.argument_spec, subspec, options
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """Populate the facts for lldp_interfaces
@@ -51,25 +53,29 @@ class Lldp_interfacesFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        timer = get_timer(self)
         if not data:
-            data = connection.get_config()
+            timer.start("fetch")
+            data = get_device_config(connection)
+        timer.data(data)
+        timer.start("parse")
 
         objs = []
-        lldp_names = findall(r"^set service lldp interface (\S+)", data, M)
-        if lldp_names:
-            for lldp in set(lldp_names):
-                lldp_regex = r" %s .+$" % lldp
-                cfg = findall(lldp_regex, data, M)
-                obj = self.render_config(cfg)
-                obj["name"] = lldp.strip("'")
-                if obj:
-                    objs.append(obj)
+        tree = get_config_tree(data)
+        path = ["service", "lldp", "interface"]
+        for lldp in tree.children(path):
+            cfg = tree.lines(path + [lldp])
+            obj = self.render_config(cfg)
+            obj["name"] = lldp
+            if obj:
+                objs.append(obj)
         facts = {}
         if objs:
             facts["lldp_interfaces"] = objs
             ansible_facts["ansible_network_resources"].update(facts)
 
         ansible_facts["ansible_network_resources"].update(facts)
+        timer.stop()
         return ansible_facts
 
     def render_config(self, conf):
@@ -14,8 +14,6 @@ for a given resource, parsed, and the facts tree is populated
 based on the configuration.
 """
 
-import re
-
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
@@ -25,6 +23,15 @@ from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.rm_template
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.argspec.ospf_interfaces.ospf_interfaces import (
     Ospf_interfacesArgs,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.interface_model import (
+    get_interface_model,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.profiler import (
+    get_timer,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.spec import (
+    validate_facts,
+)
 
 
 class Ospf_interfacesFacts(object):
@@ -41,20 +48,10 @@ class Ospf_interfacesFacts(object):
 
     def get_config_set(self, data):
         """To classify the configurations beased on interface"""
-        interface_list = []
         config_set = []
-        int_string = ""
-        for config_line in data.splitlines():
-            ospf_int = re.search(r"set interfaces \S+ (\S+) .*", config_line)
-            if ospf_int:
-                if ospf_int.group(1) not in interface_list:
-                    if int_string:
-                        config_set.append(int_string)
-                    interface_list.append(ospf_int.group(1))
-                    int_string = ""
-                int_string = int_string + config_line + "\n"
-        if int_string:
-            config_set.append(int_string)
+        for intf in get_interface_model(data).iter_interfaces():
+            if intf.lines:
+                config_set.append("\n".join(intf.lines) + "\n")
         return config_set
 
     def populate_facts(self, connection, ansible_facts, data=None):
@@ -73,8 +70,12 @@ class Ospf_interfacesFacts(object):
             lines=[], module=self._module
         )
 
+        timer = get_timer(self)
         if not data:
+            timer.start("fetch")
             data = self.get_device_data(connection)
+        timer.data(data)
+        timer.start("parse")
 
         # parse native config using the Ospf_interfaces template
         ospf_interfaces_facts = []
@@ -91,10 +92,12 @@ class Ospf_interfacesFacts(object):
 
         ansible_facts["ansible_network_resources"].pop("ospf_interfaces", None)
         facts = {"ospf_interfaces": []}
+        timer.start("validate")
         params = utils.remove_empties(
-            ospf_interfaces_parser.validate_config(
+            validate_facts(
                 self.argument_spec,
                 {"config": ospf_interfaces_facts},
+                module=self._module,
                 redact=True,
             )
         )
@@ -103,4 +106,5 @@ class Ospf_interfacesFacts(object):
                 facts["ospf_interfaces"].append(utils.remove_empties(cfg))
         ansible_facts["ansible_network_resources"].update(facts)
 
+        timer.stop()
         return ansible_facts
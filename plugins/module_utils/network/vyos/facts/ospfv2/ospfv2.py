@@ -14,7 +14,6 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from re import findall, search, M
-from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
@@ -22,6 +21,13 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.argspec.ospfv2.ospfv2 import (
     Ospfv2Args,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.profiler import (
+    get_timer,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.spec import (
+    get_generated_spec,
+    validate_facts,
+)
 
 
 class Ospfv2Facts(object):
@@ -37,16 +43,9 @@ class Ospfv2Facts(object):
 
         self._module = module
         self.argument_spec = Ospfv2Args.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_generated_spec(
+            self.argument_spec, subspec, options
+        )
 
     def get_device_data(self, connection):
         return connection.get_config()
@@ -60,21 +59,27 @@ class Ospfv2Facts(object):
         :returns: facts
         """
 
+        timer = get_timer(self)
         if not data:
+            timer.start("fetch")
             data = self.get_device_data(connection)
 
             # typically data is populated from the current device configuration
             # data = connection.get('show running-config | section ^interface')
             # using mock data instead
+        timer.data(data)
+        timer.start("parse")
 
         objs = {}
         ospfv2 = findall(r"^set protocols ospf (.+)", data, M)
         if ospfv2:
             objs = self.render_config(ospfv2)
         facts = {}
-        params = utils.validate_config(self.argument_spec, {"config": objs})
+        timer.start("validate")
+        params = validate_facts(self.argument_spec, {"config": objs})
         facts["ospfv2"] = utils.remove_empties(params["config"])
         ansible_facts["ansible_network_resources"].update(facts)
+        timer.stop()
         return ansible_facts
 
     def render_config(self, conf):
@@ -14,7 +14,6 @@ for a given resource, parsed, and the facts tree is populated
 based on the configuration.
 """
 
-from copy import deepcopy
 
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
@@ -25,6 +24,13 @@ from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.rm_template
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.argspec.route_maps.route_maps import (
     Route_mapsArgs,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.profiler import (
+    get_timer,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.spec import (
+    get_generated_spec,
+    validate_facts,
+)
 
 
 class Route_mapsFacts(object):
@@ -33,16 +39,9 @@ class Route_mapsFacts(object):
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = Route_mapsArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_generated_spec(
+            self.argument_spec, subspec, options
+        )
 
     def get_config(self, connection):
         return connection.get("show configuration commands | grep route-map")
@@ -59,26 +58,31 @@ class Route_mapsFacts(object):
         """
         facts = {}
         objs = []
+        timer = get_timer(self)
         if not data:
+            timer.start("fetch")
             data = self.get_config(connection)
+        timer.data(data)
+        timer.start("parse")
 
         # parse native config using the Route_maps template
         route_maps_parser = Route_mapsTemplate(lines=data.splitlines())
-        if route_maps_parser.parse().get("route_maps"):
-            objs = list(route_maps_parser.parse().get("route_maps").values())
-        for item in objs:
+        route_maps = route_maps_parser.parse().get("route_maps", {})
+        for item in route_maps.values():
             if item.get("entries"):
                 item["entries"] = list(item["entries"].values())
+            objs.append(item)
 
         ansible_facts["ansible_network_resources"].pop("route_maps", None)
 
-        # import epdb;epdb.serve()
+        timer.start("validate")
         params = utils.remove_empties(
-            utils.validate_config(self.argument_spec, {"config": objs})
+            validate_facts(self.argument_spec, {"config": objs})
         )
 
         if params.get("config"):
             facts["route_maps"] = params["config"]
         ansible_facts["ansible_network_resources"].update(facts)
 
+        timer.stop()
         return ansible_facts
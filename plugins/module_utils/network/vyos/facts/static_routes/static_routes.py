@@ -13,8 +13,6 @@ based on the configuration.
 from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
-from re import findall, search, M
-from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
@@ -24,6 +22,17 @@ from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.argspec.sta
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.utils import (
     get_route_type,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.config_tree import (
+    get_config_tree,
+    get_device_config,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.profiler import (
+    get_timer,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.spec import (
+    get_generated_spec,
+    validate_facts,
+)
 
 
 class Static_routesFacts(object):
@@ -32,19 +41,12 @@ class Static_routesFacts(object):
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = Static_routesArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_generated_spec(
+            self.argument_spec, subspec, options
+        )
 
     def get_device_data(self, connection):
-        return connection.get_config()
+        return get_device_config(connection)
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """Populate the facts for static_routes
@@ -54,29 +56,31 @@ class Static_routesFacts(object):
         :rtype: dictionary
         :returns: facts
         """
+        timer = get_timer(self)
         if not data:
+            timer.start("fetch")
             data = self.get_device_data(connection)
             # typically data is populated from the current device configuration
             # data = connection.get('show running-config | section ^interface')
             # using mock data instead
+        timer.data(data)
+        timer.start("parse")
         objs = []
         r_v4 = []
         r_v6 = []
         af = []
-        static_routes = findall(
-            r"set protocols static route(6)? (\S+)", data, M
-        )
-        if static_routes:
-            for route in set(static_routes):
-                route_regex = r" %s .+$" % route[1]
-                cfg = findall(route_regex, data, M)
-                sr = self.render_config(cfg)
-                sr["dest"] = route[1].strip("'")
+        tree = get_config_tree(data)
+        for route_type in ("route", "route6"):
+            path = ["protocols", "static", route_type]
+            for dest in tree.children(path):
+                sr = self.render_config(tree, path + [dest])
+                sr["dest"] = dest
                 afi = self.get_afi(sr["dest"])
                 if afi == "ipv4":
                     r_v4.append(sr)
                 else:
                     r_v6.append(sr)
+        if r_v4 or r_v6:
             if r_v4:
                 afi_v4 = {"afi": "ipv4", "routes": r_v4}
                 af.append(afi_v4)
@@ -91,45 +95,41 @@ class Static_routesFacts(object):
         facts = {}
         if objs:
             facts["static_routes"] = []
-            params = utils.validate_config(
-                self.argument_spec, {"config": objs}
-            )
+            timer.start("validate")
+            params = validate_facts(self.argument_spec, {"config": objs})
             for cfg in params["config"]:
                 facts["static_routes"].append(utils.remove_empties(cfg))
 
         ansible_facts["ansible_network_resources"].update(facts)
+        timer.stop()
         return ansible_facts
 
-    def render_config(self, conf):
+    def render_config(self, tree, path):
         """
         Render config as dictionary structure and delete keys
           from spec for null values
 
-        :param spec: The facts tree, generated from the argspec
-        :param conf: The configuration
+        :param tree: The config tree
+        :param path: The path of the route in the config tree
         :rtype: dictionary
         :returns: The generated config
         """
-        next_hops_conf = "\n".join(filter(lambda x: ("next-hop" in x), conf))
-        blackhole_conf = "\n".join(filter(lambda x: ("blackhole" in x), conf))
         routes_dict = {
-            "blackhole_config": self.parse_blackhole(blackhole_conf),
-            "next_hops": self.parse_next_hop(next_hops_conf),
+            "blackhole_config": self.parse_blackhole(
+                tree, path + ["blackhole"]
+            ),
+            "next_hops": self.parse_next_hop(tree, path + ["next-hop"]),
         }
         return routes_dict
 
-    def parse_blackhole(self, conf):
+    def parse_blackhole(self, tree, path):
         blackhole = None
-        if conf:
-            distance = search(r"^.*blackhole distance (.\S+)", conf, M)
-            bh = conf.find("blackhole")
-            if distance is not None:
-                blackhole = {}
-                value = distance.group(1).strip("'")
-                blackhole["distance"] = int(value)
-            elif bh:
-                blackhole = {}
-                blackhole["type"] = "blackhole"
+        if tree.exists(path):
+            distance = tree.children(path + ["distance"])
+            if distance:
+                blackhole = {"distance": int(distance[0])}
+            else:
+                blackhole = {"type": "blackhole"}
         return blackhole
 
     def get_afi(self, address):
@@ -139,42 +139,20 @@ class Static_routesFacts(object):
         elif route_type == "route6":
             return "ipv6"
 
-    def parse_next_hop(self, conf):
+    def parse_next_hop(self, tree, path):
         nh_list = None
-        if conf:
+        hops = tree.children(path)
+        if hops:
             nh_list = []
-            hop_list = findall(r"^.*next-hop (.+)", conf, M)
-            if hop_list:
-                for hop in hop_list:
-                    distance = search(r"^.*distance (.\S+)", hop, M)
-                    interface = search(r"^.*interface (.\S+)", hop, M)
-
-                    dis = hop.find("disable")
-                    hop_info = hop.split(" ")
-                    nh_info = {
-                        "forward_router_address": hop_info[0].strip("'")
-                    }
-                    if interface:
-                        nh_info["interface"] = interface.group(1).strip("'")
-                    if distance:
-                        value = distance.group(1).strip("'")
-                        nh_info["admin_distance"] = int(value)
-                    elif dis >= 1:
-                        nh_info["enabled"] = False
-                    for element in nh_list:
-                        if (
-                            element["forward_router_address"]
-                            == nh_info["forward_router_address"]
-                        ):
-                            if "interface" in nh_info.keys():
-                                element["interface"] = nh_info["interface"]
-                            if "admin_distance" in nh_info.keys():
-                                element["admin_distance"] = nh_info[
-                                    "admin_distance"
-                                ]
-                            if "enabled" in nh_info.keys():
-                                element["enabled"] = nh_info["enabled"]
-                            nh_info = None
-                    if nh_info is not None:
-                        nh_list.append(nh_info)
+            for hop in hops:
+                nh_info = {"forward_router_address": hop}
+                interface = tree.children(path + [hop, "interface"])
+                if interface:
+                    nh_info["interface"] = interface[0]
+                distance = tree.children(path + [hop, "distance"])
+                if distance:
+                    nh_info["admin_distance"] = int(distance[0])
+                if tree.exists(path + [hop, "disable"]):
+                    nh_info["enabled"] = False
+                nh_list.append(nh_info)
         return nh_list
@@ -17,7 +17,7 @@ the given network resource.
 import re
 from ansible.module_utils.six import iteritems
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.network_template import (
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.network_template import (
     NetworkTemplate,
 )
 
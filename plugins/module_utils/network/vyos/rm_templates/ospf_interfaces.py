@@ -15,7 +15,7 @@ the given network resource.
 """
 
 import re
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.network_template import (
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.network_template import (
     NetworkTemplate,
 )
 
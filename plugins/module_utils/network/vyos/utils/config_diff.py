@@ -0,0 +1,486 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+The vyos config diff
+It is in this file the running configuration is indexed once into a set
+of lines and a prefix trie of words, so that the `set` and `delete`
+commands of a candidate configuration can be checked against it without
+scanning the whole running configuration for every command. A candidate
+in the curly-brace format is turned into `set` commands in one pass.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from itertools import count
+
+from ansible.module_utils.six import string_types
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import (
+    ignore_line,
+)
+
+
+def normalize(line):
+    """
+    This function returns the form of a configuration line used to compare
+    the candidate against the running configuration.
+    :param line: configuration line.
+    :return: configuration line without quotes.
+    """
+    return str(line).replace("'", "")
+
+
+class RunningConfigIndex(object):
+    """The vyos running config index class"""
+
+    def __init__(self, running=None):
+        self.lines = set()
+        self.trie = {}
+        if running:
+            if not isinstance(running, list):
+                running = running.splitlines()
+            for line in running:
+                self.add(line)
+
+    def __len__(self):
+        return len(self.lines)
+
+    def add(self, line):
+        """
+        This function adds a running configuration line to the index.
+        :param line: configuration line.
+        """
+        line = normalize(line)
+        self.lines.add(line)
+        node = self.trie
+        for word in line.split():
+            child = node.get(word)
+            if child is None:
+                child = node[word] = {}
+            node = child
+
+    def has_line(self, line):
+        """
+        This function checks whether the line is in the running configuration.
+        :param line: configuration line.
+        :return: True/False.
+        """
+        return normalize(line) in self.lines
+
+    def has_prefix(self, prefix):
+        """
+        This function checks whether a running configuration line starts
+        with the prefix. All the words of the prefix but the last one have to
+        match a word of the line and the last one may be the start of a word.
+        :param prefix: start of a configuration line.
+        :return: True/False.
+        """
+        prefix = normalize(prefix)
+        words = prefix.split()
+        if not words:
+            return bool(self.lines)
+        node = self.trie
+        for word in words[:-1]:
+            node = node.get(word)
+            if node is None:
+                return False
+        last = words[-1]
+        child = node.get(last)
+        if prefix[-1].isspace():
+            # the last word is complete and has to be followed by more words
+            return bool(child)
+        if child is not None:
+            return True
+        return any(word.startswith(last) for word in node)
+
+
+def to_commands(candidate):
+    """
+    This function returns the commands of a candidate configuration given
+    either as `set` and `delete` commands or in the curly-brace format.
+    :param candidate: candidate configuration text.
+    :return: list of commands.
+    """
+    if candidate.startswith("set") or candidate.startswith("delete"):
+        return str(candidate).strip().split("\n")
+
+    return list(iter_set_commands(candidate))
+
+
+def iter_set_commands(config):
+    """
+    This function turns a configuration in the curly-brace format into
+    `set` commands, reading its lines once. The path of the parents is kept
+    on a stack of indentations and only the leaves and the empty nodes,
+    the lines not followed by a more indented one, give a command.
+    :param config: configuration text or iterable of its lines.
+    :return: generator of `set` commands.
+    """
+    if isinstance(config, string_types):
+        config = config.split("\n")
+
+    # (indentation, words) of the last line and of its parents
+    path = []
+    for line in config:
+        text = line.strip()
+        if not text.strip("{}; ") or ignore_line(text):
+            continue
+        indent = len(line) - len(line.lstrip())
+        if path and indent <= path[-1][0]:
+            # the previous line has no children
+            yield "set %s" % " ".join(words for _indent, words in path)
+        while path and path[-1][0] >= indent:
+            path.pop()
+        if text.endswith(" {"):
+            text = text[:-2]
+        path.append((indent, text))
+    if path:
+        yield "set %s" % " ".join(words for _indent, words in path)
+
+
+def find_set_command(config):
+    """
+    This function returns the first `set` or `delete` command of a
+    configuration, which is then not in the curly-brace format. As `set`
+    is also a node of the policy rules, only the top level lines are read.
+    :param config: configuration text or iterable of its lines.
+    :return: the command, None when there is none.
+    """
+    if isinstance(config, string_types):
+        config = config.split("\n")
+    for line in config:
+        if line.split(" ", 1)[0] in ("set", "delete"):
+            return line.strip()
+    return None
+
+
+def diff_commands(candidate, running):
+    """
+    This function returns the candidate commands that change the running
+    configuration, in the candidate order. A `set` command is kept when
+    the line is not configured and a `delete` command is kept when some
+    configured line starts with the path it deletes.
+    :param candidate: list of `set` and `delete` commands.
+    :param running: running configuration in the `set` format.
+    :return: list of commands.
+    """
+    index = running
+    if not isinstance(index, RunningConfigIndex):
+        index = RunningConfigIndex(running)
+
+    updates = list()
+    visited = set()
+
+    for line in candidate:
+        item = normalize(line)
+
+        if not item.startswith("set") and not item.startswith("delete"):
+            raise ValueError("line must start with either `set` or `delete`")
+
+        elif item.startswith("set") and not index.has_line(item):
+            updates.append(line)
+
+        elif item.startswith("delete"):
+            if not index:
+                updates.append(line)
+            elif line not in visited and index.has_prefix(
+                item.replace("delete", "set")
+            ):
+                updates.append(line)
+                visited.add(line)
+
+    return updates
+
+
+def minimize_commands(commands, running=None):
+    """
+    This function drops the commands made redundant by a later `delete` of
+    their path or of a parent path, keeping the order of the others. Such
+    commands are dropped from the first `delete` under the deleted path on,
+    as the path then still exists when the later `delete` runs, or all of
+    them when the running configuration has the path before the commands.
+    A command on a parent of the deleted path and any command but `set` and
+    `delete` stop the folding.
+    :param commands: list of commands, strings or dicts as for edit_config.
+    :param running: running configuration in the `set` format or its index.
+    :return: list of commands.
+    """
+    index = running
+    if running is not None and not isinstance(running, RunningConfigIndex):
+        index = RunningConfigIndex(running)
+
+    commands = list(commands)
+    paths = []
+    for cmd in commands:
+        words = []
+        if isinstance(cmd, string_types):
+            words = normalize(cmd).split()
+        if len(words) > 1 and words[0] in ("set", "delete"):
+            paths.append((words[0], tuple(words[1:])))
+        else:
+            paths.append(None)
+
+    # the deletes seen so far, walking backwards, in a trie of words where
+    # every node is a list of the index of the delete and of its children
+    trie = {}
+    owners = {}
+    for idx in range(len(commands) - 1, -1, -1):
+        if paths[idx] is None:
+            trie = {}
+            continue
+        verb, path = paths[idx]
+        children = trie
+        owner = None
+        for word in path:
+            node = children.get(word)
+            if node is None:
+                break
+            if owner is None:
+                owner = node[0]
+            children = node[1]
+        else:
+            # the deletes below a parent path cannot be folded past it
+            children.clear()
+        if owner is not None:
+            owners.setdefault(owner, []).append(idx)
+        elif verb == "delete":
+            children = trie
+            for word in path[:-1]:
+                children = children.setdefault(word, [None, {}])[1]
+            children[path[-1]] = [idx, {}]
+
+    # the deletes whose path is not touched by a command before them
+    unbounded = set()
+    stack = [trie]
+    while stack:
+        for node in stack.pop().values():
+            if node[0] is not None:
+                unbounded.add(node[0])
+            stack.append(node[1])
+
+    dropped = set()
+    for owner, members in owners.items():
+        members.reverse()
+        path = " ".join(paths[owner][1])
+        if (
+            owner in unbounded
+            and index
+            and (
+                index.has_line("set %s" % path)
+                or index.has_prefix("set %s " % path)
+            )
+        ):
+            dropped.update(members)
+            continue
+        for position, idx in enumerate(members):
+            if paths[idx][0] == "delete":
+                dropped.update(members[position:])
+                break
+
+    return [cmd for idx, cmd in enumerate(commands) if idx not in dropped]
+
+
+class PathTrie(object):
+    """
+    The vyos config path trie
+    The paths of configuration lines, as tuples of words, in a prefix trie
+    where every node is a list of the value stored for its path, or None,
+    and of its children. The nodes left without value nor children are
+    pruned, so a path has a node only when a stored path starts with it.
+    """
+
+    def __init__(self):
+        self.root = [None, {}]
+
+    def _walk(self, path):
+        nodes = [self.root]
+        for word in path:
+            node = nodes[-1][1].get(word)
+            if node is None:
+                return None
+            nodes.append(node)
+        return nodes
+
+    def _prune(self, nodes, path):
+        for idx in range(len(path), 0, -1):
+            node = nodes[idx]
+            if node[0] is not None or node[1]:
+                break
+            del nodes[idx - 1][1][path[idx - 1]]
+
+    def has_prefix(self, path):
+        """
+        This function checks whether a stored path starts with the path.
+        :param path: tuple of words.
+        :return: True/False.
+        """
+        nodes = self._walk(path)
+        return nodes is not None and (
+            nodes[-1][0] is not None or bool(nodes[-1][1])
+        )
+
+    def get(self, path):
+        """
+        This function returns the value of a path.
+        :param path: tuple of words.
+        :return: the value or None.
+        """
+        nodes = self._walk(path)
+        return None if nodes is None else nodes[-1][0]
+
+    def set(self, path, value):
+        """
+        This function stores the value of a path.
+        :param path: tuple of words.
+        :param value: value, anything but None.
+        """
+        node = self.root
+        for word in path:
+            child = node[1].get(word)
+            if child is None:
+                child = node[1][word] = [None, {}]
+            node = child
+        node[0] = value
+
+    def pop(self, path):
+        """
+        This function removes the value of a path.
+        :param path: tuple of words.
+        :return: the value or None.
+        """
+        nodes = self._walk(path)
+        if nodes is None:
+            return None
+        value, nodes[-1][0] = nodes[-1][0], None
+        self._prune(nodes, path)
+        return value
+
+    def pop_children(self, path):
+        """
+        This function removes the values of the paths one word longer than
+        the path and starting with it.
+        :param path: tuple of words.
+        :return: list of the values.
+        """
+        nodes = self._walk(path)
+        if nodes is None:
+            return []
+        values = []
+        children = nodes[-1][1]
+        for word in list(children):
+            child = children[word]
+            if child[0] is not None:
+                values.append(child[0])
+                child[0] = None
+                if not child[1]:
+                    del children[word]
+        self._prune(nodes, path)
+        return values
+
+    def pop_all(self, path):
+        """
+        This function removes the values of the path and of all the paths
+        starting with it.
+        :param path: tuple of words.
+        :return: list of the values.
+        """
+        nodes = self._walk(path)
+        if nodes is None:
+            return []
+        values = []
+        stack = [nodes[-1]]
+        while stack:
+            node = stack.pop()
+            if node[0] is not None:
+                values.append(node[0])
+            stack.extend(node[1].values())
+        nodes[-1][0] = None
+        nodes[-1][1].clear()
+        self._prune(nodes, path)
+        return values
+
+    def values(self):
+        """
+        This function returns the stored values.
+        :return: list of the values.
+        """
+        values = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node[0] is not None:
+                values.append(node[0])
+            stack.extend(node[1].values())
+        return values
+
+
+def apply_commands(running, commands, tag_nodes=()):
+    """
+    This function returns the running configuration as it is expected
+    to be once the `set` and `delete` commands are applied by the device.
+    A `set` of a leaf replaces its configured value, unless the leaf is a
+    tag node or sits right below one, and an emptied tag node is kept.
+    The lines are kept in a path trie so a command costs the depth of its
+    path, not the size of the configuration.
+    :param running: running configuration in the `set` format.
+    :param commands: list of `set` and `delete` commands.
+    :param tag_nodes: names of the tag nodes of the configuration.
+    :return: configuration in the `set` format.
+    """
+    if not isinstance(running, list):
+        running = running.splitlines()
+    tag_nodes = frozenset(tag_nodes)
+
+    # path -> (position, line), a line replacing another one takes its
+    # position so that the configuration keeps the order of the device
+    lines = PathTrie()
+    size = 0
+    for line in running:
+        words = tuple(normalize(line).split())
+        if words and words[0] == "set":
+            new = lines.get(words[1:]) is None
+            lines.set(words[1:], (size, line.strip()))
+            if new:
+                size += 1
+    position = count(size)
+
+    for command in commands:
+        words = tuple(normalize(command).split())
+        if not words:
+            continue
+        path = words[1:]
+        if words[0] == "set":
+            if lines.has_prefix(path):
+                continue
+            replaced = []
+            for idx in range(1, len(path)):
+                # a node gets a child, it is no longer shown on its own
+                value = lines.pop(path[:idx])
+                if value is not None:
+                    replaced.append(value)
+            if (
+                len(path) > 2
+                and path[-2] not in tag_nodes
+                and path[-3] not in tag_nodes
+            ):
+                replaced.extend(lines.pop_children(path[:-1]))
+            if replaced:
+                lines.set(path, (min(replaced)[0], command.strip()))
+            else:
+                lines.set(path, (next(position), command.strip()))
+        elif words[0] == "delete":
+            lines.pop_all(path)
+            for idx in range(len(path) - 1, 1, -1):
+                if path[idx - 2] in tag_nodes:
+                    # the closest tag node above the deleted path
+                    parent = path[:idx]
+                    if not lines.has_prefix(parent):
+                        lines.set(
+                            parent,
+                            (next(position), "set " + " ".join(parent)),
+                        )
+                    break
+
+    return "\n".join(line for _pos, line in sorted(lines.values()))
@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+The vyos config tree
+It is in this file the `set` format configuration is tokenized once into
+a prefix tree keyed by path segments, so that the resource fact parsers
+can query the lines of a subtree without rescanning the whole configuration.
+When the device can emit the configuration in json, its json tree is walked
+instead, with the same queries and without parsing any `set` line.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import re
+from collections import OrderedDict
+
+from ansible.module_utils.connection import ConnectionError
+from ansible.module_utils.six import iteritems, string_types
+
+_TOKEN_RE = re.compile(r"'[^']*'|\"[^\"]*\"|\S+")
+_QUOTES = ("'", '"')
+_QUOTE_RE = re.compile(r"[\s'\"]")
+
+# json tree lookups: a path that is not configured, a leaf value
+_MISSING = object()
+_VALUE = object()
+
+_TREE_CACHE = {"data": None, "tree": None}
+
+
+def tokenize(line):
+    """
+    This function splits a configuration line into its path segments.
+    Quoted values are kept as a single segment and the quotes are stripped.
+    :param line: configuration line.
+    :return: list of path segments.
+    """
+    line = line.strip()
+    if line[:1] in _QUOTES and line.count(line[0]) == 2:
+        # the whole line is wrapped in quotes
+        line = line.strip(line[0])
+    if "'" not in line and '"' not in line:
+        return line.split()
+    head, sep, value = line.partition(" '")
+    if value.endswith("'") and "'" not in value[:-1] and '"' not in head:
+        # the common case, only the leaf value is quoted
+        tokens = head.split()
+        tokens.append(value[:-1])
+        return tokens
+    return [unquote(token) for token in _TOKEN_RE.findall(line)]
+
+
+def unquote(token):
+    """
+    This function removes the surrounding quotes from a path segment.
+    :param token: path segment.
+    :return: unquoted path segment.
+    """
+    if len(token) > 1 and token[0] in _QUOTES and token[-1] == token[0]:
+        return token[1:-1]
+    return token
+
+
+def quote(token, value=False):
+    """
+    This function quotes a path segment the way the device does in the
+    `set` format configuration, the leaf values are always quoted.
+    :param token: path segment.
+    :param value: whether the path segment is a leaf value.
+    :return: quoted path segment.
+    """
+    if value or not token or _QUOTE_RE.search(token):
+        return '"%s"' % token if "'" in token else "'%s'" % token
+    return token
+
+
+def is_json(data):
+    """
+    This function checks whether a configuration is the json text of the
+    configuration rather than `set` commands.
+    :param data: configuration.
+    :return: True/False.
+    """
+    return isinstance(data, string_types) and data.lstrip()[:1] == "{"
+
+
+def get_device_config(connection):
+    """
+    This function fetches the configuration of the device for the config
+    tree, in json when the device can emit it and as `set` commands
+    otherwise.
+    :param connection: the device connection.
+    :return: configuration text.
+    """
+    capabilities = json.loads(connection.get_capabilities())
+    if "json" in capabilities.get("format", []):
+        try:
+            data = connection.get_config(format="json")
+        except ConnectionError:
+            data = None
+        if is_json(data):
+            return data
+    return connection.get_config()
+
+
+def get_config_tree(data):
+    """
+    This function returns the ConfigTree for the configuration, or the
+    JsonConfigTree when it is the json text of the configuration.
+    The last tree built is reused as long as the configuration is unchanged,
+    so all the resource fact parsers share a single tokenization pass.
+    :param data: configuration.
+    :return: ConfigTree or JsonConfigTree object.
+    """
+    if _TREE_CACHE["tree"] is None or _TREE_CACHE["data"] != data:
+        if is_json(data):
+            _TREE_CACHE["tree"] = JsonConfigTree(data)
+        else:
+            _TREE_CACHE["tree"] = ConfigTree(data)
+        _TREE_CACHE["data"] = data
+    return _TREE_CACHE["tree"]
+
+
+class ConfigNode(object):
+    """A node of the vyos config tree"""
+
+    __slots__ = ("children", "lines")
+
+    def __init__(self, line=None):
+        self.children = None
+        self.lines = [line] if line is not None else []
+
+
+class ConfigTree(object):
+    """The vyos config tree class"""
+
+    def __init__(self, data=None):
+        self.root = ConfigNode()
+        if data:
+            self.load(data)
+
+    def load(self, data):
+        """
+        This function adds every configuration line to the tree.
+        :param data: configuration as text or list of lines.
+        """
+        if isinstance(data, string_types):
+            data = data.splitlines()
+        for line in data:
+            self.add(line)
+
+    def add(self, line):
+        """
+        This function adds a `set` configuration line to the tree.
+        Every node on the path of the line keeps a reference to it.
+        :param line: configuration line.
+        """
+        tokens = tokenize(line)
+        if not tokens or tokens[0] != "set":
+            return
+        line = line.strip()
+        node = self.root
+        node.lines.append(line)
+        for token in tokens[1:]:
+            children = node.children
+            if children is None:
+                children = node.children = OrderedDict()
+            child = children.get(token)
+            if child is None:
+                child = children[token] = ConfigNode(line)
+            else:
+                child.lines.append(line)
+            node = child
+
+    def get(self, path):
+        """
+        This function returns the node for the given path.
+        :param path: list of path segments or space separated path.
+        :return: ConfigNode object or None.
+        """
+        if isinstance(path, string_types):
+            path = path.split()
+        node = self.root
+        for token in path:
+            if not node.children:
+                return None
+            node = node.children.get(token)
+            if node is None:
+                return None
+        return node
+
+    def exists(self, path):
+        """
+        This function checks whether the path is configured.
+        :param path: list of path segments or space separated path.
+        :return: True/False.
+        """
+        return self.get(path) is not None
+
+    def children(self, path):
+        """
+        This function returns the names of the direct children of a path
+        in the order they first appear in the configuration.
+        :param path: list of path segments or space separated path.
+        :return: list of path segments.
+        """
+        node = self.get(path)
+        if node is None or not node.children:
+            return []
+        return list(node.children)
+
+    def lines(self, path):
+        """
+        This function returns the configuration lines of a subtree
+        in the order they appear in the configuration.
+        :param path: list of path segments or space separated path.
+        :return: list of configuration lines.
+        """
+        node = self.get(path)
+        if node is None:
+            return []
+        return list(node.lines)
+
+    def text(self, path):
+        """
+        This function returns the configuration of a subtree as text.
+        :param path: list of path segments or space separated path.
+        :return: configuration text.
+        """
+        return "\n".join(self.lines(path))
+
+
+class JsonConfigTree(object):
+    """
+    The vyos config tree read from the json configuration
+    A node is a dict of its children, a leaf value is a string or a list of
+    the values of a multi-valued leaf, and a valueless leaf is an empty dict
+    or null. The leaf values are path segments of their own, as they are in
+    the ConfigTree.
+    """
+
+    def __init__(self, data=None):
+        if isinstance(data, string_types):
+            data = json.loads(data, object_pairs_hook=OrderedDict)
+        self.root = data or {}
+
+    def _get(self, path):
+        if isinstance(path, string_types):
+            path = path.split()
+        node = self.root
+        for token in path:
+            if isinstance(node, dict):
+                node = node.get(token, _MISSING)
+            elif isinstance(node, list):
+                node = (
+                    _VALUE
+                    if token in ["%s" % item for item in node]
+                    else _MISSING
+                )
+            elif node is not None and node is not _VALUE:
+                node = _VALUE if token == "%s" % node else _MISSING
+            else:
+                node = _MISSING
+            if node is _MISSING:
+                break
+        return node
+
+    def exists(self, path):
+        """
+        This function checks whether the path is configured.
+        :param path: list of path segments or space separated path.
+        :return: True/False.
+        """
+        return self._get(path) is not _MISSING
+
+    def children(self, path):
+        """
+        This function returns the names of the direct children of a path
+        in the order they appear in the configuration.
+        :param path: list of path segments or space separated path.
+        :return: list of path segments.
+        """
+        node = self._get(path)
+        if isinstance(node, dict):
+            return list(node)
+        if isinstance(node, list):
+            return ["%s" % item for item in node]
+        if node is None or node is _MISSING or node is _VALUE:
+            return []
+        return ["%s" % node]
+
+    def lines(self, path):
+        """
+        This function returns the configuration lines of a subtree as the
+        device prints them in the `set` format.
+        :param path: list of path segments or space separated path.
+        :return: list of configuration lines.
+        """
+        if isinstance(path, string_types):
+            path = path.split()
+        node = self._get(path)
+        if node is _MISSING:
+            return []
+        tokens = ["set"] + [quote(token) for token in path]
+        if node is _VALUE:
+            tokens[-1] = quote(path[-1], True)
+        lines = []
+        stack = [(" ".join(tokens), node)]
+        while stack:
+            line, node = stack.pop()
+            if isinstance(node, dict) and node:
+                stack.extend(
+                    (line + " " + quote(key), child)
+                    for key, child in reversed(list(iteritems(node)))
+                )
+            elif isinstance(node, list) and node:
+                lines.extend(
+                    line + " " + quote("%s" % item, True) for item in node
+                )
+            elif isinstance(node, (dict, list)) or node in (None, _VALUE):
+                if line != "set":
+                    lines.append(line)
+            else:
+                lines.append(line + " " + quote("%s" % node, True))
+        return lines
+
+    def text(self, path):
+        """
+        This function returns the configuration of a subtree as text.
+        :param path: list of path segments or space separated path.
+        :return: configuration text.
+        """
+        return "\n".join(self.lines(path))
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+The vyos interface model
+It is in this file the `set interfaces` lines of the configuration are
+grouped once by interface and by vif, so that the interface resource fact
+classes project their facts from the same model instead of searching the
+whole configuration for every interface and every vif.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from collections import OrderedDict
+
+from ansible.module_utils.six import itervalues
+
+_PREFIX = "set interfaces "
+
+_MODEL_CACHE = {"data": None, "lines": None, "model": None}
+
+
+def get_interface_model(data):
+    """
+    This function returns the InterfaceModel for the configuration.
+    The last model built is reused as long as the `set interfaces` lines
+    are unchanged, so the resource fact classes fetching the whole or a
+    filtered configuration share a single pass over the interfaces.
+    :param data: configuration.
+    :return: InterfaceModel object.
+    """
+    if _MODEL_CACHE["model"] is not None and _MODEL_CACHE["data"] == data:
+        return _MODEL_CACHE["model"]
+    lines = [
+        line.strip()
+        for line in data.splitlines()
+        if line.lstrip().startswith(_PREFIX)
+    ]
+    if _MODEL_CACHE["model"] is None or _MODEL_CACHE["lines"] != lines:
+        _MODEL_CACHE["model"] = InterfaceModel(lines)
+        _MODEL_CACHE["lines"] = lines
+    _MODEL_CACHE["data"] = data
+    return _MODEL_CACHE["model"]
+
+
+class Interface(object):
+    """An interface of the vyos interface model"""
+
+    __slots__ = ("type", "name", "lines", "config", "vifs")
+
+    def __init__(self, type, name):
+        self.type = type
+        self.name = name
+        # configuration lines of the interface and of its vifs
+        self.lines = []
+        # the same lines without the words up to the interface name
+        self.config = []
+        # vlan id -> lines of the vif without the words up to the vlan id
+        self.vifs = OrderedDict()
+
+
+class InterfaceModel(object):
+    """The vyos interface model class"""
+
+    def __init__(self, lines=None):
+        self.interfaces = OrderedDict()
+        if lines:
+            for line in lines:
+                self.add(line)
+
+    def add(self, line):
+        """
+        This function adds a `set interfaces` configuration line to the
+        interface it configures.
+        :param line: configuration line.
+        """
+        words = line.split(None, 4)
+        if len(words) < 4 or line[: len(_PREFIX)] != _PREFIX:
+            return
+        name = words[3].strip("'")
+        intf = self.interfaces.get(name)
+        if intf is None:
+            intf = self.interfaces[name] = Interface(words[2], name)
+        if len(words) < 5:
+            return
+        config = words[4]
+        intf.lines.append(line)
+        intf.config.append(config)
+        if config.startswith("vif "):
+            vif = config.split(None, 2)
+            lines = intf.vifs.setdefault(vif[1].strip("'"), [])
+            if len(vif) > 2:
+                lines.append(vif[2])
+
+    def get(self, name):
+        """
+        This function returns an interface of the model.
+        :param name: name of the interface.
+        :return: Interface object or None.
+        """
+        return self.interfaces.get(name)
+
+    def iter_interfaces(self, types=None):
+        """
+        This function returns the interfaces of the given types in the
+        order they first appear in the configuration.
+        :param types: interface types, all of them when not given.
+        :return: iterator of Interface objects.
+        """
+        for intf in itervalues(self.interfaces):
+            if types is None or intf.type in types:
+                yield intf
@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+The vyos network template
+It is in this file the parsers of a resource module template are indexed
+by the fixed leading words of their `getval` regex, so that every line of
+the configuration is only matched against the parsers that can match it
+instead of against all of them. The parsed values are merged into the
+result in place and the jinja templates of the parsers are compiled once,
+the ones that only look up values of the data into python callables.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import ast
+import re
+from copy import deepcopy
+from itertools import chain
+
+from ansible.module_utils.six import iteritems, string_types, text_type
+from ansible.module_utils.common._collections_compat import Mapping
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.network_template import (
+    NetworkTemplate as NetworkTemplateBase,
+)
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    dict_merge,
+    sort_list,
+)
+
+try:
+    from jinja2.exceptions import UndefinedError
+except ImportError:
+    UndefinedError = Exception
+
+_LITERAL_RE = re.compile(r"[A-Za-z0-9_-]+")
+_GROUP_RE = re.compile(r"\(\?P<\w+>(\\S\+|\\d\+|\\w\+|[A-Za-z0-9_|-]+)\)")
+_SEPARATOR_RE = re.compile(r"\\s\+\??|\\s(?![*?+{])| (?![*?+{])")
+_QUANTIFIERS = ("*", "?", "+", "{")
+
+_LOOKUP_RE = re.compile(r"{{\s*([A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)\s*}}")
+_DICT_ATTRIBUTES = frozenset(dir(dict))
+# a value starting with a name is not a python literal, unless the name is
+# one of these or the prefix of a string
+_NAME_RE = re.compile(r"[A-Za-z_]\w*")
+_LITERAL_NAMES = frozenset(("True", "False", "None", "set"))
+
+# template class -> ParserIndex
+_PARSER_INDEXES = {}
+# jinja template string -> TemplateRenderer
+_RENDERERS = {}
+
+
+def get_signature(getval):
+    """
+    This function returns the words a line has to start with to be matched
+    by a parser regex. A word is either a literal or None when the regex
+    matches a variable word at that position. The signature stops at the
+    first part of the regex that does not match a single whole word.
+    :param getval: parser regex, compiled or not.
+    :return: tuple of words.
+    """
+    pattern = getattr(getval, "pattern", getval)
+    flags = getattr(getval, "flags", 0)
+    if not isinstance(pattern, string_types) or flags & re.IGNORECASE:
+        return ()
+    if flags & re.VERBOSE:
+        if "#" in pattern:
+            return ()
+        pattern = re.sub(r"(?<!\\)\s+", "", pattern)
+    pos = 1 if pattern.startswith("^") else 0
+
+    signature = []
+    while pos < len(pattern):
+        word = ""
+        variable = False
+        while pos < len(pattern):
+            match = _LITERAL_RE.match(pattern, pos)
+            if match:
+                word += match.group(0)
+            else:
+                match = _GROUP_RE.match(pattern, pos)
+                if not match:
+                    break
+                variable = True
+            pos = match.end()
+            if pattern.startswith(_QUANTIFIERS, pos):
+                # the last piece is optional or repeated
+                return tuple(signature)
+        separator = _SEPARATOR_RE.match(pattern, pos)
+        if not word and not variable or not separator:
+            break
+        signature.append(None if variable else word)
+        pos = separator.end()
+    return tuple(signature)
+
+
+class ParserIndex(object):
+    """The vyos parser index class"""
+
+    def __init__(self, parsers):
+        # node: [parser positions, literal word -> node, variable word node]
+        self.root = [[], {}, None]
+        self.names = {}
+        for idx, parser in enumerate(parsers):
+            self.names.setdefault(parser["name"], parser)
+            node = self.root
+            for word in get_signature(parser["getval"]):
+                if word is None:
+                    if node[2] is None:
+                        node[2] = [[], {}, None]
+                    node = node[2]
+                else:
+                    child = node[1].get(word)
+                    if child is None:
+                        child = node[1][word] = [[], {}, None]
+                    node = child
+            node[0].append(idx)
+
+    def candidates(self, line):
+        """
+        This function returns the positions of the parsers that can match
+        the line, in the order they are defined in.
+        :param line: configuration line.
+        :return: list of parser positions.
+        """
+        words = line.split()
+        found = []
+        stack = [(self.root, 0)]
+        while stack:
+            node, pos = stack.pop()
+            found.extend(node[0])
+            if pos < len(words):
+                child = node[1].get(words[pos])
+                if child is not None:
+                    stack.append((child, pos + 1))
+                if node[2] is not None:
+                    stack.append((node[2], pos + 1))
+        found.sort()
+        return found
+
+
+def get_parser_index(tmplt):
+    """
+    This function returns the ParserIndex of a template class, it is built
+    once per class.
+    :param tmplt: template class.
+    :return: ParserIndex object.
+    """
+    index = _PARSER_INDEXES.get(tmplt)
+    if index is None:
+        index = _PARSER_INDEXES[tmplt] = ParserIndex(tmplt.PARSERS)
+    return index
+
+
+class TemplateRenderer(object):
+    """The compiled form of a jinja template string of a parser"""
+
+    def __init__(self, value, template):
+        self.value = value
+        self._template = template
+        self._compiled = None
+        self._parts = None
+        self._contains_vars = template.contains_vars(value)
+        if self._contains_vars:
+            self._parts = self._lookups(value)
+
+    @staticmethod
+    def _lookups(value):
+        """Split a template made of text and `{{ a.b }}` lookups into the
+        text and the paths of the lookups, None for any other template.
+        """
+        if value.endswith("\n"):
+            return None
+        parts = []
+        pos = 0
+        for match in _LOOKUP_RE.finditer(value):
+            start = match.start()
+            parts.append(value[pos:start])
+            path = tuple(match.group(1).split("."))
+            if _DICT_ATTRIBUTES.intersection(path):
+                # jinja would get the attribute of the dict, not the key
+                return None
+            parts.append(path)
+            pos = match.end()
+        parts.append(value[pos:])
+        for part in parts[::2]:
+            if "{{" in part or "{%" in part or "{#" in part:
+                return None
+        return parts
+
+    def __call__(self, data, fail_on_undefined=False):
+        """
+        This function renders the template the way the netcommon Template
+        does it.
+        :param data: variables of the template.
+        :param fail_on_undefined: raise an error for an undefined variable.
+        :return: rendered value.
+        """
+        if not self._contains_vars:
+            return self.value
+        data = data or {}
+        value = None
+        if self._parts is not None:
+            value = self._lookup(data)
+        if value is None:
+            if self._compiled is None:
+                self._compiled = self._template.env.from_string(self.value)
+            try:
+                value = self._compiled.render(data)
+            except UndefinedError:
+                if not fail_on_undefined:
+                    return None
+                raise
+        if value:
+            name = _NAME_RE.match(value)
+            if (
+                name
+                and name.group(0) not in _LITERAL_NAMES
+                and not value.startswith(("'", '"'), name.end())
+            ):
+                return str(value)
+            try:
+                return ast.literal_eval(value)
+            except Exception:
+                return str(value)
+        return None
+
+    def _lookup(self, data):
+        """Render the text and lookups, None when the template has to be
+        rendered by jinja, for an undefined variable as well.
+        """
+        out = []
+        for idx, part in enumerate(self._parts):
+            if not idx % 2:
+                out.append(part)
+                continue
+            obj = data
+            for word in part:
+                if not isinstance(obj, dict) or word not in obj:
+                    return None
+                obj = obj[word]
+            out.append(text_type(obj))
+        return "".join(out)
+
+
+def get_renderer(value, template):
+    """
+    This function returns the TemplateRenderer of a jinja template string,
+    it is compiled once.
+    :param value: jinja template string.
+    :param template: netcommon Template object.
+    :return: TemplateRenderer object.
+    """
+    renderer = _RENDERERS.get(value)
+    if renderer is None:
+        renderer = _RENDERERS[value] = TemplateRenderer(value, template)
+    return renderer
+
+
+def merge_into(base, other):
+    """
+    This function merges other into base in place, a value of other is
+    merged with the one of base the way dict_merge does it but base is
+    not copied.
+    :param base: dict the values are merged into.
+    :param other: dict of the values to merge.
+    :return: base.
+    """
+    for key, item in iteritems(other):
+        if key not in base:
+            base[key] = item
+            continue
+        value = base[key]
+        if item is None:
+            base[key] = None
+        elif isinstance(value, dict):
+            if isinstance(item, Mapping):
+                merge_into(value, item)
+            else:
+                base[key] = item
+        elif isinstance(value, list):
+            try:
+                base[key] = list(set(chain(value, item)))
+            except TypeError:
+                value.extend([i for i in item if i not in value])
+        elif sort_list(value) != sort_list(item):
+            base[key] = item
+    return base
+
+
+class NetworkTemplate(NetworkTemplateBase):
+    """The NetworkTemplate class of the vyos resource module templates,
+    that parses the config lines with their parsers indexed.
+    """
+
+    def _format(self, value, data, fail_on_undefined=False):
+        """Render a jinja template string of a parser result"""
+        return get_renderer(value, self._template)(data, fail_on_undefined)
+
+    def _deepformat(self, tmplt, data):
+        if isinstance(tmplt, str):
+            return self._format(tmplt, data)
+        if not isinstance(tmplt, dict):
+            return deepcopy(tmplt)
+        # the values that are not rendered are immutable
+        wtmplt = dict(tmplt)
+        for tkey, tval in tmplt.items():
+            ftkey = self._format(tkey, data, fail_on_undefined=True)
+            if ftkey != tkey:
+                wtmplt.pop(tkey)
+            if isinstance(tval, dict):
+                wtmplt[ftkey] = self._deepformat(tval, data)
+            elif isinstance(tval, list):
+                wtmplt[ftkey] = [self._deepformat(x, data) for x in tval]
+            elif isinstance(tval, str):
+                wtmplt[ftkey] = self._deepformat(tval, data)
+                if wtmplt[ftkey] is None:
+                    wtmplt.pop(ftkey)
+        return wtmplt
+
+    def get_parser(self, name):
+        """get_parser"""
+        parser = get_parser_index(type(self._tmplt)).names.get(name)
+        if parser is None:
+            raise IndexError("no parser named %s" % name)
+        return parser
+
+    def _render(self, tmplt, data, negate):
+        if not callable(tmplt):
+            tmplt = get_renderer(tmplt, self._template)
+        return super(NetworkTemplate, self)._render(tmplt, data, negate)
+
+    def parse(self):
+        """parse"""
+        result = {}
+        shared = {}
+        parsers = self._tmplt.PARSERS
+        index = get_parser_index(type(self._tmplt))
+        for line in self._lines:
+            for idx in index.candidates(line):
+                parser = parsers[idx]
+                cap = re.match(parser["getval"], line)
+                if cap:
+                    capdict = cap.groupdict()
+                    capdict = dict(
+                        (k, v) for k, v in capdict.items() if v is not None
+                    )
+                    if parser.get("shared"):
+                        shared = capdict
+                    vals = capdict
+                    if shared:
+                        vals = dict_merge(capdict, shared)
+                    res = self._deepformat(parser["result"], vals)
+                    merge_into(result, res)
+                    break
+        return result
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+The vyos facts profiler
+It is in this file the optional timing of the fact gathering is collected.
+The resource fact classes mark the start of each of their phases on the
+timer they are given, a fact class without a timer gets one that records
+nothing so that the gathering is not slowed down when it is not profiled.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import time
+
+from ansible.module_utils._text import to_bytes
+
+# time.perf_counter is not available on python 2
+_clock = getattr(time, "perf_counter", time.time)
+
+PHASES = ("fetch", "parse", "validate")
+
+
+def get_timer(facts_obj):
+    """
+    This function returns the timer of a resource fact class instance.
+    :param facts_obj: resource fact class instance.
+    :return: ResourceTimer or NullTimer object.
+    """
+    return getattr(facts_obj, "_timer", None) or NULL_TIMER
+
+
+class NullTimer(object):
+    """The timer of a fact gathering that is not profiled"""
+
+    def start(self, phase):
+        pass
+
+    def stop(self):
+        pass
+
+    def data(self, data):
+        pass
+
+
+NULL_TIMER = NullTimer()
+
+
+class ResourceTimer(object):
+    """The timer of a resource fact gathering"""
+
+    def __init__(self):
+        self.phases = {}
+        self.bytes = 0
+        self.lines = 0
+        self.fetched = False
+        self.wall_time = 0.0
+        self._phase = None
+        self._start = None
+        self._began = None
+
+    def start(self, phase):
+        """
+        This function ends the running phase and starts the next one.
+        :param phase: name of the phase.
+        """
+        now = _clock()
+        if self._began is None:
+            self._began = now
+        self._record(now)
+        self._phase = phase
+        self._start = now
+
+    def stop(self):
+        """
+        This function ends the running phase.
+        """
+        now = _clock()
+        self._record(now)
+        self._phase = None
+        if self._began is not None:
+            self.wall_time = now - self._began
+
+    def data(self, data):
+        """
+        This function records the size of the configuration the facts
+        are parsed from, it is fetched from the device when it is
+        recorded during the fetch phase.
+        :param data: configuration.
+        """
+        if data:
+            self.bytes = len(to_bytes(data, errors="surrogate_or_strict"))
+            self.lines = data.count("\n") + 1
+        self.fetched = self._phase == "fetch"
+
+    def _record(self, now):
+        if self._phase is not None:
+            self.phases[self._phase] = (
+                self.phases.get(self._phase, 0.0) + now - self._start
+            )
+
+
+class FactsProfiler(object):
+    """The vyos facts profiler class"""
+
+    def __init__(self):
+        self.resources = {}
+        self.legacy = None
+        self.cached = None
+        self.total = 0.0
+
+    def timer(self, resource):
+        """
+        This function returns a new timer for a resource.
+        :param resource: name of the resource.
+        :return: ResourceTimer object.
+        """
+        timer = self.resources[resource] = ResourceTimer()
+        return timer
+
+    def profile(self, resource, facts_classes):
+        """
+        This function returns a factory of the resource fact class
+        that gives every instance it creates a timer for the resource.
+        :param resource: name of the resource.
+        :param facts_classes: mapping of resource name to fact class, the
+                              class is only looked up when it is used.
+        :return: function.
+        """
+
+        def factory(module):
+            facts_obj = facts_classes[resource](module)
+            facts_obj._timer = self.timer(resource)
+            return facts_obj
+
+        return factory
+
+    def clock(self):
+        """
+        This function returns the current time of the profiler clock.
+        :return: seconds.
+        """
+        return _clock()
+
+    def report(self):
+        """
+        This function returns the collected timings in seconds.
+        :return: dict.
+        """
+        resources = {}
+        for name, timer in self.resources.items():
+            resources[name] = {
+                "wall_time": timer.wall_time,
+                "bytes": timer.bytes,
+                "lines": timer.lines,
+                "fetched": timer.fetched,
+                "phases": dict(
+                    (phase, timer.phases[phase])
+                    for phase in PHASES
+                    if phase in timer.phases
+                ),
+            }
+        report = {"total": self.total, "resources": resources}
+        if self.legacy is not None:
+            report["legacy"] = {"wall_time": self.legacy}
+        if self.cached is not None:
+            report["cached"] = self.cached
+        return report
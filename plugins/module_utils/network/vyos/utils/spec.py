@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+The vyos facts specs
+It is in this file the specs the resource fact classes derive from their
+argspec are generated, and the facts they parse are validated against it.
+Both are prepared once per argspec and reused by every fact class
+instance of the process.
+
+The facts produced by the parsers of the collection are trusted, they are
+only conformed to the argspec: the values are converted to the type of
+their option and the missing options are set to their default. The full
+argspec validation is run instead when the ANSIBLE_VYOS_FACTS_STRICT
+environment variable is set to a true value.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+from copy import deepcopy
+
+from ansible.module_utils._text import to_native
+from ansible.module_utils.six import integer_types, iteritems, string_types
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible.module_utils.common.validation import (
+    check_type_bool,
+    check_type_dict,
+    check_type_float,
+    check_type_int,
+    check_type_list,
+    check_type_path,
+    check_type_raw,
+    check_type_str,
+)
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
+    utils,
+)
+
+# ArgumentSpecValidator is only available from ansible 2.11, the strict
+# validation runs utils.validate_config on the older releases
+try:
+    from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+
+    HAS_ARGUMENT_SPEC_VALIDATOR = True
+except ImportError:
+    HAS_ARGUMENT_SPEC_VALIDATOR = False
+
+STRICT_ENV = "ANSIBLE_VYOS_FACTS_STRICT"
+
+TYPE_CHECKERS = {
+    "bool": check_type_bool,
+    "dict": check_type_dict,
+    "float": check_type_float,
+    "int": check_type_int,
+    "list": check_type_list,
+    "path": check_type_path,
+    "raw": check_type_raw,
+    "str": check_type_str,
+}
+
+# the values that already have the type of their option
+TYPE_CLASSES = {
+    "bool": bool,
+    "dict": dict,
+    "int": integer_types,
+    "list": list,
+    "str": string_types,
+}
+
+# argspec id -> (argspec, prepared object)
+_GENERATED_SPECS = {}
+_CONFORMERS = {}
+_VALIDATORS = {}
+
+
+def _cached(cache, spec, factory):
+    entry = cache.get(id(spec))
+    if entry is None or entry[0] is not spec:
+        entry = cache[id(spec)] = (spec, factory(spec))
+    return entry[1]
+
+
+def get_generated_spec(argument_spec, subspec="config", options="options"):
+    """
+    This function returns the dictionary generated from an argspec by
+    utils.generate_dict, it is generated once per argspec and shared by
+    the fact class instances, it must not be modified.
+    :param argument_spec: argspec of the resource.
+    :param subspec: option of the argspec the facts are generated from.
+    :param options: suboptions key of the subspec.
+    :return: dict.
+    """
+    generated = _cached(_GENERATED_SPECS, argument_spec, lambda spec: {})
+    key = (subspec, options)
+    if key not in generated:
+        spec = argument_spec
+        if subspec:
+            spec = spec[subspec][options] if options else spec[subspec]
+        generated[key] = utils.generate_dict(spec)
+    return generated[key]
+
+
+def is_strict():
+    """
+    This function tells whether the facts get the full argspec validation.
+    :return: bool.
+    """
+    return boolean(os.environ.get(STRICT_ENV) or False, strict=False)
+
+
+def validate_facts(argument_spec, data, module=None, redact=False):
+    """
+    This function validates the facts parsed from the configuration
+    against the argspec of the resource.
+    :param argument_spec: argspec of the resource.
+    :param data: facts, for example {"config": objs}.
+    :param module: module whose no_log values the secrets are added to.
+    :param redact: whether the no_log values of the facts are redacted.
+    :return: validated facts.
+    """
+    if is_strict():
+        validated = _validate(argument_spec, data)
+    else:
+        validated = _cached(_CONFORMERS, argument_spec, SpecConformer)(data)
+    if redact and module is not None:
+        collect_no_log_values(argument_spec, validated, module.no_log_values)
+    return validated
+
+
+def collect_no_log_values(argument_spec, params, no_log_values):
+    """
+    This function adds the values of the no_log options of validated
+    facts to a set of no_log values.
+    :param argument_spec: argspec of the resource.
+    :param params: validated facts, for example {"config": objs}.
+    :param no_log_values: set the values are added to.
+    """
+    for name, option in iteritems(argument_spec):
+        value = params.get(name)
+        if value is None:
+            continue
+        if option.get("no_log"):
+            _add_no_log_value(value, no_log_values)
+        suboptions = option.get("options")
+        if suboptions:
+            for item in value if isinstance(value, list) else [value]:
+                collect_no_log_values(suboptions, item, no_log_values)
+
+
+def _add_no_log_value(value, no_log_values):
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            _add_no_log_value(item, no_log_values)
+    elif isinstance(value, string_types):
+        if value:
+            no_log_values.add(to_native(value))
+    elif not isinstance(value, bool):
+        no_log_values.add(to_native(value, nonstring="simplerepr"))
+
+
+def _validate(argument_spec, data):
+    # the facts are validated as module arguments, after a json round-trip
+    data = json.loads(json.dumps(data))
+    if not HAS_ARGUMENT_SPEC_VALIDATOR:
+        return utils.validate_config(argument_spec, data)
+    validator = _cached(_VALIDATORS, argument_spec, ArgumentSpecValidator)
+    result = validator.validate(data)
+    if result.error_messages:
+        raise ValueError(
+            "invalid facts: %s" % ", ".join(result.error_messages)
+        )
+    return result.validated_parameters
+
+
+class SpecConformer(object):
+    """
+    The conformer of the facts to an argspec, it sets the options to the
+    value the argspec validation would give them without validating them.
+    """
+
+    def __init__(self, argument_spec):
+        self._options = []
+        for name, option in iteritems(argument_spec):
+            suboptions = option.get("options")
+            default = option.get("default")
+            self._options.append(
+                (
+                    name,
+                    option.get("type", "str"),
+                    default,
+                    isinstance(default, (dict, list)),
+                    option.get("elements"),
+                    SpecConformer(suboptions) if suboptions else None,
+                )
+            )
+
+    def __call__(self, params):
+        conformed = {}
+        for option in self._options:
+            name, _type, default, copy, elements, suboptions = option
+            value = params.get(name)
+            if value is None:
+                conformed[name] = deepcopy(default) if copy else default
+                continue
+            value = _convert(value, _type)
+            if suboptions is not None:
+                if _type == "list":
+                    value = [suboptions(item) for item in value]
+                else:
+                    value = suboptions(value)
+            elif elements is not None and _type == "list":
+                value = [_convert(item, elements) for item in value]
+            conformed[name] = value
+        return conformed
+
+
+def _convert(value, _type):
+    if isinstance(value, tuple) and _type == "list":
+        return list(value)
+    classes = TYPE_CLASSES.get(_type)
+    if classes is not None and isinstance(value, classes):
+        return value
+    return TYPE_CHECKERS[_type](value)
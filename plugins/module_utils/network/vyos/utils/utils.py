@@ -7,6 +7,8 @@
 from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
+import re
+
 from ansible.module_utils.six import iteritems
 from ansible.module_utils.basic import missing_required_lib
 
@@ -17,6 +19,10 @@ try:
 except ImportError:
     HAS_IPADDRESS = False
 
+# markers of the canonical keys of unhashable list elements
+_DICT_KEY = object()
+_LIST_KEY = object()
+
 
 def search_obj_in_list(name, lst, key="name"):
     if lst:
@@ -26,6 +32,41 @@ def search_obj_in_list(name, lst, key="name"):
     return None
 
 
+class ListIndex(object):
+    """
+    The list index class
+    It maps the values of one or more keys of the dict elements of a list
+    to the first element holding them, so that the element for a name,
+    a dest or an (afi, name) pair is found without scanning the list.
+    """
+
+    def __init__(self, lst, key="name"):
+        self._keys = key if isinstance(key, tuple) else (key,)
+        self._index = {}
+        for item in lst or []:
+            try:
+                values = tuple(_key(item[k]) for k in self._keys)
+            except KeyError:
+                continue
+            self._index.setdefault(values, item)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, values):
+        return self.get(values) is not None
+
+    def get(self, values):
+        """
+        This function returns the element holding the values.
+        :param values: value of the key or tuple of values of the keys.
+        :return: the element or None.
+        """
+        if len(self._keys) == 1:
+            values = (values,)
+        return self._index.get(tuple(_key(v) for v in values))
+
+
 def get_interface_type(interface):
     """Gets the type of interface"""
     if interface.startswith("eth"):
@@ -112,11 +153,11 @@ def get_lst_same_for_dicts(want, have, lst):
     if want and have:
         want_list = want.get(lst) or {}
         have_list = have.get(lst) or {}
-        diff = [
-            i
-            for i in want_list and have_list
-            if i in have_list and i in want_list
-        ]
+        if want_list:
+            want_keys = _key_set(want_list)
+            diff = [i for i in have_list if _key(i) in want_keys]
+        else:
+            diff = []
     return diff
 
 
@@ -133,11 +174,8 @@ def list_diff_have_only(want_list, have_list):
     elif not have_list:
         diff = None
     else:
-        diff = [
-            i
-            for i in have_list + want_list
-            if i in have_list and i not in want_list
-        ]
+        want_keys = _key_set(want_list)
+        diff = [i for i in have_list if _key(i) not in want_keys]
     return diff
 
 
@@ -154,14 +192,44 @@ def list_diff_want_only(want_list, have_list):
     elif not have_list:
         diff = want_list
     else:
-        diff = [
-            i
-            for i in have_list + want_list
-            if i in want_list and i not in have_list
-        ]
+        have_keys = _key_set(have_list)
+        diff = [i for i in want_list if _key(i) not in have_keys]
     return diff
 
 
+def _key(item):
+    """
+    This function returns a hashable key for a list element, unhashable
+    dicts and lists are converted to a canonical form so that elements
+    which compare equal get the same key.
+    :param item: list element.
+    :return: hashable key.
+    """
+    if isinstance(item, dict):
+        try:
+            return (_DICT_KEY, frozenset(iteritems(item)))
+        except TypeError:
+            # some values are unhashable themselves
+            return (
+                _DICT_KEY,
+                frozenset((k, _key(v)) for k, v in iteritems(item)),
+            )
+    if isinstance(item, list):
+        return (_LIST_KEY, tuple(_key(v) for v in item))
+    if isinstance(item, set):
+        return frozenset(item)
+    return item
+
+
+def _key_set(lst):
+    """
+    This function returns the set of the keys of the list elements.
+    :param lst: list.
+    :return: set of hashable keys.
+    """
+    return set(_key(item) for item in lst)
+
+
 def search_dict_tv_in_list(d_val1, d_val2, lst, key1, key2):
     """
     This function return the dict object if it exist in list.
@@ -243,6 +311,78 @@ def get_route_type(address):
         return "route"
 
 
+CONFIG_FILTER_RE = re.compile(r"^(grep|match)\s+(.+)$")
+
+
+def filter_config(config, flags):
+    """
+    This function applies the `| grep` and `| match` flags of a
+    `show configuration` command to the configuration text locally.
+    :param config: configuration text.
+    :param flags: list of flags, for example ["| grep interfaces"].
+    :return: filtered configuration or None when a flag can only be
+             handled by the device.
+    """
+    patterns = []
+    for flag in flags or []:
+        for segment in flag.split("|"):
+            segment = segment.strip()
+            if not segment:
+                continue
+            match = CONFIG_FILTER_RE.match(segment)
+            if not match:
+                return None
+            pattern = match.group(2).strip()
+            if pattern[0] in ("'", '"') and pattern[-1] == pattern[0]:
+                pattern = pattern[1:-1]
+            if pattern.startswith("-"):
+                return None
+            if match.group(1) == "grep" and re.search(r"[\\+?|(){}]", pattern):
+                # basic regular expressions differ from python ones
+                return None
+            try:
+                patterns.append(re.compile(pattern))
+            except re.error:
+                return None
+
+    if not patterns:
+        return config
+    lines = [
+        line
+        for line in config.splitlines()
+        if all(p.search(line) for p in patterns)
+    ]
+    return "\n".join(lines)
+
+
+COMMIT_RE = re.compile(r"(\d+)\s+(.+)by(.+)via(.+)")
+
+
+def parse_commits(data):
+    """
+    This function parses the output of `show system commit`.
+    :param data: output of the command.
+    :return: list of commits, the latest first, with their revision,
+             datetime, user, interface and comment.
+    """
+    entries = []
+    for line in data.splitlines():
+        match = COMMIT_RE.match(line)
+        if match:
+            entries.append(
+                dict(
+                    revision=match.group(1),
+                    datetime=match.group(2).strip(),
+                    by=match.group(3).strip(),
+                    via=match.group(4).strip(),
+                    comment=None,
+                )
+            )
+        elif entries and line.strip():
+            entries[-1]["comment"] = line.strip()
+    return entries
+
+
 def _bool_to_str(val):
     """
     This function converts the bool value into string.
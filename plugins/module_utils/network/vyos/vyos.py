@@ -33,6 +33,12 @@ import json
 from ansible.module_utils._text import to_text
 from ansible.module_utils.basic import env_fallback
 from ansible.module_utils.connection import Connection, ConnectionError
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    to_list,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.utils import (
+    filter_config,
+)
 
 _DEVICE_CONFIGS = {}
 
@@ -68,7 +74,7 @@ def get_connection(module):
 
     capabilities = get_capabilities(module)
     network_api = capabilities.get("network_api")
-    if network_api == "cliconf":
+    if network_api in ("cliconf", "httpapi"):
         module._vyos_connection = Connection(module._socket_path)
     else:
         module.fail_json(msg="Invalid connection type %s" % network_api)
@@ -90,20 +96,37 @@ def get_capabilities(module):
 
 
 def get_config(module, flags=None, format=None):
-    flags = [] if flags is None else flags
-    global _DEVICE_CONFIGS
+    flags = [] if flags is None else to_list(flags)
+    key = format if format in ("text", "json") else "set"
 
-    if _DEVICE_CONFIGS != {}:
-        return _DEVICE_CONFIGS
-    else:
+    if key not in _DEVICE_CONFIGS:
+        connection = get_connection(module)
+        try:
+            out = connection.get_config(format=format)
+        except ConnectionError as exc:
+            module.fail_json(msg=to_text(exc, errors="surrogate_then_replace"))
+        _DEVICE_CONFIGS[key] = to_text(
+            out, errors="surrogate_then_replace"
+        ).strip()
+
+    cfg = filter_config(_DEVICE_CONFIGS[key], flags)
+    if cfg is None:
+        # the flags can only be applied by the device
         connection = get_connection(module)
         try:
             out = connection.get_config(flags=flags, format=format)
         except ConnectionError as exc:
             module.fail_json(msg=to_text(exc, errors="surrogate_then_replace"))
         cfg = to_text(out, errors="surrogate_then_replace").strip()
-        _DEVICE_CONFIGS = cfg
-        return cfg
+    return cfg
+
+
+def clear_config_cache():
+    """
+    Drop the cached device configuration, the next get_config
+    fetches it again from the device.
+    """
+    _DEVICE_CONFIGS.clear()
 
 
 def run_commands(module, commands, check_rc=True):
@@ -117,14 +140,22 @@ def run_commands(module, commands, check_rc=True):
     return response
 
 
-def load_config(module, commands, commit=False, comment=None):
+def load_config(module, commands, commit=False, comment=None, replace=None):
+    if not commit and module.check_mode and not module._diff and not replace:
+        # the commands of a dry run are computed from the running config,
+        # the device is only needed to compare them for the diff, while a
+        # replace has to be loaded on the device to tell what it changes
+        return None
+
     connection = get_connection(module)
 
     try:
         response = connection.edit_config(
-            candidate=commands, commit=commit, comment=comment
+            candidate=commands, commit=commit, replace=replace, comment=comment
         )
     except ConnectionError as exc:
         module.fail_json(msg=to_text(exc, errors="surrogate_then_replace"))
+    finally:
+        clear_config_cache()
 
     return response.get("diff")
@@ -37,6 +37,10 @@ notes:
 - This module works with connection C(network_cli). See L(the VyOS OS Platform Options,../network/user_guide/platform_vyos.html).
 - To ensure idempotency and correct diff the configuration lines in the relevant module options should be similar to how they
   appear if present in the running configuration on device including the indentation.
+- In check mode the commands are computed from the running configuration and are not
+  sent to the device. Only when the diff is requested are they loaded in a configuration
+  session, to get the device C(compare) output, and discarded. With C(replace=config)
+  the configuration is always loaded and discarded, as only the device can tell what it changes.
 options:
   lines:
     description:
@@ -67,6 +71,24 @@ options:
     choices:
     - line
     - none
+  replace:
+    description:
+    - Instructs the module on the way to perform the configuration on the device.
+      If the C(replace) argument is set to I(line) then the modified lines are
+      pushed to the device in configuration mode.  If the argument is set to
+      I(config) then the entire configuration given in C(src) or C(lines) is
+      uploaded to the device as one file, loaded in place of the active
+      configuration and committed, so that the lines absent from it are removed.
+    - With I(config) the configuration must be in the curly-brace format of
+      C(show configuration) and C(config.boot), the per-line comparison is
+      skipped and C(match) and C(config) are ignored. The configuration is
+      replaced as a whole, make sure that it keeps the device reachable.
+    type: str
+    default: line
+    choices:
+    - line
+    - config
+    version_added: 2.4.0
   backup:
     description:
     - The C(backup) argument will backup the current devices active configuration
@@ -147,6 +169,11 @@ EXAMPLES = """
       # - set int eth eth2 description 'OUTSIDE'
     - set interface ethernet eth2 description 'OUTSIDE'
 
+- name: replace the whole configuration with a rendered config.boot
+  vyos.vyos.vyos_config:
+    src: config.boot.j2
+    replace: config
+
 - name: configurable backup path
   vyos.vyos.vyos_config:
     backup: yes
@@ -206,6 +233,10 @@ from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.vyos import
     vyos_argument_spec,
     get_connection,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.config_diff import (
+    diff_commands,
+    find_set_command,
+)
 
 
 DEFAULT_COMMENT = "configured by vyos_config"
@@ -244,31 +275,7 @@ def format_commands(commands):
 
 
 def diff_config(commands, config):
-    config = [str(c).replace("'", "") for c in config.splitlines()]
-
-    updates = list()
-    visited = set()
-
-    for line in commands:
-        item = str(line).replace("'", "")
-
-        if not item.startswith("set") and not item.startswith("delete"):
-            raise ValueError("line must start with either `set` or `delete`")
-
-        elif item.startswith("set") and item not in config:
-            updates.append(line)
-
-        elif item.startswith("delete"):
-            if not config:
-                updates.append(line)
-            else:
-                item = re.sub(r"delete", "set", item)
-                for entry in config:
-                    if entry.startswith(item) and line not in visited:
-                        updates.append(line)
-                        visited.add(line)
-
-    return list(updates)
+    return diff_commands(commands, config)
 
 
 def sanitize_config(config, result):
@@ -284,6 +291,33 @@ def sanitize_config(config, result):
         del config[filter_index]
 
 
+def run_replace(module, result):
+    candidate = get_candidate(module)
+    command = find_set_command(candidate)
+    if command is not None:
+        module.fail_json(
+            msg="replace=config requires the configuration in the "
+            "curly-brace format, found: %s" % command
+        )
+
+    # the device compares the loaded configuration with the active one,
+    # there are no per-line commands to report
+    result["commands"] = []
+
+    diff = load_config(
+        module,
+        candidate,
+        commit=not module.check_mode,
+        comment=module.params["comment"],
+        replace=True,
+    )
+    if diff:
+        result["changed"] = True
+
+    if module._diff:
+        result["diff"] = {"prepared": diff}
+
+
 def run(module, result):
     # get the current active config from the node or passed in via
     # the config param
@@ -333,6 +367,7 @@ def main():
         src=dict(type="path"),
         lines=dict(type="list", elements="str"),
         match=dict(default="line", choices=["line", "none"]),
+        replace=dict(default="line", choices=["line", "config"]),
         comment=dict(default=DEFAULT_COMMENT),
         config=dict(),
         backup=dict(type="bool", default=False),
@@ -357,7 +392,11 @@ def main():
     if module.params["backup"]:
         result["__backup__"] = get_config(module=module)
 
-    if any((module.params["src"], module.params["lines"])):
+    if module.params["replace"] == "config":
+        if not any((module.params["src"], module.params["lines"])):
+            module.fail_json(msg="replace=config requires src or lines")
+        run_replace(module, result)
+    elif any((module.params["src"], module.params["lines"])):
         run(module, result)
 
     if module.params["save"]:
@@ -368,8 +407,10 @@ def main():
             result["changed"] = True
         run_commands(module, commands=["exit"])
 
-    if result.get("changed") and any(
-        (module.params["src"], module.params["lines"])
+    if (
+        result.get("changed")
+        and module.params["replace"] == "line"
+        and any((module.params["src"], module.params["lines"]))
     ):
         msg = (
             "To ensure idempotency and correct diff the input configuration lines should be"
@@ -29,6 +29,9 @@ extends_documentation_fragment:
 notes:
 - Tested against VyOS 1.1.8 (helium).
 - This module works with connection C(network_cli). See L(the VyOS OS Platform Options,../network/user_guide/platform_vyos.html).
+- The network resource facts parsed from the configuration are conformed to the
+  argspec of their resource without being validated, set the C(ANSIBLE_VYOS_FACTS_STRICT)
+  environment variable to a true value to validate them.
 options:
   gather_subset:
     description:
@@ -56,6 +59,14 @@ options:
     description: When 'True' a list of network resources for which resource modules are available will be provided.
     type: bool
     default: false
+  timing:
+    description:
+    - When 'True' the time spent gathering each network resource is returned in
+      C(vyos_facts_timing), along with the size of the configuration it is parsed
+      from and the time spent in its fetch, parse and validate phases.
+    type: bool
+    default: false
+    version_added: 2.4.0
 """
 
 EXAMPLES = """
@@ -136,6 +147,30 @@ ansible_net_gather_network_resources:
   description: The list of fact resource subsets collected from the device
   returned: always
   type: list
+vyos_facts_timing:
+  description:
+  - The time in seconds spent gathering the facts. C(resources) holds for each
+    network resource its wall time, the bytes and lines of the configuration it
+    is parsed from, whether that configuration was fetched from the device and
+    the time spent in the C(fetch), C(parse) and C(validate) phases.
+    C(cached) lists the network resources whose facts were reused from the
+    facts cache of the connection when it is enabled.
+  returned: when timing is enabled
+  type: dict
+  sample:
+    total: 0.2118
+    legacy:
+      wall_time: 0.0841
+    resources:
+      interfaces:
+        wall_time: 0.0523
+        bytes: 8412
+        lines: 121
+        fetched: true
+        phases:
+          fetch: 0.0411
+          parse: 0.0087
+          validate: 0.0025
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -146,6 +181,51 @@ from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.facts
     Facts,
     FACT_RESOURCE_SUBSETS,
 )
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.bgp_address_family import (  # noqa: F401
+    bgp_address_family,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.bgp_global import (  # noqa: F401
+    bgp_global,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.firewall_global import (  # noqa: F401
+    firewall_global,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.firewall_interfaces import (  # noqa: F401
+    firewall_interfaces,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.firewall_rules import (  # noqa: F401
+    firewall_rules,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.interfaces import (  # noqa: F401
+    interfaces,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.l3_interfaces import (  # noqa: F401
+    l3_interfaces,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.lag_interfaces import (  # noqa: F401
+    lag_interfaces,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.lldp_global import (  # noqa: F401
+    lldp_global,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.lldp_interfaces import (  # noqa: F401
+    lldp_interfaces,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.ospf_interfaces import (  # noqa: F401
+    ospf_interfaces,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.ospfv2 import (  # noqa: F401
+    ospfv2,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.ospfv3 import (  # noqa: F401
+    ospfv3,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.route_maps import (  # noqa: F401
+    route_maps,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.static_routes import (  # noqa: F401
+    static_routes,
+)
 from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.vyos import (
     vyos_argument_spec,
 )
@@ -175,11 +255,18 @@ def main():
         ansible_facts["available_network_resources"] = sorted(
             FACT_RESOURCE_SUBSETS.keys()
         )
-    result = Facts(module).get_facts()
+    facts = Facts(module)
+    result = facts.get_facts()
     additional_facts, additional_warnings = result
     ansible_facts.update(additional_facts)
     warnings.extend(additional_warnings)
 
+    if module.params.get("timing"):
+        module.exit_json(
+            ansible_facts=ansible_facts,
+            warnings=warnings,
+            vyos_facts_timing=facts.get_timing(),
+        )
     module.exit_json(ansible_facts=ansible_facts, warnings=warnings)
 
 
@@ -414,6 +414,17 @@ options:
     - rendered
     - parsed
     default: merged
+  verify_after:
+    description:
+    - Gather the configuration from the device again once the changes are
+      applied, to report the I(after) state.
+    - When set to C(false), the I(after) state is computed by applying the
+      generated commands to the configuration read for the I(before) state,
+      which saves gathering the facts a second time. In check mode it then
+      shows the expected configuration.
+    type: bool
+    default: true
+    version_added: 2.4.0
 
 """
 EXAMPLES = """
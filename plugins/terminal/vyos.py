@@ -74,3 +74,21 @@ class TerminalModule(TerminalBase):
             )
         except AnsibleConnectionFailure:
             raise AnsibleConnectionFailure("unable to set terminal parameters")
+
+    def on_close_shell(self):
+        # the changes left pending by the deferred commits are discarded
+        # when the connection is closed, a play or a task may have failed
+        # before all of them were loaded
+        cliconf = getattr(self._connection, "cliconf", None)
+        if cliconf is not None and hasattr(cliconf, "discard_deferred"):
+            try:
+                diff = cliconf.discard_deferred()
+            except AnsibleConnectionFailure as exc:
+                self._connection.queue_message("warning", "%s" % exc)
+            else:
+                if diff:
+                    self._connection.queue_message(
+                        "warning",
+                        "the deferred changes were not committed and are "
+                        "discarded:\n%s" % diff,
+                    )
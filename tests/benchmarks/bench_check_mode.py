@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark the check mode of vyos_config, where the commands computed from
+the running configuration were loaded in a configuration session and
+discarded, against the offline dry run, on the local fake VyOS shell.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+
+from ansible_collections.vyos.vyos.plugins.cliconf.vyos import Cliconf
+from ansible_collections.vyos.vyos.tests.benchmarks.bench_edit_config import (
+    FakeVyosShell,
+    candidate,
+)
+from ansible_collections.vyos.vyos.tests.benchmarks.common import (
+    best_of,
+    report,
+    synthetic_config,
+)
+
+
+def dry_run(cliconf, lines, running, load):
+    commands = cliconf.get_diff(candidate="\n".join(lines), running=running)[
+        "config_diff"
+    ]
+    if load:
+        cliconf.edit_config(commands, commit=False)
+    return commands
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=10000)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.002,
+        help="seconds charged for every round trip to the fake device",
+    )
+    parser.add_argument(
+        "--per-line",
+        type=float,
+        default=0.00002,
+        help="seconds charged for every line processed by the fake device",
+    )
+    args = parser.parse_args()
+
+    running = synthetic_config(args.lines)
+    lines = candidate(args.lines)
+    rows = []
+    for name, load in (("configure session", True), ("offline", False)):
+        shell = FakeVyosShell(args.latency, args.per_line)
+        cliconf = Cliconf(shell)
+        elapsed = best_of(dry_run, cliconf, lines, running, load, repeat=1)
+        rows.append([name, shell.round_trips, "%.4fs" % elapsed])
+    report(
+        "check mode of %d lines, %.1fms round trip"
+        % (len(lines), args.latency * 1000),
+        ["dry run", "round trips", "time"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
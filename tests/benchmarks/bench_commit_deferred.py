@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark the configuration of several tasks committed one by one against
+the deferred commits of the cliconf plugin, on the local fake VyOS shell
+that also charges the time the device spends in a commit.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import time
+
+from ansible_collections.vyos.vyos.plugins.cliconf.vyos import Cliconf
+from ansible_collections.vyos.vyos.tests.benchmarks.bench_edit_config import (
+    FakeVyosShell,
+    candidate,
+)
+from ansible_collections.vyos.vyos.tests.benchmarks.common import report
+
+
+class CommittingVyosShell(FakeVyosShell):
+    """The fake VyOS shell, where a commit takes `commit_time` seconds."""
+
+    def __init__(self, latency, per_line, commit_time):
+        super(CommittingVyosShell, self).__init__(latency, per_line)
+        self.commit_time = commit_time
+        self.commits = 0
+
+    def send(self, command, sendonly=False, **kwargs):
+        if command.startswith(b"commit"):
+            self.commits += 1
+            time.sleep(self.commit_time)
+            self.changes = 0
+        if command == b"compare" and self.changes:
+            # the device lists every pending change
+            self._round_trip(1)
+            return "[edit]\n+ %d changes" % self.changes
+        return super(CommittingVyosShell, self).send(
+            command, sendonly=sendonly, **kwargs
+        )
+
+
+def run(tasks, deferred, args):
+    shell = CommittingVyosShell(args.latency, 0.0, args.commit_time)
+    cliconf = Cliconf(shell)
+    start = time.time()
+    if deferred:
+        cliconf.defer_commit(True)
+    for task in tasks:
+        resp = cliconf.edit_config(task)
+        if "diff" not in resp:
+            raise AssertionError("a task did not report its changes")
+    # the last task of the play is run with the deferred commits disabled
+    cliconf.defer_commit(False)
+    elapsed = time.time() - start
+    return [
+        "deferred" if deferred else "per task",
+        shell.commits,
+        shell.round_trips,
+        "%.4fs" % elapsed,
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=12)
+    parser.add_argument("--lines", type=int, default=20)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.002,
+        help="seconds charged for every round trip to the fake device",
+    )
+    parser.add_argument(
+        "--commit-time",
+        type=float,
+        default=0.5,
+        help="seconds charged for every commit on the fake device",
+    )
+    args = parser.parse_args()
+
+    lines = candidate(args.tasks * args.lines)
+    tasks = []
+    for idx in range(0, len(lines), args.lines):
+        end = idx + args.lines
+        tasks.append(lines[idx:end])
+    report(
+        "%d tasks of %d lines, %.1fms round trip, %.1fs commit"
+        % (args.tasks, args.lines, args.latency * 1000, args.commit_time),
+        ["mode", "commits", "round trips", "time"],
+        [run(tasks, False, args), run(tasks, True, args)],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark the indexed config diff against the list scans it replaces,
+on synthetic 1k/10k/100k line running configurations with a candidate
+of `set` and `delete` commands a tenth of their size, and the computation
+of the configuration once the commands are applied.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import re
+
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.config_diff import (
+    apply_commands,
+    diff_commands,
+)
+from ansible_collections.vyos.vyos.tests.benchmarks.common import (
+    SIZES,
+    best_of,
+    fmt,
+    report,
+    synthetic_config,
+)
+
+
+def list_diff(commands, config):
+    """The list based diff used before the running config index."""
+    config = [str(c).replace("'", "") for c in config.splitlines()]
+
+    updates = list()
+    visited = set()
+
+    for line in commands:
+        item = str(line).replace("'", "")
+        if item.startswith("set") and item not in config:
+            updates.append(line)
+        elif item.startswith("delete"):
+            if not config:
+                updates.append(line)
+            else:
+                item = re.sub(r"delete", "set", item)
+                for entry in config:
+                    if entry.startswith(item) and line not in visited:
+                        updates.append(line)
+                        visited.add(line)
+    return updates
+
+
+def candidate(running):
+    """Every tenth line changed, every twentieth line of the rest deleted."""
+    commands = []
+    for idx, line in enumerate(running.splitlines()):
+        if idx % 10 == 0:
+            commands.append(line.replace("'", "'x"))
+        elif idx % 20 == 5:
+            commands.append("delete" + line[3:].rsplit(" ", 1)[0])
+    return commands
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--list-max",
+        type=int,
+        default=10000,
+        help="largest config size to run the quadratic list scans on",
+    )
+    args = parser.parse_args()
+
+    rows = []
+    for size in SIZES:
+        running = synthetic_config(size)
+        commands = candidate(running)
+        updates = diff_commands(commands, running)
+        legacy = None
+        if size <= args.list_max:
+            assert list_diff(commands, running) == updates
+            legacy = best_of(list_diff, commands, running, repeat=1)
+        rows.append(
+            [
+                size,
+                len(commands),
+                len(updates),
+                fmt(legacy),
+                fmt(best_of(diff_commands, commands, running)),
+            ]
+        )
+    report(
+        "vyos_config diff",
+        ["lines", "candidate", "updates", "list scan", "indexed"],
+        rows,
+    )
+
+    rows = []
+    for size in SIZES:
+        running = synthetic_config(size)
+        commands = candidate(running)
+        rows.append(
+            [
+                size,
+                len(commands),
+                fmt(
+                    best_of(
+                        apply_commands, running, commands, ("name", "rule")
+                    )
+                ),
+            ]
+        )
+    report("apply_commands", ["lines", "commands", "path trie"], rows)
+
+
+if __name__ == "__main__":
+    main()
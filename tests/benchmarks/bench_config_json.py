@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark the config tree built from the json configuration against the
+one tokenized from the `set` commands, and the static_routes and lldp fact
+gathering from both, on synthetic 1k/10k/100k line configurations. The
+facts gathered from both are checked to be the same.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import json
+from collections import OrderedDict
+
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.config_tree import (
+    ConfigTree,
+    JsonConfigTree,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.static_routes.static_routes import (
+    Static_routesFacts,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.lldp_global.lldp_global import (
+    Lldp_globalFacts,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.lldp_interfaces.lldp_interfaces import (
+    Lldp_interfacesFacts,
+)
+from ansible_collections.vyos.vyos.tests.benchmarks.common import (
+    SIZES,
+    best_of,
+    fmt,
+    report,
+    synthetic_config,
+)
+
+
+def to_json(node):
+    """
+    The json configuration of a config tree node, the way the device emits
+    it: a node with a single valueless child is a leaf holding its value.
+    """
+    if not node.children:
+        return {}
+    children = list(node.children.items())
+    if len(children) == 1 and not children[0][1].children:
+        return children[0][0]
+    return OrderedDict((key, to_json(child)) for key, child in children)
+
+
+def gather(data):
+    facts = {"ansible_network_resources": {}}
+    for cls in (Static_routesFacts, Lldp_globalFacts, Lldp_interfacesFacts):
+        cls(None).populate_facts(None, facts, data)
+    return facts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="*", default=SIZES)
+    args = parser.parse_args()
+
+    rows = []
+    for size in args.sizes:
+        data = synthetic_config(size)
+        data_json = json.dumps(to_json(ConfigTree(data).root))
+        if gather(data) != gather(data_json):
+            raise AssertionError("%d lines: facts differ" % size)
+        rows.append(
+            [
+                size,
+                fmt(best_of(ConfigTree, data)),
+                fmt(best_of(JsonConfigTree, data_json)),
+                fmt(best_of(gather, data, repeat=1)),
+                fmt(best_of(gather, data_json, repeat=1)),
+            ]
+        )
+    report(
+        "config tree from set commands and from json",
+        ["lines", "set tree", "json tree", "set gather", "json gather"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark the tokenized config tree against the per-resource regex scans
+it replaces, on synthetic 1k/10k/100k line configurations.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+from re import findall, M
+
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.config_tree import (
+    ConfigTree,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.static_routes.static_routes import (
+    Static_routesFacts,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.lldp_interfaces.lldp_interfaces import (
+    Lldp_interfacesFacts,
+)
+from ansible_collections.vyos.vyos.tests.benchmarks.common import (
+    SIZES,
+    best_of,
+    fmt,
+    report,
+    synthetic_config,
+)
+
+
+def regex_subtrees(data):
+    """The per-route and per-interface rescans used before the config tree."""
+    for route in set(
+        findall(r"set protocols static route(6)? (\S+)", data, M)
+    ):
+        findall(r" %s .+$" % route[1], data, M)
+    for lldp in set(findall(r"^set service lldp interface (\S+)", data, M)):
+        findall(r" %s .+$" % lldp, data, M)
+
+
+def tree_subtrees(data):
+    tree = ConfigTree(data)
+    for route_type in ("route", "route6"):
+        path = ["protocols", "static", route_type]
+        for dest in tree.children(path):
+            tree.lines(path + [dest])
+    path = ["service", "lldp", "interface"]
+    for lldp in tree.children(path):
+        tree.lines(path + [lldp])
+
+
+def gather(data):
+    facts = {"ansible_network_resources": {}}
+    for cls in (Static_routesFacts, Lldp_interfacesFacts):
+        cls(None).populate_facts(None, facts, data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--regex-max",
+        type=int,
+        default=10000,
+        help="largest config size to run the quadratic regex scans on",
+    )
+    args = parser.parse_args()
+
+    rows = []
+    for size in SIZES:
+        data = synthetic_config(size)
+        regex = None
+        if size <= args.regex_max:
+            regex = best_of(regex_subtrees, data, repeat=1)
+        rows.append(
+            [
+                size,
+                fmt(regex),
+                fmt(best_of(tree_subtrees, data)),
+                fmt(best_of(gather, data, repeat=1)),
+            ]
+        )
+    report(
+        "static_routes + lldp_interfaces subtree extraction",
+        ["lines", "regex scan", "config tree", "gather"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark the configuration loading of the cliconf plugin, line by line
+against batched pastes, on a local fake VyOS shell that charges a fixed
+round-trip latency for every write and read.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import time
+
+from ansible_collections.vyos.vyos.plugins.cliconf.vyos import Cliconf
+from ansible_collections.vyos.vyos.tests.benchmarks.common import (
+    best_of,
+    report,
+)
+
+
+class FakeVyosShell(object):
+    """
+    A stand-in for the network_cli connection of a VyOS device in
+    configuration mode. Every line gets its `[edit]` acknowledgement and
+    a round trip costs `latency` seconds plus `per_line` per line.
+    """
+
+    def __init__(self, latency, per_line):
+        self.latency = latency
+        self.per_line = per_line
+        self.round_trips = 0
+        self.changes = 0
+        self._pending = []
+
+    def _round_trip(self, lines):
+        self.round_trips += 1
+        time.sleep(self.latency + self.per_line * lines)
+
+    def send(self, command, sendonly=False, **kwargs):
+        lines = command.decode().split("\n")
+        self._round_trip(len(lines))
+        out = []
+        for line in lines:
+            if line == "compare":
+                out.append("[edit]" if self.changes else "No changes")
+            elif line.startswith(("set ", "delete ")):
+                self.changes += 1
+                out.append("[edit]")
+            elif line in ("exit", "exit discard"):
+                self.changes = 0
+        if sendonly:
+            return None
+        # the device answers the first line before the rest of the paste
+        # is echoed, the remainder is left for receive()
+        self._pending = out[1:]
+        return "\n".join(out[:1])
+
+    def receive(self, *args, **kwargs):
+        self._round_trip(0)
+        out, self._pending = self._pending, []
+        return "\n".join(out)
+
+    def get_prompt(self):
+        return b"vyos@vyos:~$ "
+
+
+class BatchedCliconf(Cliconf):
+    def __init__(self, connection, batch_size):
+        super(BatchedCliconf, self).__init__(connection)
+        self._batch_size = batch_size
+
+    def _config_batch_size(self):
+        return self._batch_size
+
+
+def candidate(lines):
+    return [
+        "set interfaces ethernet eth%d vif %d description 'vlan %d'"
+        % (idx // 4000, idx % 4000 + 1, idx)
+        for idx in range(lines)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=2000)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.002,
+        help="seconds charged for every round trip to the fake device",
+    )
+    parser.add_argument(
+        "--per-line",
+        type=float,
+        default=0.00002,
+        help="seconds charged for every line processed by the fake device",
+    )
+    args = parser.parse_args()
+
+    lines = candidate(args.lines)
+    rows = []
+    for batch_size in (1, 10, 50, 200, 1000):
+        shell = FakeVyosShell(args.latency, args.per_line)
+        cliconf = BatchedCliconf(shell, batch_size)
+        elapsed = best_of(cliconf.edit_config, lines, commit=False, repeat=1)
+        rows.append(
+            [
+                batch_size,
+                shell.round_trips,
+                "%.4fs" % elapsed,
+                "%d" % (len(lines) / elapsed),
+            ]
+        )
+    report(
+        "edit_config of %d lines, %.1fms round trip"
+        % (len(lines), args.latency * 1000),
+        ["batch size", "round trips", "time", "lines/s"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark the validation of the firewall_rules and route_maps facts: the
+former validation, that generated the spec of the resource and validated
+the facts as module arguments for every fact class instance, against the
+strict validation with the cached validator and the conforming of the
+facts the parsers produced, and check that they give the same facts.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+from copy import deepcopy
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
+    utils,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.firewall_rules.firewall_rules import (
+    Firewall_rulesFacts,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.route_maps.route_maps import (
+    Route_mapsFacts,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils import (
+    spec,
+)
+from ansible_collections.vyos.vyos.tests.benchmarks.bench_firewall_rules_facts import (
+    firewall_config,
+)
+from ansible_collections.vyos.vyos.tests.benchmarks.bench_route_maps_facts import (
+    route_map_config,
+)
+from ansible_collections.vyos.vyos.tests.benchmarks.common import (
+    best_of,
+    fmt,
+    report,
+)
+
+RULES = (1000, 10000)
+
+RESOURCES = (
+    ("firewall_rules", Firewall_rulesFacts, firewall_config, (1000,)),
+    ("route_maps", Route_mapsFacts, route_map_config, ()),
+)
+
+
+class Module(object):
+    """The parameters of a module run, without a device connection."""
+
+    params = {}
+
+
+def parsed(facts_class, data):
+    """The facts of a resource as its parser produced them."""
+    captured = []
+
+    def capture(argument_spec, data, module=None, redact=False):
+        captured.append(deepcopy(data))
+        return spec.validate_facts(argument_spec, data, module, redact)
+
+    module = __import__(facts_class.__module__, fromlist=["validate_facts"])
+    module.validate_facts = capture
+    try:
+        facts_class(Module()).populate_facts(
+            None, {"ansible_network_resources": {}}, data
+        )
+    finally:
+        module.validate_facts = spec.validate_facts
+    return captured[0]
+
+
+def former(argument_spec, data):
+    facts_spec = deepcopy(argument_spec)["config"]["options"]
+    utils.generate_dict(facts_spec)
+    return utils.validate_config(argument_spec, data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rules", type=int, nargs="*", default=RULES)
+    args = parser.parse_args()
+
+    rows = []
+    for name, facts_class, config, config_args in RESOURCES:
+        argument_spec = facts_class(Module()).argument_spec
+        conformer = spec.SpecConformer(argument_spec)
+        for rules in args.rules:
+            data = parsed(facts_class, config(rules, *config_args))
+            expected = utils.remove_empties(former(argument_spec, data))
+            for result in (
+                spec._validate(argument_spec, data),
+                conformer(data),
+            ):
+                if utils.remove_empties(result) != expected:
+                    raise AssertionError(
+                        "%s, %d rules: facts differ" % (name, rules)
+                    )
+            rows.append(
+                [
+                    name,
+                    rules,
+                    fmt(best_of(former, argument_spec, data)),
+                    fmt(best_of(spec._validate, argument_spec, data)),
+                    fmt(best_of(conformer, data)),
+                ]
+            )
+    report(
+        "facts validation",
+        ["resource", "rules", "former", "strict", "conform"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
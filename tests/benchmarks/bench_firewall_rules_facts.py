@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark the firewall_rules fact gathering, that buckets the lines by
+rule-set and rule in one pass, against the former gathering that searched
+the whole configuration for every rule-set and the rule-set for every rule.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+from re import findall, M
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
+    utils,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.firewall_rules.firewall_rules import (
+    Firewall_rulesFacts,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.profiler import (
+    FactsProfiler,
+)
+from ansible_collections.vyos.vyos.tests.benchmarks.common import (
+    best_of,
+    fmt,
+    report,
+)
+
+RULES = (1000, 3000, 30000)
+# the former gathering is quadratic, it is only run up to this many rules
+SEARCH_MAX = 3000
+
+
+def firewall_config(rules, per_set):
+    """
+    Generate the `set` lines of ipv4 and ipv6 rule-sets of `per_set` rules
+    each, for `rules` rules in total with most of the rule attributes.
+    """
+    lines = []
+    for idx in range(rules):
+        number = (idx % per_set + 1) * 10
+        if idx % 4 == 3:
+            name = "set firewall ipv6-name V6-SET-%d " % (idx // per_set)
+            address = "2001:db8:%x::/64" % idx
+        else:
+            name = "set firewall name V4-SET-%d " % (idx // per_set)
+            address = "10.%d.%d.0/24" % ((idx // 256) % 256, idx % 256)
+        if number <= 40:
+            lines.extend(
+                [
+                    name + "default-action 'drop'",
+                    name + "description 'set %d'" % (idx // per_set),
+                    name + "enable-default-log",
+                ]
+            )
+        prefix = name + "rule %d " % number
+        lines.extend(
+            [
+                prefix + "action '%s'" % ("accept", "drop")[idx % 2],
+                prefix + "description 'host %d'" % idx,
+                prefix + "protocol 'tcp'",
+                prefix + "source address '%s'" % address,
+                prefix + "destination port '%d'" % (1024 + idx % 1000),
+                prefix + "destination group address-group 'AG-%d'" % idx,
+                prefix + "state established 'enable'",
+                prefix + "state new 'disable'",
+                prefix + "tcp flags 'SYN'",
+                prefix + "recent count '%d'" % (idx % 10 + 1),
+                prefix + "limit rate '%d/second'" % (idx % 50 + 1),
+            ]
+        )
+        if idx % 10 == 0:
+            lines.append(prefix + "disabled")
+    return "\n".join(lines)
+
+
+class LegacyFirewall_rulesFacts(Firewall_rulesFacts):
+    """The former firewall_rules parsing, kept to compare against."""
+
+    def get_objs(self, data):
+        objs = []
+        v6_rules = findall(
+            r"^set firewall ipv6-name (?:\'*)(\S+)(?:\'*)", data, M
+        )
+        v4_rules = findall(r"^set firewall name (?:\'*)(\S+)(?:\'*)", data, M)
+        if v6_rules:
+            config = self.get_legacy_rules(data, v6_rules, type="ipv6")
+            if config:
+                objs.append(utils.remove_empties(config))
+        if v4_rules:
+            config = self.get_legacy_rules(data, v4_rules, type="ipv4")
+            if config:
+                objs.append(utils.remove_empties(config))
+        return objs
+
+    def get_legacy_rules(self, data, rules, type):
+        r_lst = []
+        for r in set(rules):
+            rule_regex = r" %s .+$" % r.strip("'")
+            cfg = findall(rule_regex, data, M)
+            conf = "\n".join(filter(lambda x: x, cfg))
+            fr = self.render_config([conf], r.strip("'"))
+            fr["rules"] = self.legacy_rules_lst(conf)
+            fr["name"] = r.strip("'")
+            r_lst.append(fr)
+        return {"afi": type, "rule_sets": r_lst}
+
+    def legacy_rules_lst(self, conf):
+        r_lst = []
+        rules = findall(r"rule (?:\'*)(\d+)(?:\'*)", conf, M)
+        if rules:
+            rules_lst = []
+            for r in set(rules):
+                r_regex = r" %s .+$" % r
+                cfg = "\n".join(findall(r_regex, conf, M))
+                obj = self.parse_rules(cfg)
+                obj["number"] = int(r)
+                if obj:
+                    rules_lst.append(obj)
+            r_lst = sorted(rules_lst, key=lambda i: i["number"])
+        return r_lst
+
+
+class Module(object):
+    """The parameters of a module run, without a device connection."""
+
+    params = {}
+
+
+def facts(data, legacy, profiler=None):
+    if legacy:
+        objs = LegacyFirewall_rulesFacts(Module()).get_objs(data)
+    else:
+        facts_obj = Firewall_rulesFacts(Module())
+        if profiler is not None:
+            facts_obj._timer = profiler.timer("firewall_rules")
+        ansible_facts = {"ansible_network_resources": {}}
+        facts_obj.populate_facts(None, ansible_facts, data)
+        return ansible_facts["ansible_network_resources"]["firewall_rules"]
+    return [
+        utils.remove_empties(cfg)
+        for cfg in utils.validate_config(
+            Firewall_rulesFacts(Module()).argument_spec, {"config": objs}
+        )["config"]
+    ]
+
+
+def by_name(config):
+    """The rule-sets sorted by name, the former order was a set order."""
+    for afi in config:
+        afi["rule_sets"].sort(key=lambda i: i["name"])
+    return config
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rules",
+        type=int,
+        nargs="*",
+        default=RULES,
+        help="number of firewall rules",
+    )
+    parser.add_argument(
+        "--per-set", type=int, default=1000, help="rules per rule-set"
+    )
+    parser.add_argument("--search-max", type=int, default=SEARCH_MAX)
+    args = parser.parse_args()
+
+    rows = []
+    for rules in args.rules:
+        data = firewall_config(rules, args.per_set)
+        searched = None
+        if rules <= args.search_max:
+            if by_name(facts(data, False)) != by_name(facts(data, True)):
+                raise AssertionError("%d rules: facts differ" % rules)
+            searched = best_of(facts, data, True, repeat=1)
+        profiler = FactsProfiler()
+        facts(data, False, profiler)
+        phases = profiler.report()["resources"]["firewall_rules"]["phases"]
+        rows.append(
+            [
+                rules,
+                data.count("\n") + 1,
+                fmt(searched),
+                fmt(best_of(facts, data, False, repeat=1)),
+                fmt(phases["parse"]),
+                fmt(phases["validate"]),
+            ]
+        )
+    report(
+        "firewall_rules facts, %d rules per rule-set" % args.per_set,
+        ["rules", "lines", "searched", "bucketed", "parse", "validate"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
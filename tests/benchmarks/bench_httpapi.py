@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark the configuration loading of the httpapi plugin, on a local
+stand-in of the VyOS HTTP API, against the cliconf plugin over the fake
+VyOS shell, line by line and batched. Both devices charge the same
+round-trip latency and the same time for every configuration line.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+
+from ansible_collections.vyos.vyos.plugins.httpapi.vyos import HttpApi
+from ansible_collections.vyos.vyos.tests.benchmarks.bench_edit_config import (
+    BatchedCliconf,
+    FakeVyosShell,
+    candidate,
+)
+from ansible_collections.vyos.vyos.tests.benchmarks.common import (
+    best_of,
+    report,
+)
+from ansible_collections.vyos.vyos.tests.unit.plugins.httpapi.vyos_api_server import (
+    HttpApiConnection,
+    VyosApiServer,
+)
+
+
+def row(name, round_trips, lines, elapsed):
+    return [name, round_trips, "%.4fs" % elapsed, "%d" % (lines / elapsed)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=2000)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.002,
+        help="seconds charged for every round trip to the fake devices",
+    )
+    parser.add_argument(
+        "--per-line",
+        type=float,
+        default=0.00002,
+        help="seconds charged for every line processed by the fake devices",
+    )
+    args = parser.parse_args()
+
+    lines = candidate(args.lines)
+    rows = []
+    for batch_size in (1, 200):
+        shell = FakeVyosShell(args.latency, args.per_line)
+        cliconf = BatchedCliconf(shell, batch_size)
+        elapsed = best_of(cliconf.edit_config, lines, repeat=1)
+        rows.append(
+            row(
+                "cliconf, batch size %d" % batch_size,
+                shell.round_trips,
+                len(lines),
+                elapsed,
+            )
+        )
+
+    server = VyosApiServer(
+        ["set system host-name 'vyos'"],
+        latency=args.latency,
+        per_op=args.per_line,
+    ).start()
+    try:
+        connection = HttpApiConnection(server.url)
+        httpapi = HttpApi(connection)
+        connection.httpapi = httpapi
+        httpapi.login("vyos", None)
+        elapsed = best_of(httpapi.edit_config, lines, repeat=1)
+        if len(server.lines()) != len(lines) + 1:
+            raise AssertionError("the http api did not load every line")
+        rows.append(row("httpapi", len(server.requests), len(lines), elapsed))
+    finally:
+        server.stop()
+
+    report(
+        "edit_config of %d lines, %.1fms round trip"
+        % (len(lines), args.latency * 1000),
+        ["plugin", "round trips", "time", "lines/s"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark the gathering of the interface resource facts from the shared
+interface model on a router with 4,000 vifs, and check that the model is
+built once for all of the resources. The ospf_interfaces facts are left
+out, their template needs a device connection.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import time
+
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.facts import (
+    FACT_RESOURCE_SUBSETS,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils import (
+    interface_model,
+)
+from ansible_collections.vyos.vyos.tests.benchmarks.common import (
+    best_of,
+    fmt,
+    report,
+)
+
+RESOURCES = (
+    "interfaces",
+    "l3_interfaces",
+    "lag_interfaces",
+    "lldp_interfaces",
+    "firewall_interfaces",
+)
+
+
+def router_config(vifs, per_intf=100):
+    """
+    Generate the `set` lines of a router with `vifs` vifs spread over
+    ethernet interfaces of `per_intf` vifs each, and a bond for every
+    eight of them.
+    """
+    lines = []
+    for idx in range((vifs + per_intf - 1) // per_intf):
+        eth = "set interfaces ethernet eth%d " % idx
+        lines.extend(
+            [
+                eth + "description 'port %d'" % idx,
+                eth + "duplex 'auto'",
+                eth + "speed 'auto'",
+                eth + "mtu '9000'",
+                eth + "address '10.255.%d.1/24'" % idx,
+                eth + "firewall in name 'V4-IN'",
+                eth + "firewall local ipv6-name 'V6-LOCAL'",
+            ]
+        )
+        if idx % 4 == 3:
+            lines.append(eth + "bond-group 'bond%d'" % (idx // 8))
+        for vid in range(1, min(per_intf, vifs - idx * per_intf) + 1):
+            vif = eth + "vif %d " % vid
+            lines.extend(
+                [
+                    vif + "description 'vlan %d'" % vid,
+                    vif + "address '10.%d.%d.1/24'" % (idx, vid),
+                    vif + "address '2001:db8:%x:%x::1/64'" % (idx, vid),
+                    vif + "mtu '1500'",
+                ]
+            )
+        lines.append(
+            "set service lldp interface eth%d location elin '%010d'"
+            % (idx, idx)
+        )
+    for idx in range(vifs // per_intf // 8 + 1):
+        bond = "set interfaces bonding bond%d " % idx
+        lines.extend(
+            [
+                bond + "mode '802.3ad'",
+                bond + "hash-policy 'layer2'",
+                bond + "address '192.0.2.%d/30'" % (idx * 4 + 1),
+            ]
+        )
+    return "\n".join(lines)
+
+
+class Module(object):
+    """The parameters of a module run, without a device connection."""
+
+    params = {}
+
+
+def gather(data):
+    """Gather the facts of every resource, return the time each took."""
+    interface_model._MODEL_CACHE["model"] = None
+    models = set()
+    times = []
+    for resource in RESOURCES:
+        facts_obj = FACT_RESOURCE_SUBSETS[resource](Module())
+        ansible_facts = {"ansible_network_resources": {}}
+        start = time.time()
+        facts_obj.populate_facts(None, ansible_facts, data)
+        times.append(time.time() - start)
+        if interface_model._MODEL_CACHE["model"] is not None:
+            models.add(id(interface_model._MODEL_CACHE["model"]))
+    return times, len(models)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vifs", type=int, nargs="*", default=[4000])
+    args = parser.parse_args()
+
+    rows = []
+    for vifs in args.vifs:
+        data = router_config(vifs)
+        lines = [
+            line
+            for line in data.splitlines()
+            if line.startswith("set interfaces ")
+        ]
+        times, models = gather(data)
+        rows.append(
+            [vifs, data.count("\n") + 1]
+            + [fmt(elapsed) for elapsed in times]
+            + [
+                fmt(sum(times)),
+                fmt(best_of(interface_model.InterfaceModel, lines)),
+                models,
+            ]
+        )
+    report(
+        "interface resource facts",
+        ["vifs", "lines"] + list(RESOURCES) + ["total", "model", "built"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark the loading of the commands of a resource module overriding the
+vifs of the interfaces, with and without the redundant commands dropped,
+on the local fake VyOS shell, and the time taken to drop them.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.config_diff import (
+    minimize_commands,
+)
+from ansible_collections.vyos.vyos.tests.benchmarks.bench_edit_config import (
+    BatchedCliconf,
+    FakeVyosShell,
+)
+from ansible_collections.vyos.vyos.tests.benchmarks.common import (
+    SIZES,
+    best_of,
+    report,
+)
+
+
+class MinimizedCliconf(BatchedCliconf):
+    def _minimize_enabled(self):
+        return True
+
+
+def override_commands(vifs):
+    """
+    The attributes of every vif deleted one by one before the vif itself,
+    and every fourth vif configured again.
+    """
+    commands = []
+    for idx in range(vifs):
+        vif = "interfaces ethernet eth%d vif %d" % (idx // 4000, idx % 4000)
+        for attr in ("address", "description", "mtu"):
+            commands.append("delete %s %s" % (vif, attr))
+        commands.append("delete %s" % vif)
+        if idx % 4 == 0:
+            commands.append("set %s description 'vlan %d'" % (vif, idx))
+    return commands
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vifs", type=int, default=500)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.002,
+        help="seconds charged for every round trip to the fake device",
+    )
+    parser.add_argument(
+        "--per-line",
+        type=float,
+        default=0.00002,
+        help="seconds charged for every line processed by the fake device",
+    )
+    args = parser.parse_args()
+
+    commands = override_commands(args.vifs)
+    rows = []
+    for batch_size in (1, 200):
+        for cls in (BatchedCliconf, MinimizedCliconf):
+            shell = FakeVyosShell(args.latency, args.per_line)
+            cliconf = cls(shell, batch_size)
+            elapsed = best_of(
+                cliconf.edit_config, commands, commit=False, repeat=1
+            )
+            rows.append(
+                [
+                    batch_size,
+                    "yes" if cls is MinimizedCliconf else "no",
+                    len(
+                        cliconf._minimize_config(commands)
+                        if cls is MinimizedCliconf
+                        else commands
+                    ),
+                    shell.round_trips,
+                    "%.4fs" % elapsed,
+                ]
+            )
+    report(
+        "edit_config of %d commands, %.1fms round trip"
+        % (len(commands), args.latency * 1000),
+        ["batch size", "minimized", "lines", "round trips", "time"],
+        rows,
+    )
+
+    rows = []
+    for size in SIZES:
+        commands = override_commands(size // 5)
+        rows.append(
+            [
+                len(commands),
+                len(minimize_commands(commands)),
+                "%.4fs" % best_of(minimize_commands, commands),
+            ]
+        )
+    report("minimize_commands", ["commands", "kept", "time"], rows)
+
+
+if __name__ == "__main__":
+    main()
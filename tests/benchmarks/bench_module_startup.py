@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark the startup of every module of the collection: the size of the
+AnsiballZ payload built for it, with the number of module_utils files it
+ships, and the time a fresh interpreter takes to import it.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import ast
+import importlib.util
+import io
+import os
+import subprocess
+import sys
+import zipfile
+
+from ansible_collections.vyos.vyos.tests.benchmarks.common import (
+    fmt,
+    report,
+)
+
+MODULES = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "..",
+    "plugins",
+    "modules",
+)
+PACKAGE = "ansible_collections.vyos.vyos.plugins.modules"
+
+IMPORT_SCRIPT = """
+import time
+start = time.time()
+import %s
+print(time.time() - start)
+"""
+
+
+def imports(data):
+    """
+    The names imported from ansible.module_utils and ansible_collections
+    by the import statements of a module, at any nesting level, the way
+    the payload builder finds them.
+    """
+    for node in ast.walk(ast.parse(data)):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names = [
+                "%s.%s" % (node.module, alias.name) for alias in node.names
+            ]
+        else:
+            continue
+        for name in names:
+            if name.startswith(
+                ("ansible.module_utils.", "ansible_collections.")
+            ):
+                yield name.split(".")
+
+
+def locate(names):
+    """
+    Find the python module an import refers to, the last names may be the
+    attributes imported from it.
+    :return: module name and spec, or None.
+    """
+    for end in range(len(names), 0, -1):
+        name = ".".join(names[:end])
+        try:
+            spec = importlib.util.find_spec(name)
+        except (ImportError, AttributeError, ValueError):
+            spec = None
+        if spec is not None and spec.origin and spec.origin.endswith(".py"):
+            return name, spec
+    return None
+
+
+def payload(name):
+    """
+    Collect the module_utils files the AnsiballZ payload of a module ships,
+    following the imports the way the payload builder does: every import
+    statement of a module_utils file counts, at any nesting level.
+    :return: compressed size in bytes and number of files.
+    """
+    pending = [os.path.join(MODULES, name + ".py")]
+    files = {}
+    while pending:
+        path = pending.pop()
+        if path in files:
+            continue
+        with open(path, "rb") as f:
+            files[path] = f.read()
+        for names in imports(files[path]):
+            found = locate(names)
+            if found is None:
+                continue
+            module_name, spec = found
+            pending.append(spec.origin)
+            # the packages of the module are shipped with it
+            parts = module_name.split(".")
+            for end in range(2, len(parts)):
+                package = importlib.util.find_spec(".".join(parts[:end]))
+                if package.origin and package.origin.endswith(".py"):
+                    pending.append(package.origin)
+
+    out = io.BytesIO()
+    zf = zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED)
+    for path, data in files.items():
+        zf.writestr(path, data)
+    zf.close()
+    # the module itself is not a module_utils file
+    return len(out.getvalue()), len(files) - 1
+
+
+def import_time(module, repeat):
+    """Best time of a fresh interpreter to import a module."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    best = None
+    for _i in range(repeat):
+        out = subprocess.check_output(
+            [sys.executable, "-c", IMPORT_SCRIPT % module], env=env
+        )
+        elapsed = float(out.decode().strip().splitlines()[-1])
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modules", nargs="*")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    names = args.modules or sorted(
+        name[:-3]
+        for name in os.listdir(MODULES)
+        if name.startswith("vyos_") and name.endswith(".py")
+    )
+
+    baseline = import_time("ansible.module_utils.basic", args.repeat)
+    rows = []
+    totals = [0, 0]
+    for name in names:
+        size, count = payload(name)
+        totals[0] += size
+        totals[1] += count
+        rows.append(
+            [
+                name,
+                count,
+                "%.1fk" % (size / 1024.0),
+                fmt(import_time("%s.%s" % (PACKAGE, name), args.repeat)),
+            ]
+        )
+    rows.append(["total", totals[1], "%.1fk" % (totals[0] / 1024.0), ""])
+    report(
+        "module startup, ansible.module_utils.basic imports in %s"
+        % fmt(baseline),
+        ["module", "files", "payload", "import"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark the push of a full intended configuration with vyos_config, the
+per-line diff loaded in batches against the replace of the configuration
+uploaded in one transfer, on the local fake VyOS shell.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import time
+
+from ansible_collections.vyos.vyos.tests.benchmarks.bench_edit_config import (
+    BatchedCliconf,
+    FakeVyosShell,
+)
+from ansible_collections.vyos.vyos.tests.benchmarks.common import (
+    curly_config,
+    report,
+    synthetic_config,
+)
+
+
+class ReplacingVyosShell(FakeVyosShell):
+    """
+    The fake VyOS shell, where `load` charges `per_line` for every line of
+    the uploaded configuration and counts as a change.
+    """
+
+    def __init__(self, latency, per_line, config_lines):
+        super(ReplacingVyosShell, self).__init__(latency, per_line)
+        self.config_lines = config_lines
+
+    def send(self, command, sendonly=False, **kwargs):
+        if command.startswith(b"load "):
+            self._round_trip(self.config_lines)
+            self.changes += 1
+            return ""
+        return super(ReplacingVyosShell, self).send(
+            command, sendonly=sendonly, **kwargs
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=10000)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.002,
+        help="seconds charged for every round trip to the fake device",
+    )
+    parser.add_argument(
+        "--per-line",
+        type=float,
+        default=0.00002,
+        help="seconds charged for every line processed by the fake device",
+    )
+    args = parser.parse_args()
+
+    running = synthetic_config(args.lines)
+    # one description in ten changes and every hundredth line is stale
+    intended = []
+    stale = 0
+    for idx, line in enumerate(running.splitlines()):
+        if idx % 100 == 99:
+            stale += 1
+        elif idx % 80 == 0:
+            intended.append(line.replace("'port", "'uplink"))
+        else:
+            intended.append(line)
+    candidate = curly_config(intended)
+
+    rows = []
+    shell = ReplacingVyosShell(args.latency, args.per_line, len(intended))
+    cliconf = BatchedCliconf(shell, 200)
+    start = time.time()
+    commands = cliconf.get_diff(candidate=candidate, running=running)[
+        "config_diff"
+    ]
+    diffed = time.time() - start
+    cliconf.edit_config(commands)
+    elapsed = time.time() - start
+    rows.append(
+        [
+            "line, batch size 200",
+            len(commands),
+            shell.round_trips,
+            "%.4fs" % diffed,
+            "%.4fs" % elapsed,
+            stale,
+        ]
+    )
+
+    shell = ReplacingVyosShell(args.latency, args.per_line, len(intended))
+    cliconf = BatchedCliconf(shell, 200)
+    start = time.time()
+    cliconf.edit_config(candidate, replace=True)
+    elapsed = time.time() - start
+    rows.append(["config", 1, shell.round_trips, "-", "%.4fs" % elapsed, 0])
+
+    report(
+        "push of a %d line configuration, %.1fms round trip"
+        % (len(intended), args.latency * 1000),
+        ["replace", "commands", "round trips", "diff", "time", "stale left"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
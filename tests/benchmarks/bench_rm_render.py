@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark the compiled command renderers of the rm_templates against the
+netcommon render that goes through jinja for every command, generating the
+neighbor and route-map commands of a route-server configuration.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+from functools import partial
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.network_template import (
+    NetworkTemplate as NetworkTemplateBase,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.rm_templates.bgp_global import (
+    Bgp_globalTemplate,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.rm_templates.route_maps import (
+    Route_mapsTemplate,
+)
+from ansible_collections.vyos.vyos.tests.benchmarks.bench_rm_templates import (
+    route_server_config,
+)
+from ansible_collections.vyos.vyos.tests.benchmarks.common import (
+    best_of,
+    fmt,
+    report,
+)
+
+NEIGHBOR_PARSERS = (
+    "neighbor.remote_as",
+    "neighbor.description",
+    "neighbor.update_source",
+    "neighbor.ebgp_multihop",
+    "neighbor.timers",
+)
+ROUTE_MAP_PARSERS = ("action", "match_ip_address", "set_local_preference")
+
+
+def bgp_renders(neighbors):
+    parsed = Bgp_globalTemplate(lines=neighbors).parse()
+    return [
+        ({"as_number": parsed["as_number"], "neighbor": neighbor}, name)
+        for neighbor in parsed["neighbor"].values()
+        for name in NEIGHBOR_PARSERS
+    ]
+
+
+def route_map_renders(policy):
+    parsed = Route_mapsTemplate(lines=policy).parse()
+    renders = []
+    for route_map in parsed["route_maps"].values():
+        for entry in route_map["entries"].values():
+            data = dict(entry, route_map=route_map["route_map"])
+            renders.extend((data, name) for name in ROUTE_MAP_PARSERS)
+    return renders
+
+
+def jinja_render(tmplt, data, parser_name, negate=False):
+    """The netcommon render, with the netcommon parser lookup."""
+    parser = NetworkTemplateBase.get_parser(tmplt, parser_name)
+    if negate:
+        value = parser.get("remval") or parser["setval"]
+    else:
+        value = parser["setval"]
+    return NetworkTemplateBase._render(tmplt, value, data, negate)
+
+
+def render(template, renders, compiled):
+    tmplt = template(lines=[])
+    func = tmplt.render if compiled else partial(jinja_render, tmplt)
+    return [func(data, name) for data, name in renders] + [
+        func(data, name, True) for data, name in renders
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--neighbors", type=int, default=2000)
+    parser.add_argument("--route-maps", type=int, default=500)
+    args = parser.parse_args()
+
+    bgp, policy = route_server_config(args.neighbors, args.route_maps)
+    cases = [
+        (
+            "bgp_global",
+            Bgp_globalTemplate,
+            bgp_renders(
+                [line for line in bgp if "address-family" not in line]
+            ),
+        ),
+        ("route_maps", Route_mapsTemplate, route_map_renders(policy)),
+    ]
+
+    rows = []
+    for name, template, renders in cases:
+        if render(template, renders, True) != render(template, renders, False):
+            raise AssertionError("%s: compiled commands differ" % name)
+        rows.append(
+            [
+                name,
+                2 * len(renders),
+                fmt(best_of(render, template, renders, False, repeat=1)),
+                fmt(best_of(render, template, renders, True)),
+            ]
+        )
+    report(
+        "rm_templates render, %d neighbors and %d route-maps"
+        % (args.neighbors, args.route_maps),
+        ["template", "commands", "jinja", "compiled"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
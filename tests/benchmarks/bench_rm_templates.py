@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark the indexed parsers of the rm_templates against the netcommon
+parse that matches every line against every parser, on a route-server
+configuration with 2,000 BGP neighbors and 500 route-maps.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.network_template import (
+    NetworkTemplate as NetworkTemplateBase,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.rm_templates.bgp_global import (
+    Bgp_globalTemplate,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.rm_templates.bgp_address_family import (
+    Bgp_address_familyTemplate,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.rm_templates.route_maps import (
+    Route_mapsTemplate,
+)
+from ansible_collections.vyos.vyos.tests.benchmarks.common import (
+    best_of,
+    fmt,
+    report,
+)
+
+
+def route_server_config(neighbors, route_maps):
+    """
+    Generate the `set` lines of a route server with `neighbors` BGP
+    neighbors and `route_maps` route-maps of four rules each.
+    """
+    bgp = [
+        "set protocols bgp 65000 parameters router-id 192.0.2.1",
+        "set protocols bgp 65000 parameters log-neighbor-changes",
+    ]
+    for idx in range(neighbors):
+        addr = "10.%d.%d.%d" % (idx // 65536, (idx // 256) % 256, idx % 256)
+        route_map = "RM-%d" % (idx % route_maps)
+        prefix = "set protocols bgp 65000 neighbor %s " % addr
+        bgp.extend(
+            [
+                prefix + "remote-as %d" % (64512 + idx % 1000),
+                prefix + "description peer-%d" % idx,
+                prefix + "update-source 192.0.2.1",
+                prefix + "ebgp-multihop 2",
+                prefix + "timers holdtime 30",
+                prefix
+                + "address-family ipv4-unicast route-map import "
+                + route_map,
+                prefix
+                + "address-family ipv4-unicast route-map export "
+                + route_map,
+                prefix + "address-family ipv4-unicast route-server-client",
+                prefix
+                + "address-family ipv4-unicast soft-reconfiguration inbound",
+            ]
+        )
+    policy = []
+    for idx in range(route_maps):
+        prefix = "set policy route-map RM-%d " % idx
+        policy.append(prefix + "description map-%d" % idx)
+        for rule in range(1, 5):
+            rule_prefix = prefix + "rule %d " % (rule * 10)
+            policy.extend(
+                [
+                    rule_prefix + "action permit",
+                    rule_prefix + "match ip address prefix-list PL-%d" % rule,
+                    rule_prefix + "set local-preference %d" % (100 + rule),
+                    rule_prefix + "set community 65000:%d" % rule,
+                ]
+            )
+    return bgp, policy
+
+
+def parse(template, lines, indexed):
+    parser = template(lines=lines)
+    if indexed:
+        return parser.parse()
+    return NetworkTemplateBase.parse(parser)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--neighbors", type=int, default=2000)
+    parser.add_argument("--route-maps", type=int, default=500)
+    parser.add_argument(
+        "--every-parser-max",
+        type=int,
+        default=2000,
+        help="largest number of lines to run the netcommon parse on",
+    )
+    args = parser.parse_args()
+
+    bgp, policy = route_server_config(args.neighbors, args.route_maps)
+    bgp_global = [line for line in bgp if "address-family" not in line]
+    bgp_af = [line for line in bgp if "address-family" in line]
+    cases = [
+        ("bgp_global", Bgp_globalTemplate, bgp_global),
+        ("bgp_address_family", Bgp_address_familyTemplate, bgp_af),
+        ("route_maps", Route_mapsTemplate, policy),
+    ]
+
+    rows = []
+    for name, template, lines in cases:
+        for size in sorted(set([args.every_parser_max, len(lines)])):
+            sample = lines[:size]
+            every_parser = None
+            if len(sample) <= args.every_parser_max:
+                if parse(template, sample, True) != parse(
+                    template, sample, False
+                ):
+                    raise AssertionError("%s: indexed parse differs" % name)
+                every_parser = best_of(
+                    parse, template, sample, False, repeat=1
+                )
+            rows.append(
+                [
+                    name,
+                    len(sample),
+                    len(template.PARSERS),
+                    fmt(every_parser),
+                    fmt(best_of(parse, template, sample, True, repeat=1)),
+                ]
+            )
+    report(
+        "rm_templates parse, %d neighbors and %d route-maps"
+        % (args.neighbors, args.route_maps),
+        ["template", "lines", "parsers", "every parser", "indexed"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark the route_maps fact gathering on a policy of 10,000 route-map
+rules, against the former gathering that parsed the configuration twice,
+with the parse and validate phases reported by the facts profiler.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
+    utils,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.argspec.route_maps.route_maps import (
+    Route_mapsArgs,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.route_maps.route_maps import (
+    Route_mapsFacts,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.rm_templates.route_maps import (
+    Route_mapsTemplate,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.profiler import (
+    FactsProfiler,
+)
+from ansible_collections.vyos.vyos.tests.benchmarks.common import (
+    best_of,
+    fmt,
+    report,
+)
+
+RULES = (1000, 10000)
+
+
+def route_map_config(rules, per_map=100):
+    """
+    Generate the `set` lines of route-maps of `per_map` rules each, for
+    `rules` rules of four lines in total.
+    """
+    lines = []
+    for idx in range(rules):
+        prefix = "set policy route-map RM-%d rule %d " % (
+            idx // per_map,
+            (idx % per_map + 1) * 10,
+        )
+        lines.extend(
+            [
+                prefix + "action 'permit'",
+                prefix + "match ip address prefix-list 'PL-%d'" % idx,
+                prefix + "set local-preference '%d'" % (100 + idx % 100),
+                prefix + "set community '65000:%d'" % (idx % 65536),
+            ]
+        )
+    return "\n".join(lines)
+
+
+def double_parse(data):
+    """The former route_maps populate_facts, that parsed the lines twice."""
+    objs = []
+    route_maps_parser = Route_mapsTemplate(lines=data.splitlines())
+    if route_maps_parser.parse().get("route_maps"):
+        objs = list(route_maps_parser.parse().get("route_maps").values())
+    for item in objs:
+        if item.get("entries"):
+            item["entries"] = list(item["entries"].values())
+    params = utils.remove_empties(
+        utils.validate_config(Route_mapsArgs.argument_spec, {"config": objs})
+    )
+    return params.get("config")
+
+
+class Module(object):
+    """The parameters of a module run, without a device connection."""
+
+    params = {}
+
+
+def single_parse(data, profiler=None):
+    facts_obj = Route_mapsFacts(Module())
+    if profiler is not None:
+        facts_obj._timer = profiler.timer("route_maps")
+    ansible_facts = {"ansible_network_resources": {}}
+    facts_obj.populate_facts(None, ansible_facts, data)
+    return ansible_facts["ansible_network_resources"].get("route_maps")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rules",
+        type=int,
+        nargs="*",
+        default=RULES,
+        help="number of route-map rules",
+    )
+    args = parser.parse_args()
+
+    rows = []
+    for rules in args.rules:
+        data = route_map_config(rules)
+        if single_parse(data) != double_parse(data):
+            raise AssertionError("%d rules: route_maps facts differ" % rules)
+        profiler = FactsProfiler()
+        single_parse(data, profiler)
+        phases = profiler.report()["resources"]["route_maps"]["phases"]
+        rows.append(
+            [
+                rules,
+                data.count("\n") + 1,
+                fmt(best_of(double_parse, data, repeat=1)),
+                fmt(best_of(single_parse, data, repeat=1)),
+                fmt(phases["parse"]),
+                fmt(phases["validate"]),
+            ]
+        )
+    report(
+        "route_maps facts",
+        ["rules", "lines", "parse twice", "parse once", "parse", "validate"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
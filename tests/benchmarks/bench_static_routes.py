@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark the command generation of the static_routes config class for
+every state on synthetic full-table route sets, where half of the wanted
+routes are already configured with other next-hops.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.config.static_routes.static_routes import (
+    Static_routes,
+)
+from ansible_collections.vyos.vyos.tests.benchmarks.common import (
+    best_of,
+    fmt,
+    report,
+)
+
+ROUTES = (1000, 10000, 50000)
+STATES = ("merged", "replaced", "overridden", "deleted")
+
+
+class Module(object):
+    """The parameters of a module run, without a device connection."""
+
+    def __init__(self, state):
+        self.params = {"state": state, "config": None}
+
+    def fail_json(self, **kwargs):
+        raise Exception(kwargs)
+
+
+def routes(count, offset, gateway):
+    """Return `count` ipv4 routes and a tenth as many ipv6 routes."""
+    v4 = []
+    for idx in range(offset, offset + count):
+        v4.append(
+            {
+                "dest": "10.%d.%d.0/24" % ((idx // 256) % 256, idx % 256),
+                "next_hops": [
+                    {
+                        "forward_router_address": "192.0.2.%d" % gateway,
+                        "admin_distance": idx % 200 + 1,
+                    }
+                ],
+            }
+        )
+    v6 = []
+    for idx in range(offset, offset + count // 10):
+        v6.append(
+            {
+                "dest": "2001:db8:%x::/48" % idx,
+                "blackhole_config": {"type": "blackhole"},
+            }
+        )
+    return [
+        {
+            "address_families": [
+                {"afi": "ipv4", "routes": v4},
+                {"afi": "ipv6", "routes": v6},
+            ]
+        }
+    ]
+
+
+def run(state, want, have):
+    config = Static_routes(Module("rendered"))
+    config.state = state
+    return config.set_state(want, have)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--routes",
+        type=int,
+        nargs="*",
+        default=ROUTES,
+        help="number of configured ipv4 routes",
+    )
+    args = parser.parse_args()
+
+    rows = []
+    for count in args.routes:
+        have = routes(count, 0, 1)
+        want = routes(count, count // 2, 2)
+        row = [count]
+        for state in STATES:
+            row.append(
+                fmt(
+                    best_of(
+                        run,
+                        state,
+                        want if state != "deleted" else None,
+                        have,
+                        repeat=1,
+                    )
+                )
+            )
+        row.append(len(run("overridden", want, have)))
+        rows.append(row)
+    report(
+        "static_routes command generation",
+        ["routes"] + list(STATES) + ["overridden commands"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
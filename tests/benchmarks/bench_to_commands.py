@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Benchmark the one pass conversion of a curly-brace configuration to `set`
+commands against the NetworkConfig based conversion it replaces, on
+synthetic hierarchical configurations of up to 200k lines.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import (
+    NetworkConfig,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.config_diff import (
+    to_commands,
+)
+from ansible_collections.vyos.vyos.tests.benchmarks.common import (
+    best_of,
+    curly_config,
+    fmt,
+    report,
+    synthetic_config,
+)
+
+
+def network_config_commands(candidate):
+    """The conversion used before the one pass converter."""
+    candidate_obj = NetworkConfig(indent=4, contents=candidate)
+    config = [c.line for c in candidate_obj.items]
+    commands = list()
+    # this filters out less specific lines
+    for item in config:
+        for index, entry in enumerate(commands):
+            if item.startswith(entry):
+                del commands[index]
+                break
+        commands.append(item)
+
+    return ["set %s" % cmd.replace(" {", "") for cmd in commands]
+
+
+def hierarchical_config(lines):
+    """A curly-brace configuration of about `lines` lines."""
+    # the curly-brace format takes about 3.4 lines per `set` command
+    return curly_config(synthetic_config(lines * 10 // 34).splitlines())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--legacy-max",
+        type=int,
+        default=20000,
+        help="largest config size to run the quadratic conversion on",
+    )
+    args = parser.parse_args()
+
+    rows = []
+    for size in (1000, 10000, 100000, 200000):
+        candidate = hierarchical_config(size)
+        commands = to_commands(candidate)
+        legacy = None
+        if size <= args.legacy_max:
+            if network_config_commands(candidate) != commands:
+                raise AssertionError("the conversions do not agree")
+            legacy = best_of(network_config_commands, candidate, repeat=1)
+        rows.append(
+            [
+                candidate.count("\n") + 1,
+                len(commands),
+                fmt(legacy),
+                fmt(best_of(to_commands, candidate)),
+            ]
+        )
+    report(
+        "curly-brace to set commands",
+        ["lines", "commands", "NetworkConfig", "one pass"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Micro-benchmarks of every helper of the vyos utils module, on inputs of
+10/100/1k/10k elements such as address lists, arp-monitor targets and
+bond members. The list diff helpers are compared with the list scans
+they replace.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import timeit
+
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils import (
+    utils,
+)
+from ansible_collections.vyos.vyos.tests.benchmarks.common import (
+    report,
+    synthetic_config,
+)
+
+ELEMENTS = (10, 100, 1000, 10000)
+
+
+def legacy_list_diff_want_only(want_list, have_list):
+    return [
+        i
+        for i in have_list + want_list
+        if i in want_list and i not in have_list
+    ]
+
+
+def legacy_list_diff_have_only(want_list, have_list):
+    return [
+        i
+        for i in have_list + want_list
+        if i in have_list and i not in want_list
+    ]
+
+
+def legacy_get_lst_same_for_dicts(want, have, lst):
+    want_list = want.get(lst) or {}
+    have_list = have.get(lst) or {}
+    return [
+        i for i in want_list and have_list if i in have_list and i in want_list
+    ]
+
+
+def addresses(count, offset=0):
+    return [
+        "10.%d.%d.1/24" % (((idx + offset) // 256) % 256, (idx + offset) % 256)
+        for idx in range(count)
+    ]
+
+
+def members(count, offset=0):
+    return [{"member": "eth%d" % (idx + offset)} for idx in range(count)]
+
+
+def cases(size):
+    """Return (helper name, callable) pairs for a given input size."""
+    want = addresses(size)
+    have = addresses(size, offset=size // 2)
+    want_members = {"members": members(size)}
+    have_members = {"members": members(size, offset=size // 2)}
+    objs = [{"name": "eth%d" % idx, "vifs": idx} for idx in range(size)]
+    tvs = [
+        {"afi": "ipv4" if idx % 2 else "ipv6", "name": "eth%d" % idx}
+        for idx in range(size)
+    ]
+    base = dict(("key%d" % idx, {"value": idx}) for idx in range(size))
+    comparable = dict(
+        ("key%d" % idx, {"other": idx}) for idx in range(size // 2)
+    )
+    flat = dict(("key%d" % idx, idx) for idx in range(size))
+    config = synthetic_config(size)
+    last = "eth%d" % (size - 1)
+
+    yield "search_obj_in_list", lambda: utils.search_obj_in_list(last, objs)
+    yield "ListIndex (build + get)", lambda: utils.ListIndex(objs).get(last)
+    yield "get_interface_type", lambda: [
+        utils.get_interface_type(o["name"]) for o in objs
+    ]
+    yield "dict_delete", lambda: utils.dict_delete(base, comparable)
+    yield "diff_list_of_dicts", lambda: utils.diff_list_of_dicts(
+        want_members["members"], have_members["members"]
+    )
+    yield "get_lst_diff_for_dicts", lambda: utils.get_lst_diff_for_dicts(
+        want_members, have_members, "members"
+    )
+    yield "get_lst_same_for_dicts", lambda: utils.get_lst_same_for_dicts(
+        want_members, have_members, "members"
+    )
+    yield "  legacy", lambda: legacy_get_lst_same_for_dicts(
+        want_members, have_members, "members"
+    )
+    yield "list_diff_have_only", lambda: utils.list_diff_have_only(want, have)
+    yield "  legacy", lambda: legacy_list_diff_have_only(want, have)
+    yield "list_diff_want_only", lambda: utils.list_diff_want_only(want, have)
+    yield "  legacy", lambda: legacy_list_diff_want_only(want, have)
+    yield "search_dict_tv_in_list", lambda: utils.search_dict_tv_in_list(
+        last, "ipv4", tvs, "name", "afi"
+    )
+    yield "key_value_in_dict", lambda: utils.key_value_in_dict(
+        "key%d" % (size - 1), size - 1, flat
+    )
+    yield "is_dict_element_present", lambda: utils.is_dict_element_present(
+        flat, "key%d" % (size - 1)
+    )
+    yield "get_ip_address_version", lambda: [
+        utils.get_ip_address_version(a) for a in want
+    ]
+    yield "get_route_type", lambda: [utils.get_route_type(a) for a in want]
+    yield "filter_config", lambda: utils.filter_config(
+        config, ["| grep static"]
+    )
+    yield "_bool_to_str", lambda: [
+        utils._bool_to_str(idx % 2 == 0) for idx in range(size)
+    ]
+    yield "_is_w_same", lambda: [utils._is_w_same(o, o, "vifs") for o in objs]
+    yield "_in_target", lambda: [utils._in_target(o, "vifs") for o in objs]
+
+
+def fmt_us(seconds):
+    if seconds is None:
+        return "skipped"
+    return "%.1fus" % (seconds * 1e6)
+
+
+def measure(func, budget):
+    """Return the time of one call, looping long enough for a stable figure."""
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    if elapsed > budget:
+        return elapsed / number
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--legacy-max",
+        type=int,
+        default=1000,
+        help="largest input size to run the quadratic legacy helpers on",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=1.0,
+        help="seconds above which a measure is not repeated",
+    )
+    args = parser.parse_args()
+
+    results = {}
+    names = []
+    for size in ELEMENTS:
+        last = None
+        for name, func in cases(size):
+            if name == "  legacy":
+                name = last + " (legacy)"
+                if size > args.legacy_max:
+                    func = None
+            else:
+                last = name
+            if name not in results:
+                names.append(name)
+            results.setdefault(name, []).append(
+                fmt_us(measure(func, args.budget) if func else None)
+            )
+    report(
+        "vyos utils helpers, time per call",
+        ["helper"] + ["%d elements" % size for size in ELEMENTS],
+        [[name] + results[name] for name in names],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Shared helpers for the vyos benchmarks.
+
+The benchmarks are plain scripts, they are not collected by the unit tests.
+Run them from the collection root with the ansible_collections tree on the
+python path, for example::
+
+    python -m ansible_collections.vyos.vyos.tests.benchmarks.bench_config_tree
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import time
+from collections import OrderedDict
+
+SIZES = (1000, 10000, 100000)
+
+
+def best_of(func, *args, **kwargs):
+    """Return the best wall time in seconds of `repeat` calls to func."""
+    repeat = kwargs.pop("repeat", 3)
+    best = None
+    for _i in range(repeat):
+        start = time.time()
+        func(*args, **kwargs)
+        elapsed = time.time() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def report(title, header, rows):
+    """Print the benchmark results as a table."""
+    print(title)
+    widths = [
+        max(len(str(row[idx])) for row in [header] + rows)
+        for idx in range(len(header))
+    ]
+    for row in [header] + rows:
+        print(
+            "  ".join(
+                str(col).rjust(widths[idx]) for idx, col in enumerate(row)
+            )
+        )
+    print("")
+
+
+def fmt(seconds):
+    """Format a duration for the report tables."""
+    if seconds is None:
+        return "skipped"
+    return "%.4fs" % seconds
+
+
+def synthetic_config(lines):
+    """
+    Generate a `show configuration commands` output of about `lines` lines
+    mixing interfaces with vifs, static routes, firewall rules and lldp.
+    """
+    out = []
+    idx = 0
+    while len(out) < lines:
+        eth = "eth%d" % idx
+        out.append(
+            "set interfaces ethernet %s description 'port %d'" % (eth, idx)
+        )
+        out.append(
+            "set interfaces ethernet %s hw-id '08:00:27:%02x:%02x:%02x'"
+            % (eth, idx % 256, (idx // 256) % 256, idx % 97)
+        )
+        out.append(
+            "set interfaces ethernet %s vif %d address '10.%d.%d.1/24'"
+            % (eth, idx % 4000 + 1, (idx // 256) % 256, idx % 256)
+        )
+        out.append(
+            "set protocols static route 10.%d.%d.0/24 next-hop '192.0.2.%d'"
+            % ((idx // 256) % 256, idx % 256, idx % 250 + 1)
+        )
+        out.append(
+            "set protocols static route 10.%d.%d.0/24 next-hop '192.0.2.%d' distance '%d'"
+            % ((idx // 256) % 256, idx % 256, idx % 250 + 1, idx % 200 + 1)
+        )
+        out.append(
+            "set firewall name RS-%d rule %d action 'accept'"
+            % (idx // 50, idx % 50 + 1)
+        )
+        out.append(
+            "set firewall name RS-%d rule %d destination port '%d'"
+            % (idx // 50, idx % 50 + 1, idx % 65535 + 1)
+        )
+        out.append(
+            "set service lldp interface %s location elin '%010d'" % (eth, idx)
+        )
+        idx += 1
+    return "\n".join(out[:lines])
+
+
+def curly_config(lines):
+    """
+    Render `set` lines in the curly-brace format, the values quoted as in
+    the running configuration.
+    """
+    config = OrderedDict()
+    for line in lines:
+        if " '" in line:
+            path, value = line.rsplit(" '", 1)
+            path, value = path.split()[1:], "'" + value
+        else:
+            path = line.split()[1:]
+            path, value = path[:-1], path[-1]
+        node = config
+        for token in path + [value]:
+            node = node.setdefault(token, OrderedDict())
+
+    def render(node, indent):
+        out = []
+        for key, child in node.items():
+            if not child:
+                out.append("%s%s" % (" " * indent, key))
+            elif all(not value for value in child.values()):
+                out.extend(
+                    "%s%s %s" % (" " * indent, key, value) for value in child
+                )
+            else:
+                out.append("%s%s {" % (" " * indent, key))
+                out.extend(render(child, indent + 4))
+                out.append("%s}" % (" " * indent))
+        return out
+
+    return "\n".join(render(config, 0))
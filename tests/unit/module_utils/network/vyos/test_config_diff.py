@@ -0,0 +1,211 @@
+# (c) 2021 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.vyos.vyos.tests.unit.compat import unittest
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.config_diff import (
+    PathTrie,
+    RunningConfigIndex,
+    apply_commands,
+    diff_commands,
+    find_set_command,
+    iter_set_commands,
+    minimize_commands,
+    to_commands,
+)
+
+RUNNING = """set interfaces ethernet eth0 address 'dhcp'
+set interfaces ethernet eth1 description 'uplink to core'
+set interfaces ethernet eth10 vif 100 description 'vlan 100'
+set system host-name 'vyos'"""
+
+
+class TestVyosConfigDiff(unittest.TestCase):
+    def test_has_prefix(self):
+        index = RunningConfigIndex(RUNNING)
+        self.assertTrue(index.has_prefix("set interfaces ethernet eth1"))
+        self.assertTrue(index.has_prefix("set interfaces ethernet eth"))
+        self.assertTrue(index.has_prefix("set interfaces ethernet eth10 "))
+        self.assertFalse(index.has_prefix("set system host-name vyos "))
+        self.assertFalse(index.has_prefix("set interfaces bonding"))
+        self.assertTrue(
+            index.has_prefix("set interfaces ethernet eth1 description 'upl")
+        )
+
+    def test_to_commands(self):
+        candidate = (
+            "/* comment */\n"
+            "interfaces {\n"
+            "    ethernet eth0 {\n"
+            "        address 10.0.0.1/2\n"
+            "        address 10.0.0.1/24\n"
+            "        disable\n"
+            "    }\n"
+            "    ethernet eth1 {\n"
+            "    }\n"
+            "    loopback lo\n"
+            "}\n"
+            "system {\n"
+            "    host-name vyos\n"
+            "}\n"
+        )
+        self.assertEqual(
+            to_commands(candidate),
+            [
+                "set interfaces ethernet eth0 address 10.0.0.1/2",
+                "set interfaces ethernet eth0 address 10.0.0.1/24",
+                "set interfaces ethernet eth0 disable",
+                "set interfaces ethernet eth1",
+                "set interfaces loopback lo",
+                "set system host-name vyos",
+            ],
+        )
+        self.assertEqual(to_commands(RUNNING), RUNNING.split("\n"))
+
+    def test_iter_set_commands_lines(self):
+        lines = iter(["service {", "    lldp {", "    }", "    ssh", "}"])
+        self.assertEqual(
+            list(iter_set_commands(lines)),
+            ["set service lldp", "set service ssh"],
+        )
+
+    def test_find_set_command(self):
+        policy = (
+            "policy {\n    route-map RM1 {\n        rule 10 {\n"
+            "            set {\n                metric 10\n            }\n"
+        )
+        self.assertIsNone(find_set_command(policy))
+        self.assertEqual(
+            find_set_command(["system {", "}", "delete service ssh "]),
+            "delete service ssh",
+        )
+
+    def test_minimize_commands(self):
+        commands = [
+            "set interfaces ethernet eth10 vif 100 address '192.0.2.1/24'",
+            "delete interfaces ethernet eth10 vif 100 description",
+            "delete interfaces ethernet eth10 vif 100 address",
+            "set interfaces ethernet eth10 vif 100 mtu '1400'",
+            "set system host-name 'vyos01'",
+            "delete interfaces ethernet eth10 vif 100",
+            "delete interfaces ethernet eth10 vif 100",
+        ]
+        self.assertEqual(
+            minimize_commands(commands),
+            [
+                "set interfaces ethernet eth10 vif 100 address '192.0.2.1/24'",
+                "set system host-name 'vyos01'",
+                "delete interfaces ethernet eth10 vif 100",
+            ],
+        )
+        # the set is undone when the running configuration has the path
+        self.assertEqual(
+            minimize_commands(commands, RUNNING),
+            [
+                "set system host-name 'vyos01'",
+                "delete interfaces ethernet eth10 vif 100",
+            ],
+        )
+
+    def test_minimize_commands_barriers(self):
+        commands = [
+            "delete interfaces ethernet eth1 description",
+            "set interfaces ethernet eth1",
+            "delete interfaces ethernet eth1 description",
+            {"command": "delete service lldp", "prompt": "Are you sure"},
+            "delete interfaces ethernet eth0 address",
+            "set interfaces ethernet eth0 address 'dhcp'",
+        ]
+        self.assertEqual(minimize_commands(commands, RUNNING), commands)
+
+    def test_diff_commands(self):
+        candidate = [
+            "set system host-name 'vyos'",
+            "set system host-name 'vyos01'",
+            "delete interfaces ethernet eth1 description",
+            "delete interfaces ethernet eth1 description",
+            "delete interfaces ethernet eth2",
+            "delete interfaces ethernet eth1",
+        ]
+        self.assertEqual(
+            diff_commands(candidate, RUNNING),
+            [
+                "set system host-name 'vyos01'",
+                "delete interfaces ethernet eth1 description",
+                "delete interfaces ethernet eth1",
+            ],
+        )
+
+    def test_diff_commands_empty_running(self):
+        candidate = ["delete service lldp", "delete service lldp"]
+        self.assertEqual(diff_commands(candidate, ""), candidate)
+
+    def test_diff_commands_invalid_line(self):
+        with self.assertRaises(ValueError):
+            diff_commands(["show interfaces"], RUNNING)
+
+    def test_path_trie(self):
+        trie = PathTrie()
+        for value, path in enumerate(
+            [("a", "b"), ("a", "b", "c"), ("a", "d"), ("e",)]
+        ):
+            trie.set(path, value)
+        self.assertTrue(trie.has_prefix(("a",)))
+        self.assertEqual(trie.get(("a", "b")), 0)
+        self.assertIsNone(trie.get(("a",)))
+        self.assertEqual(trie.pop(("a", "b")), 0)
+        self.assertTrue(trie.has_prefix(("a", "b")))
+        self.assertEqual(trie.pop_children(("a",)), [2])
+        self.assertEqual(sorted(trie.pop_all(("a",))), [1])
+        self.assertFalse(trie.has_prefix(("a",)))
+        self.assertEqual(trie.root[1].keys(), {"e": None}.keys())
+        self.assertEqual(trie.values(), [3])
+
+    def test_apply_commands(self):
+        running = "\n".join(
+            [
+                "set firewall name RS rule 10 action 'accept'",
+                "set firewall name RS rule 10 source address '192.0.2.1'",
+                "set firewall name RS rule 20 action 'drop'",
+                "set firewall name RS rule 20 disable",
+            ]
+        )
+        commands = [
+            "set firewall name RS rule 10 action 'reject'",
+            "set firewall name RS rule 10 description 'web'",
+            "set firewall name RS rule 10 log 'enable'",
+            "delete firewall name RS rule 20 action",
+            "delete firewall name RS rule 20 disable",
+            "set firewall name RS2",
+        ]
+        self.assertEqual(
+            apply_commands(running, commands, ("name", "rule")),
+            "\n".join(
+                [
+                    "set firewall name RS rule 10 action 'reject'",
+                    "set firewall name RS rule 10 source address '192.0.2.1'",
+                    "set firewall name RS rule 10 description 'web'",
+                    "set firewall name RS rule 10 log 'enable'",
+                    "set firewall name RS rule 20",
+                    "set firewall name RS2",
+                ]
+            ),
+        )
@@ -0,0 +1,248 @@
+# (c) 2021 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+
+from ansible.module_utils.connection import ConnectionError
+from ansible_collections.vyos.vyos.tests.unit.compat import unittest
+from ansible_collections.vyos.vyos.tests.unit.compat.mock import MagicMock
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.static_routes.static_routes import (
+    Static_routesFacts,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.config_tree import (
+    ConfigTree,
+    JsonConfigTree,
+    get_config_tree,
+    get_device_config,
+    tokenize,
+)
+
+CONFIG = """set interfaces ethernet eth0 address 'dhcp'
+set interfaces ethernet eth1 description 'uplink to core'
+set interfaces ethernet eth1 vif 100 description 'vlan 100'
+set interfaces ethernet eth0 hw-id '08:00:27:7c:85:05'
+set protocols static route 192.0.2.32/28 next-hop '192.0.2.9'
+set service lldp"""
+
+CONFIG_JSON = """{"interfaces": {"ethernet": {
+    "eth0": {"address": ["dhcp"], "hw-id": "08:00:27:7c:85:05"},
+    "eth1": {"description": "uplink to core",
+             "vif": {"100": {"description": "vlan 100"}}}}},
+  "protocols": {"static": {"route": {
+    "192.0.2.32/28": {"next-hop": {"192.0.2.9": {}}}}}},
+  "service": {"lldp": {}}}"""
+
+ROUTES = """set protocols static route 192.0.2.32/28 blackhole distance '2'
+set protocols static route 192.0.2.32/28 next-hop '192.0.2.9'
+set protocols static route 192.0.2.32/28 next-hop 192.0.2.9 distance '10'
+set protocols static route 192.0.2.32/28 next-hop 192.0.2.10 disable
+set protocols static route 192.0.2.48/28 blackhole
+set protocols static route6 2001:db8::/64 next-hop '2001:db8::1'
+set protocols static route6 2001:db8::/64 next-hop 2001:db8::1 interface 'eth0'"""
+
+ROUTES_JSON = {
+    "protocols": {
+        "static": {
+            "route": {
+                "192.0.2.32/28": {
+                    "blackhole": {"distance": "2"},
+                    "next-hop": {
+                        "192.0.2.9": {"distance": "10"},
+                        "192.0.2.10": {"disable": {}},
+                    },
+                },
+                "192.0.2.48/28": {"blackhole": {}},
+            },
+            "route6": {
+                "2001:db8::/64": {
+                    "next-hop": {"2001:db8::1": {"interface": "eth0"}}
+                }
+            },
+        }
+    }
+}
+
+
+class TestVyosConfigTree(unittest.TestCase):
+    def test_tokenize_quoted_value(self):
+        self.assertEqual(
+            tokenize("set interfaces ethernet eth1 description 'a b  c'"),
+            ["set", "interfaces", "ethernet", "eth1", "description", "a b  c"],
+        )
+
+    def test_tokenize_wrapped_line(self):
+        self.assertEqual(
+            tokenize("'set protocols static route 192.0.2.32/28 blackhole'"),
+            [
+                "set",
+                "protocols",
+                "static",
+                "route",
+                "192.0.2.32/28",
+                "blackhole",
+            ],
+        )
+
+    def test_children_keep_config_order(self):
+        tree = ConfigTree(CONFIG)
+        self.assertEqual(
+            tree.children("interfaces ethernet"), ["eth0", "eth1"]
+        )
+        self.assertEqual(tree.children(["service", "lldp"]), [])
+        self.assertEqual(tree.children(["service", "snmp"]), [])
+
+    def test_subtree_lines(self):
+        tree = ConfigTree(CONFIG)
+        self.assertEqual(
+            tree.lines(["interfaces", "ethernet", "eth0"]),
+            [
+                "set interfaces ethernet eth0 address 'dhcp'",
+                "set interfaces ethernet eth0 hw-id '08:00:27:7c:85:05'",
+            ],
+        )
+        self.assertEqual(
+            tree.text("interfaces ethernet eth1 vif 100"),
+            "set interfaces ethernet eth1 vif 100 description 'vlan 100'",
+        )
+        self.assertEqual(tree.lines(["interfaces", "bonding"]), [])
+
+    def test_exists(self):
+        tree = ConfigTree(CONFIG)
+        self.assertTrue(tree.exists(["service", "lldp"]))
+        self.assertTrue(
+            tree.exists(["interfaces", "ethernet", "eth1", "description"])
+        )
+        self.assertFalse(tree.exists(["service", "ssh"]))
+
+    def test_get_config_tree_reuses_tree(self):
+        tree = get_config_tree(CONFIG)
+        self.assertIs(get_config_tree(CONFIG), tree)
+        self.assertIsNot(get_config_tree(CONFIG + "\nset service ssh"), tree)
+
+    def test_json_tree(self):
+        tree = get_config_tree(CONFIG_JSON)
+        self.assertIsInstance(tree, JsonConfigTree)
+        text_tree = ConfigTree(CONFIG)
+        for path in (
+            [],
+            ["interfaces", "ethernet"],
+            ["interfaces", "ethernet", "eth1", "vif", "100"],
+            ["protocols", "static", "route", "192.0.2.32/28", "next-hop"],
+            ["service"],
+        ):
+            self.assertEqual(tree.children(path), text_tree.children(path))
+        self.assertEqual(
+            tree.lines(["interfaces", "ethernet", "eth1"]),
+            [
+                "set interfaces ethernet eth1 description 'uplink to core'",
+                "set interfaces ethernet eth1 vif 100 description 'vlan 100'",
+            ],
+        )
+        self.assertEqual(tree.lines(["service"]), ["set service lldp"])
+        address = ["interfaces", "ethernet", "eth0", "address"]
+        for path in (address, address + ["dhcp"]):
+            self.assertTrue(tree.exists(path))
+            self.assertEqual(
+                tree.lines(path), text_tree.lines(address + ["dhcp"])
+            )
+        self.assertEqual(tree.children(address), ["dhcp"])
+        self.assertFalse(tree.exists(address + ["dhcp", "x"]))
+        self.assertFalse(tree.exists(["service", "ssh"]))
+        self.assertEqual(tree.lines(["service", "ssh"]), [])
+
+    def test_json_tree_quoting(self):
+        tree = JsonConfigTree(
+            json.dumps(
+                {
+                    "firewall": {
+                        "group": {
+                            "address-group": {
+                                "A B": {"description": "it's", "address": []}
+                            }
+                        }
+                    }
+                }
+            )
+        )
+        self.assertEqual(
+            tree.children("firewall group address-group"), ["A B"]
+        )
+        self.assertEqual(
+            tree.lines(["firewall"]),
+            [
+                "set firewall group address-group 'A B' description \"it's\"",
+                "set firewall group address-group 'A B' address",
+            ],
+        )
+
+    def test_static_routes_from_json(self):
+        facts = []
+        for data in (ROUTES, json.dumps(ROUTES_JSON)):
+            ansible_facts = {"ansible_network_resources": {}}
+            Static_routesFacts(None).populate_facts(None, ansible_facts, data)
+            facts.append(ansible_facts["ansible_network_resources"])
+        self.assertEqual(facts[0], facts[1])
+        routes = facts[0]["static_routes"][0]["address_families"][0]
+        self.assertEqual(
+            routes["routes"][0],
+            {
+                "dest": "192.0.2.32/28",
+                "blackhole_config": {"distance": 2},
+                "next_hops": [
+                    {
+                        "forward_router_address": "192.0.2.9",
+                        "admin_distance": 10,
+                    },
+                    {"forward_router_address": "192.0.2.10", "enabled": False},
+                ],
+            },
+        )
+
+    def test_get_device_config(self):
+        connection = MagicMock()
+        connection.get_capabilities.return_value = json.dumps(
+            {"format": ["text", "set", "json"]}
+        )
+        connection.get_config.side_effect = lambda format=None: (
+            CONFIG_JSON if format == "json" else CONFIG
+        )
+        self.assertEqual(get_device_config(connection), CONFIG_JSON)
+        # the device failed to show the configuration in json
+        connection.get_config.side_effect = lambda format=None: (
+            "Invalid command" if format == "json" else CONFIG
+        )
+        self.assertEqual(get_device_config(connection), CONFIG)
+
+        def no_json(format=None):
+            if format == "json":
+                raise ConnectionError("invalid command")
+            return CONFIG
+
+        connection.get_config.side_effect = no_json
+        self.assertEqual(get_device_config(connection), CONFIG)
+        connection.get_capabilities.return_value = json.dumps(
+            {"format": ["text", "set"]}
+        )
+        connection.get_config.side_effect = None
+        connection.get_config.return_value = CONFIG
+        self.assertEqual(get_device_config(connection), CONFIG)
+        connection.get_config.assert_called_with()
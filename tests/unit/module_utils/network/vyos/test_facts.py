@@ -0,0 +1,86 @@
+# (c) 2021 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import ast
+import os
+
+from ansible_collections.vyos.vyos.tests.unit.compat import unittest
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.facts import (
+    FACT_RESOURCE_SUBSETS,
+    FACTS_PACKAGE,
+    ResourceFactsRegistry,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.lldp_global.lldp_global import (
+    Lldp_globalFacts,
+)
+
+PLUGINS = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "..", "..", "plugins"
+)
+
+
+def imported_modules(path):
+    with open(path) as f:
+        tree = ast.parse(f.read())
+    return set(
+        node.module
+        for node in ast.walk(tree)
+        if isinstance(node, ast.ImportFrom)
+    ) | set(
+        "%s.%s" % (node.module, alias.name)
+        for node in ast.walk(tree)
+        if isinstance(node, ast.ImportFrom)
+        for alias in node.names
+    )
+
+
+class TestVyosFactsRegistry(unittest.TestCase):
+    def test_registry_lookup(self):
+        registry = ResourceFactsRegistry(
+            lldp_global="lldp_global.lldp_global.Lldp_globalFacts"
+        )
+        self.assertEqual(list(registry), ["lldp_global"])
+        self.assertIs(registry["lldp_global"], Lldp_globalFacts)
+        self.assertIsNone(registry.get("bgp_global"))
+        self.assertIn("lldp_global", registry)
+        self.assertNotIn("bgp_global", registry)
+
+    def test_resource_fact_classes_are_shipped(self):
+        facts = imported_modules(
+            os.path.join(PLUGINS, "modules", "vyos_facts.py")
+        )
+        for resource in FACT_RESOURCE_SUBSETS:
+            facts_module = "%s.%s.%s" % (FACTS_PACKAGE, resource, resource)
+            self.assertIn(facts_module, facts)
+            config = os.path.join(
+                PLUGINS,
+                "module_utils",
+                "network",
+                "vyos",
+                "config",
+                resource,
+                resource + ".py",
+            )
+            self.assertIn(facts_module, imported_modules(config))
+            self.assertEqual(
+                FACT_RESOURCE_SUBSETS[resource].__module__, facts_module
+            )
@@ -0,0 +1,107 @@
+# (c) 2021 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.vyos.vyos.tests.unit.compat import unittest
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.lag_interfaces.lag_interfaces import (
+    Lag_interfacesFacts,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.interface_model import (
+    InterfaceModel,
+    get_interface_model,
+)
+
+CONFIG = """set interfaces ethernet eth0 address 'dhcp'
+set interfaces ethernet eth1 description 'uplink'
+set interfaces ethernet eth1 vif 100 description 'vlan 100'
+set interfaces ethernet eth1 vif 200
+set interfaces ethernet eth0 hw-id '08:00:27:7c:85:05'
+set interfaces ethernet eth2 bond-group 'bond0'
+set interfaces ethernet eth3 bond-group 'bond0'
+set interfaces bonding bond0 mode '802.3ad'
+set interfaces loopback lo
+set protocols static route 192.0.2.32/28 next-hop '192.0.2.9'
+set service lldp interface eth0"""
+
+
+class TestVyosInterfaceModel(unittest.TestCase):
+    def test_interfaces_keep_config_order(self):
+        model = InterfaceModel(CONFIG.splitlines())
+        self.assertEqual(
+            [intf.name for intf in model.iter_interfaces()],
+            ["eth0", "eth1", "eth2", "eth3", "bond0", "lo"],
+        )
+        self.assertEqual(
+            [intf.name for intf in model.iter_interfaces(("bonding",))],
+            ["bond0"],
+        )
+
+    def test_interface_lines(self):
+        model = InterfaceModel(CONFIG.splitlines())
+        eth0 = model.get("eth0")
+        self.assertEqual(eth0.type, "ethernet")
+        self.assertEqual(
+            eth0.lines,
+            [
+                "set interfaces ethernet eth0 address 'dhcp'",
+                "set interfaces ethernet eth0 hw-id '08:00:27:7c:85:05'",
+            ],
+        )
+        self.assertEqual(
+            eth0.config, ["address 'dhcp'", "hw-id '08:00:27:7c:85:05'"]
+        )
+        self.assertEqual(model.get("lo").lines, [])
+        self.assertIsNone(model.get("eth9"))
+
+    def test_interface_vifs(self):
+        model = InterfaceModel(CONFIG.splitlines())
+        self.assertEqual(
+            list(model.get("eth1").vifs.items()),
+            [("100", ["description 'vlan 100'"]), ("200", [])],
+        )
+        self.assertEqual(model.get("eth0").vifs, {})
+
+    def test_get_interface_model_reuses_model(self):
+        model = get_interface_model(CONFIG)
+        self.assertIs(get_interface_model(CONFIG), model)
+        # the same interfaces fetched with another command
+        interfaces = "\n".join(
+            line for line in CONFIG.splitlines() if "interfaces" in line
+        )
+        self.assertIs(get_interface_model(interfaces), model)
+        self.assertIsNot(
+            get_interface_model(CONFIG + "\nset interfaces ethernet eth4"),
+            model,
+        )
+
+    def test_lag_members(self):
+        ansible_facts = {"ansible_network_resources": {}}
+        Lag_interfacesFacts(None).populate_facts(None, ansible_facts, CONFIG)
+        self.assertEqual(
+            ansible_facts["ansible_network_resources"]["lag_interfaces"],
+            [
+                {
+                    "name": "bond0",
+                    "mode": "802.3ad",
+                    "members": [{"member": "eth2"}, {"member": "eth3"}],
+                }
+            ],
+        )
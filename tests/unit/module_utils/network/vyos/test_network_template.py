@@ -0,0 +1,258 @@
+# (c) 2021 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import re
+
+from ansible_collections.vyos.vyos.tests.unit.compat import unittest
+from ansible_collections.vyos.vyos.tests.unit.compat.mock import patch
+from ansible_collections.vyos.vyos.tests.unit.modules.network.vyos import (
+    test_vyos_bgp_address_family,
+    test_vyos_bgp_global,
+    test_vyos_ospf_interfaces,
+    test_vyos_route_maps,
+)
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.network_template import (
+    NetworkTemplate as NetworkTemplateBase,
+)
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    Template,
+    dict_merge,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.network_template import (
+    NetworkTemplate,
+    ParserIndex,
+    TemplateRenderer,
+    get_signature,
+    merge_into,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.rm_templates.bgp_global import (
+    Bgp_globalTemplate,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.rm_templates.bgp_address_family import (
+    Bgp_address_familyTemplate,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.rm_templates.ospf_interfaces import (
+    Ospf_interfacesTemplate,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.rm_templates.route_maps import (
+    Route_mapsTemplate,
+)
+
+FIXTURES = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "..",
+    "..",
+    "modules",
+    "network",
+    "vyos",
+    "fixtures",
+)
+
+
+def load_lines(name):
+    with open(os.path.join(FIXTURES, name)) as f:
+        return f.read().splitlines()
+
+
+class TestVyosNetworkTemplate(unittest.TestCase):
+    def test_signature(self):
+        getval = re.compile(
+            r"""
+            ^set
+            \s+protocols
+            \s+bgp
+            \s+(?P<as_num>\d+)
+            \s+address-family
+            \s+(?P<afi>\S+)-unicast
+            \s+aggregate-address
+            \s+(?P<address>\S+)
+            \s*(?P<as_set>as-set)*
+            $""",
+            re.VERBOSE,
+        )
+        self.assertEqual(
+            get_signature(getval),
+            (
+                "set",
+                "protocols",
+                "bgp",
+                None,
+                "address-family",
+                None,
+                "aggregate-address",
+            ),
+        )
+
+    def test_signature_stops_at_optional_part(self):
+        self.assertEqual(
+            get_signature(r"^set\spolicy\sroute-map\s(?P<name>\S+)*$"),
+            ("set", "policy", "route-map"),
+        )
+        self.assertEqual(
+            get_signature(r"^set policy(\s+(?P<name>\S+))? rule"),
+            ("set",),
+        )
+        self.assertEqual(get_signature(re.compile(r"^SET", re.I)), ())
+
+    def test_candidates_keep_parser_order(self):
+        index = ParserIndex(
+            [
+                {
+                    "name": "interface",
+                    "getval": r"^set\s+interfaces\s+(?P<type>\S+)\s+(?P<n>\S+)",
+                },
+                {
+                    "name": "protocol",
+                    "getval": r"^set\s+protocols\s+(?P<proto>\S+)",
+                },
+                {"name": "any", "getval": r"(?P<any>.*)"},
+                {
+                    "name": "ethernet",
+                    "getval": r"^set\s+interfaces\s+ethernet\s+(?P<n>\S+)",
+                },
+            ]
+        )
+        self.assertEqual(
+            index.candidates("set interfaces ethernet eth0 description"),
+            [0, 2, 3],
+        )
+        self.assertEqual(
+            index.candidates("set protocols static route"), [1, 2]
+        )
+        self.assertEqual(index.candidates("set interfaces"), [2])
+
+    def test_merge_into(self):
+        base = {
+            "as_number": "65536",
+            "neighbor": {"192.0.2.1": {"address": "192.0.2.1"}},
+            "network": [{"address": "192.0.2.0/24"}],
+            "timers": {"holdtime": 30},
+        }
+        other = {
+            "as_number": "65536",
+            "neighbor": {"192.0.2.1": {"remote_as": 65535}},
+            "network": [{"address": "192.0.2.0/24"}, {"address": "ab::/64"}],
+            "timers": None,
+            "bgp_params": {"router_id": "192.0.2.2"},
+        }
+        expected = dict_merge(base, other)
+        self.assertIs(merge_into(base, other), base)
+        self.assertEqual(base, expected)
+
+    def test_parse_matches_netcommon(self):
+        cases = [
+            (Bgp_globalTemplate, load_lines("vyos_bgp_global_config.cfg")),
+            (
+                Bgp_globalTemplate,
+                load_lines("vyos_bgp_global_af_config.cfg"),
+            ),
+            (
+                Bgp_address_familyTemplate,
+                load_lines("vyos_bgp_address_family_config.cfg"),
+            ),
+            (Route_mapsTemplate, load_lines("vyos_route_maps_config.cfg")),
+            (
+                Ospf_interfacesTemplate,
+                load_lines("vyos_ospf_interfaces_config.cfg"),
+            ),
+        ]
+        for template, lines in cases:
+            for data in (lines, [line.replace("'", "") for line in lines]):
+                parser = template(lines=data)
+                self.assertEqual(
+                    parser.parse(), NetworkTemplateBase.parse(parser)
+                )
+                for line in data:
+                    parser = template(lines=[line])
+                    self.assertEqual(
+                        parser.parse(), NetworkTemplateBase.parse(parser)
+                    )
+
+
+class TestVyosTemplateRenderer(unittest.TestCase):
+    def render(self, value, data):
+        return TemplateRenderer(value, Template())(data)
+
+    def test_lookups(self):
+        data = {"as_number": 65536, "neighbor": {"address": "192.0.2.1"}}
+        self.assertEqual(
+            self.render(
+                "protocols bgp {{ as_number }} neighbor {{neighbor.address}}",
+                data,
+            ),
+            "protocols bgp 65536 neighbor 192.0.2.1",
+        )
+        self.assertEqual(self.render("{{ as_number }}", data), 65536)
+        self.assertEqual(self.render("description", data), "description")
+
+    def test_undefined(self):
+        self.assertIsNone(
+            self.render("neighbor {{ neighbor.port }}", {"neighbor": {}})
+        )
+        self.assertIsNone(self.render("neighbor {{ neighbor.port }}", None))
+
+    def test_jinja_fallback(self):
+        data = {"num": "30", "neighbor": {"items": "x"}}
+        self.assertEqual(self.render("{{ num|int }}", data), 30)
+        self.assertTrue(
+            self.render("{{ neighbor.items }}", data).startswith(
+                "<built-in method items"
+            )
+        )
+        self.assertEqual(
+            self.render("{% if num %}timers {{ num }}{% endif %}", data),
+            "timers 30",
+        )
+
+    def test_module_tests_render_identical_commands(self):
+        renders = []
+        render = NetworkTemplate._render
+
+        def _render(tmplt_obj, tmplt, data, negate):
+            command = render(tmplt_obj, tmplt, data, negate)
+            expected = NetworkTemplateBase._render(
+                tmplt_obj, tmplt, data, negate
+            )
+            renders.append((tmplt, command, expected))
+            return command
+
+        loader = unittest.TestLoader()
+        suite = unittest.TestSuite(
+            loader.loadTestsFromModule(module)
+            for module in (
+                test_vyos_bgp_address_family,
+                test_vyos_bgp_global,
+                test_vyos_ospf_interfaces,
+                test_vyos_route_maps,
+            )
+        )
+        result = unittest.TestResult()
+        with patch.object(NetworkTemplate, "_render", _render):
+            suite.run(result)
+
+        self.assertEqual(result.errors + result.failures, [])
+        self.assertTrue(renders)
+        for tmplt, command, expected in renders:
+            self.assertEqual(command, expected, tmplt)
+            self.assertEqual(type(command), type(expected), tmplt)
@@ -0,0 +1,71 @@
+# (c) 2021 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.vyos.vyos.tests.unit.compat import unittest
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.lldp_global.lldp_global import (
+    Lldp_globalFacts,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.profiler import (
+    FactsProfiler,
+    NULL_TIMER,
+    get_timer,
+)
+
+CONFIG = """set service lldp legacy-protocols 'cdp'
+set service lldp management-address '192.0.2.17'"""
+
+
+class TestVyosFactsProfiler(unittest.TestCase):
+    def test_get_timer_default(self):
+        self.assertIs(get_timer(Lldp_globalFacts(None)), NULL_TIMER)
+
+    def test_profiled_resource(self):
+        profiler = FactsProfiler()
+        facts_obj = profiler.profile(
+            "lldp_global", {"lldp_global": Lldp_globalFacts}
+        )(None)
+        ansible_facts = {"ansible_network_resources": {}}
+        facts_obj.populate_facts(None, ansible_facts, CONFIG)
+        self.assertEqual(
+            ansible_facts["ansible_network_resources"]["lldp_global"][
+                "address"
+            ],
+            "192.0.2.17",
+        )
+        report = profiler.report()["resources"]["lldp_global"]
+        self.assertEqual(report["lines"], 2)
+        self.assertEqual(report["bytes"], len(CONFIG))
+        self.assertFalse(report["fetched"])
+        self.assertEqual(sorted(report["phases"]), ["parse", "validate"])
+        self.assertGreaterEqual(
+            report["wall_time"], sum(report["phases"].values())
+        )
+
+    def test_phases_accumulate(self):
+        timer = FactsProfiler().timer("interfaces")
+        timer.start("parse")
+        timer.start("validate")
+        timer.start("parse")
+        timer.stop()
+        self.assertEqual(sorted(timer.phases), ["parse", "validate"])
+        timer.stop()
+        self.assertEqual(sorted(timer.phases), ["parse", "validate"])
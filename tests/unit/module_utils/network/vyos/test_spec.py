@@ -0,0 +1,181 @@
+# (c) 2021 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
+    utils,
+)
+from ansible_collections.vyos.vyos.tests.unit.compat import unittest
+from ansible_collections.vyos.vyos.tests.unit.compat.mock import patch
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.argspec.firewall_rules.firewall_rules import (
+    Firewall_rulesArgs,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.argspec.bgp_global.bgp_global import (
+    Bgp_globalArgs,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.argspec.ospf_interfaces.ospf_interfaces import (
+    Ospf_interfacesArgs,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.firewall_rules.firewall_rules import (
+    Firewall_rulesFacts,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.spec import (
+    STRICT_ENV,
+    get_generated_spec,
+    validate_facts,
+)
+
+RULES = {
+    "config": [
+        {
+            "afi": "ipv4",
+            "rule_sets": [
+                {
+                    "name": "INBOUND",
+                    "default_action": "drop",
+                    "rules": [
+                        {
+                            "number": "101",
+                            "action": "accept",
+                            "disabled": "true",
+                            "destination": {"port": 22},
+                            "recent": {"count": "10", "time": 60},
+                        },
+                        {"number": 102, "ipsec": "match-ipsec"},
+                    ],
+                }
+            ],
+        }
+    ]
+}
+
+
+class Module(object):
+    def __init__(self):
+        self.no_log_values = set()
+
+
+class TestVyosSpec(unittest.TestCase):
+    def setUp(self):
+        self.mock_env = patch.dict(os.environ, {STRICT_ENV: ""})
+        self.mock_env.start()
+
+    def tearDown(self):
+        self.mock_env.stop()
+
+    def test_generated_spec_is_shared(self):
+        generated = Firewall_rulesFacts(None).generated_spec
+        self.assertIs(Firewall_rulesFacts(None).generated_spec, generated)
+        self.assertEqual(
+            generated,
+            utils.generate_dict(
+                Firewall_rulesArgs.argument_spec["config"]["options"]
+            ),
+        )
+        self.assertIsNot(
+            get_generated_spec(Firewall_rulesArgs.argument_spec, None),
+            generated,
+        )
+
+    def test_conformed_facts(self):
+        conformed = validate_facts(Firewall_rulesArgs.argument_spec, RULES)
+        self.assertEqual(
+            conformed,
+            utils.validate_config(Firewall_rulesArgs.argument_spec, RULES),
+        )
+        rules = conformed["config"][0]["rule_sets"][0]["rules"]
+        self.assertEqual(rules[0]["number"], 101)
+        self.assertIs(rules[0]["disabled"], True)
+        self.assertEqual(rules[0]["destination"]["port"], "22")
+        self.assertEqual(rules[0]["recent"], {"count": 10, "time": 60})
+        self.assertIsNone(rules[1]["action"])
+
+    def test_strict_validation(self):
+        invalid = {
+            "config": [
+                {
+                    "afi": "ipv4",
+                    "rule_sets": [{"name": "IN", "default_action": "allow"}],
+                }
+            ]
+        }
+        # the parsers are trusted, the choices are not validated
+        self.assertEqual(
+            validate_facts(Firewall_rulesArgs.argument_spec, invalid)[
+                "config"
+            ][0]["rule_sets"][0]["default_action"],
+            "allow",
+        )
+        os.environ[STRICT_ENV] = "yes"
+        self.assertEqual(
+            validate_facts(Firewall_rulesArgs.argument_spec, RULES),
+            utils.validate_config(Firewall_rulesArgs.argument_spec, RULES),
+        )
+        self.assertRaises(
+            ValueError,
+            validate_facts,
+            Firewall_rulesArgs.argument_spec,
+            invalid,
+        )
+
+    def test_redacted_facts(self):
+        facts = {
+            "config": {
+                "as_number": 65536,
+                "neighbor": [{"address": "192.0.2.1", "password": "secret"}],
+            }
+        }
+        for strict in ("", "1"):
+            os.environ[STRICT_ENV] = strict
+            module = Module()
+            validate_facts(
+                Bgp_globalArgs.argument_spec, facts, module, redact=True
+            )
+            self.assertEqual(module.no_log_values, set(["secret"]))
+
+    def test_redacted_nested_facts(self):
+        facts = {
+            "config": [
+                {
+                    "name": "eth0",
+                    "address_family": [
+                        {
+                            "afi": "ipv4",
+                            "authentication": {
+                                "plaintext_password": "secret",
+                                "md5_key": {"key_id": 1, "key": "md5secret"},
+                            },
+                        }
+                    ],
+                }
+            ]
+        }
+        for strict in ("", "1"):
+            os.environ[STRICT_ENV] = strict
+            module = Module()
+            validate_facts(
+                Ospf_interfacesArgs.argument_spec, facts, module, redact=True
+            )
+            self.assertEqual(
+                module.no_log_values, set(["secret", "md5secret"])
+            )
@@ -0,0 +1,120 @@
+# (c) 2021 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.vyos.vyos.tests.unit.compat import unittest
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.utils import (
+    ListIndex,
+    get_lst_same_for_dicts,
+    list_diff_have_only,
+    list_diff_want_only,
+    parse_commits,
+)
+
+
+class TestVyosUtils(unittest.TestCase):
+    def test_list_diff_keeps_order_and_duplicates(self):
+        want = ["192.0.2.3", "192.0.2.1", "192.0.2.3", "192.0.2.4"]
+        have = ["192.0.2.1", "192.0.2.2", "192.0.2.2"]
+        self.assertEqual(
+            list_diff_want_only(want, have),
+            ["192.0.2.3", "192.0.2.3", "192.0.2.4"],
+        )
+        self.assertEqual(
+            list_diff_have_only(want, have), ["192.0.2.2", "192.0.2.2"]
+        )
+
+    def test_list_diff_empty_lists(self):
+        self.assertIsNone(list_diff_want_only([], ["eth0"]))
+        self.assertEqual(list_diff_want_only(["eth0"], []), ["eth0"])
+        self.assertEqual(list_diff_have_only([], ["eth0"]), ["eth0"])
+        self.assertIsNone(list_diff_have_only(["eth0"], []))
+
+    def test_list_diff_unhashable_elements(self):
+        want = [
+            {"address": "192.0.2.1/24", "tags": ["a"]},
+            {"address": "2001:db8::1/64"},
+        ]
+        have = [{"tags": ["a"], "address": "192.0.2.1/24"}, ["eth1"]]
+        self.assertEqual(
+            list_diff_want_only(want, have), [{"address": "2001:db8::1/64"}]
+        )
+        self.assertEqual(list_diff_have_only(want, have), [["eth1"]])
+
+    def test_get_lst_same_for_dicts(self):
+        want = {"members": [{"member": "eth1"}, {"member": "eth2"}]}
+        have = {"members": [{"member": "eth2"}, {"member": "eth3"}]}
+        self.assertEqual(
+            get_lst_same_for_dicts(want, have, "members"),
+            [{"member": "eth2"}],
+        )
+        self.assertEqual(get_lst_same_for_dicts({"x": 1}, have, "members"), [])
+        self.assertIsNone(get_lst_same_for_dicts({}, have, "members"))
+
+    def test_list_index(self):
+        routes = [
+            {"dest": "192.0.2.32/28", "next_hops": [{"ip": "192.0.2.9"}]},
+            {"dest": "192.0.2.48/28"},
+            {"dest": "192.0.2.32/28", "blackhole_config": {"distance": 2}},
+            {"next_hops": []},
+        ]
+        index = ListIndex(routes, key="dest")
+        self.assertIs(index.get("192.0.2.32/28"), routes[0])
+        self.assertIsNone(index.get("198.51.100.0/24"))
+        self.assertIn("192.0.2.48/28", index)
+        self.assertEqual(len(index), 2)
+
+    def test_list_index_multiple_keys(self):
+        civic = [
+            {"ca_type": 1, "ca_value": "ON"},
+            {"ca_type": 2, "ca_value": "Mississauga"},
+        ]
+        index = ListIndex(civic, key=("ca_type", "ca_value"))
+        self.assertIs(index.get((2, "Mississauga")), civic[1])
+        self.assertIsNone(index.get((2, "ON")))
+        self.assertIsNone(ListIndex(None).get("eth0"))
+
+    def test_parse_commits(self):
+        commits = parse_commits(
+            "0   2021-10-18 10:42:07 by vyos via cli\n"
+            "    daily changes\n"
+            "1   2021-10-17 09:12:55 by root via init\n"
+        )
+        self.assertEqual(
+            commits,
+            [
+                {
+                    "revision": "0",
+                    "datetime": "2021-10-18 10:42:07",
+                    "by": "vyos",
+                    "via": "cli",
+                    "comment": "daily changes",
+                },
+                {
+                    "revision": "1",
+                    "datetime": "2021-10-17 09:12:55",
+                    "by": "root",
+                    "via": "init",
+                    "comment": None,
+                },
+            ],
+        )
+        self.assertEqual(parse_commits(""), [])
@@ -0,0 +1,101 @@
+# (c) 2021 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.vyos.vyos.tests.unit.compat import unittest
+from ansible_collections.vyos.vyos.tests.unit.compat.mock import (
+    MagicMock,
+    patch,
+)
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos import (
+    vyos,
+)
+
+RUNNING = """set interfaces ethernet eth0 address 'dhcp'
+set interfaces ethernet eth1 description 'uplink'
+set system host-name 'vyos'"""
+
+
+class TestVyosGetConfig(unittest.TestCase):
+    def setUp(self):
+        vyos.clear_config_cache()
+        self.connection = MagicMock()
+        self.connection.get_config.return_value = RUNNING
+        self.connection.edit_config.return_value = {"diff": None}
+        self.mock_get_connection = patch(
+            "ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.vyos.get_connection",
+            return_value=self.connection,
+        )
+        self.mock_get_connection.start()
+        self.module = MagicMock()
+
+    def tearDown(self):
+        self.mock_get_connection.stop()
+        vyos.clear_config_cache()
+
+    def test_flagged_views_share_one_fetch(self):
+        self.assertEqual(
+            vyos.get_config(self.module, flags=["| grep interface"]),
+            "set interfaces ethernet eth0 address 'dhcp'\n"
+            "set interfaces ethernet eth1 description 'uplink'",
+        )
+        self.assertEqual(vyos.get_config(self.module), RUNNING)
+        self.connection.get_config.assert_called_once_with(format=None)
+
+    def test_text_format_is_cached_separately(self):
+        vyos.get_config(self.module)
+        vyos.get_config(self.module, format="text")
+        self.assertEqual(self.connection.get_config.call_count, 2)
+
+    def test_unsupported_flags_go_to_device(self):
+        vyos.get_config(self.module, flags=["| no-more"])
+        self.connection.get_config.assert_called_with(
+            flags=["| no-more"], format=None
+        )
+
+    def test_load_config_invalidates_cache(self):
+        vyos.get_config(self.module)
+        vyos.load_config(self.module, ["set system host-name 'vyos01'"])
+        vyos.get_config(self.module)
+        self.assertEqual(self.connection.get_config.call_count, 2)
+
+    def test_check_mode_is_offline_without_diff(self):
+        self.module.check_mode = True
+        self.module._diff = False
+        commands = ["set system host-name 'vyos01'"]
+        self.assertIsNone(vyos.load_config(self.module, commands))
+        self.connection.edit_config.assert_not_called()
+
+        self.module._diff = True
+        self.connection.edit_config.return_value = {"diff": "[edit system]"}
+        self.assertEqual(
+            vyos.load_config(self.module, commands), "[edit system]"
+        )
+        self.connection.edit_config.assert_called_once_with(
+            candidate=commands, commit=False, replace=None, comment=None
+        )
+
+        # a replace is always loaded to compare it with the running config
+        self.module._diff = False
+        vyos.load_config(self.module, "system {\n}", replace=True)
+        self.connection.edit_config.assert_called_with(
+            candidate="system {\n}", commit=False, replace=True, comment=None
+        )
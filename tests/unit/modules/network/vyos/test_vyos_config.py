@@ -153,3 +153,27 @@ class TestVyosConfigModule(TestVyosModule):
             )
         )
         self.execute_module(changed=True, commands=lines, sort=False)
+
+    def test_vyos_config_replace_config(self):
+        src = load_fixture("vyos_config_src_brackets.cfg")
+        set_module_args(dict(src=src, replace="config"))
+        self.conn.get_diff = MagicMock()
+        self.load_config.side_effect = (
+            lambda *args, **kwargs: "[edit system]\n-host-name vyos\n"
+        )
+        self.execute_module(changed=True, commands=[])
+        self.conn.get_diff.assert_not_called()
+        self.load_config.assert_called_once_with(
+            self.load_config.call_args[0][0],
+            src.strip(),
+            commit=True,
+            comment="configured by vyos_config",
+            replace=True,
+        )
+
+    def test_vyos_config_replace_config_set_format(self):
+        lines = ["set system host-name foo"]
+        set_module_args(dict(lines=lines, replace="config"))
+        result = self.execute_module(failed=True)
+        self.assertIn("curly-brace format", result["msg"])
+        self.load_config.assert_not_called()
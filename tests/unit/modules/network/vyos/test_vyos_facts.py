@@ -22,6 +22,7 @@ import json
 from ansible_collections.vyos.vyos.tests.unit.compat.mock import patch
 from ansible_collections.vyos.vyos.plugins.modules import vyos_facts
 from ansible_collections.vyos.vyos.tests.unit.modules.utils import (
+    AnsibleExitJson,
     set_module_args,
 )
 from .vyos_module import TestVyosModule, load_fixture
@@ -43,6 +44,10 @@ class TestVyosFactsModule(TestVyosModule):
         self.get_resource_connection = (
             self.mock_get_resource_connection.start()
         )
+        connection = self.get_resource_connection.return_value
+        connection.get_capabilities.return_value = json.dumps(
+            {"format": ["text", "set"]}
+        )
 
         self.mock_get_capabilities = patch(
             "ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.facts.legacy.base.get_capabilities"
@@ -107,3 +112,132 @@ class TestVyosFactsModule(TestVyosModule):
     def test_vyos_facts_invalid_subset(self):
         set_module_args(dict(gather_subset="cereal"))
         self.execute_module(failed=True)
+
+    def test_vyos_facts_timing(self):
+        config = (
+            "set protocols static route 192.0.2.32/28 next-hop '192.0.2.9'\n"
+            "set protocols static route 192.0.2.32/28 blackhole"
+        )
+        connection = self.get_resource_connection.return_value
+        connection.get_config.return_value = config
+        set_module_args(
+            dict(
+                gather_subset="default",
+                gather_network_resources="static_routes",
+                timing=True,
+            )
+        )
+        result = self.execute_module()
+        timing = result["vyos_facts_timing"]
+        self.assertIn("legacy", timing)
+        self.assertGreaterEqual(timing["total"], 0)
+        static_routes = timing["resources"]["static_routes"]
+        self.assertEqual(static_routes["lines"], 2)
+        self.assertEqual(static_routes["bytes"], len(config))
+        self.assertTrue(static_routes["fetched"])
+        self.assertEqual(
+            sorted(static_routes["phases"]), ["fetch", "parse", "validate"]
+        )
+        self.assertGreaterEqual(
+            static_routes["wall_time"], static_routes["phases"]["parse"]
+        )
+        self.assertEqual(
+            result["ansible_facts"]["ansible_network_resources"][
+                "static_routes"
+            ][0]["address_families"][0]["routes"][0]["dest"],
+            "192.0.2.32/28",
+        )
+
+    def test_vyos_facts_no_timing(self):
+        set_module_args(dict(gather_subset="default"))
+        result = self.execute_module()
+        self.assertNotIn("vyos_facts_timing", result)
+
+    def test_vyos_facts_cached_resources(self):
+        connection = self.get_resource_connection.return_value
+        connection.get_facts_cache.return_value = {
+            "commit": {"revision": "0", "datetime": "2021-10-18 10:42:07"},
+            "resources": {
+                "static_routes": [{"address_families": [{"afi": "ipv4"}]}],
+                "lldp_global": None,
+            },
+        }
+        connection.get_config.return_value = "set service lldp"
+        set_module_args(
+            dict(
+                gather_subset="default",
+                gather_network_resources=[
+                    "static_routes",
+                    "lldp_global",
+                    "firewall_global",
+                ],
+                timing=True,
+            )
+        )
+        result = self.execute_module()
+        resources = result["ansible_facts"]["ansible_network_resources"]
+        self.assertEqual(
+            resources["static_routes"],
+            [{"address_families": [{"afi": "ipv4"}]}],
+        )
+        self.assertNotIn("lldp_global", resources)
+        self.assertEqual(
+            result["vyos_facts_timing"]["cached"],
+            ["lldp_global", "static_routes"],
+        )
+        self.assertEqual(
+            list(result["vyos_facts_timing"]["resources"]), ["firewall_global"]
+        )
+        connection.set_facts_cache.assert_called_once_with(
+            {"revision": "0", "datetime": "2021-10-18 10:42:07"},
+            {"firewall_global": {}},
+        )
+
+    def test_vyos_facts_cached_resources_no_log(self):
+        def exit_json(module, **kwargs):
+            no_log_values.update(module.no_log_values)
+            raise AnsibleExitJson(kwargs)
+
+        commit = {"revision": "0", "datetime": "2021-10-18 10:42:07"}
+        facts = {
+            "as_number": 65536,
+            "neighbor": [{"address": "192.0.2.1", "password": "topsecret"}],
+        }
+        connection = self.get_resource_connection.return_value
+        connection.get.return_value = (
+            "set protocols bgp 65536 neighbor 192.0.2.1 password topsecret"
+        )
+        set_module_args(
+            dict(gather_subset="min", gather_network_resources="bgp_global")
+        )
+        self.load_fixtures()
+        with patch.object(vyos_facts.AnsibleModule, "exit_json", exit_json):
+            # the facts holding a no_log value are not stored
+            no_log_values = set()
+            connection.get_facts_cache.return_value = {
+                "commit": commit,
+                "resources": {},
+            }
+            with self.assertRaises(AnsibleExitJson) as exc:
+                self.module.main()
+            resources = exc.exception.args[0]["ansible_facts"][
+                "ansible_network_resources"
+            ]
+            self.assertEqual(resources["bgp_global"], facts)
+            self.assertEqual(no_log_values, set(["topsecret"]))
+            connection.set_facts_cache.assert_called_once_with(commit, {})
+
+            # the no_log values of the facts served from the cache
+            no_log_values = set()
+            connection.get_facts_cache.return_value = {
+                "commit": commit,
+                "resources": {"bgp_global": facts},
+            }
+            with self.assertRaises(AnsibleExitJson) as exc:
+                self.module.main()
+            resources = exc.exception.args[0]["ansible_facts"][
+                "ansible_network_resources"
+            ]
+            self.assertEqual(resources["bgp_global"], facts)
+            self.assertEqual(no_log_values, set(["topsecret"]))
+            connection.set_facts_cache.assert_called_once_with(commit, {})
@@ -1078,3 +1078,92 @@ class TestVyosFirewallRulesModule(TestVyosModule):
             )
         )
         self.execute_module(changed=False, commands=[])
+
+    def test_vyos_firewall_v4v6_rule_sets_parsed(self):
+        parsed_str = (
+            "set firewall ipv6-name V6-INGRESS default-action 'accept'"
+            "\nset firewall ipv6-name V6-INGRESS rule 10 action 'accept'"
+            "\nset firewall ipv6-name V6-INGRESS rule 10 protocol 'icmpv6'"
+            "\nset firewall name V4-INGRESS default-action 'drop'"
+            "\nset firewall name V4-INGRESS description 'Inbound IPv4 rules'"
+            "\nset firewall name V4-INGRESS enable-default-log"
+            "\nset firewall name V4-INGRESS rule 20 action 'accept'"
+            "\nset firewall name V4-INGRESS rule 20 destination port '22'"
+            "\nset firewall name V4-INGRESS rule 20 protocol 'tcp'"
+            "\nset firewall name V4-INGRESS rule 20 source address '192.0.2.0/24'"
+            "\nset firewall name V4-INGRESS rule 20 source group network-group 'MGMT'"
+            "\nset firewall name V4-INGRESS rule 20 state established 'enable'"
+            "\nset firewall name V4-INGRESS rule 20 state new 'enable'"
+            "\nset firewall name V4-INGRESS rule 20 recent count '5'"
+            "\nset firewall name V4-INGRESS rule 20 recent time '60'"
+            "\nset firewall name V4-INGRESS rule 20 tcp flags 'SYN'"
+            "\nset firewall name V4-EGRESS default-action 'reject'"
+            "\nset firewall name V4-EGRESS rule 5"
+            "\nset firewall name V4-INGRESS rule 101 action 'drop'"
+            "\nset firewall name V4-INGRESS rule 101 disabled"
+            "\nset firewall name V4-INGRESS rule 101 icmp type-name 'echo-request'"
+            "\nset firewall name V4-INGRESS rule 101 limit burst '10'"
+            "\nset firewall name V4-INGRESS rule 101 protocol 'icmp'"
+            "\nset firewall name V4-INGRESS rule 101 time weekdays 'Mon,Tue'"
+        )
+        set_module_args(dict(running_config=parsed_str, state="parsed"))
+        result = self.execute_module(changed=False)
+        parsed_list = [
+            {
+                "afi": "ipv6",
+                "rule_sets": [
+                    {
+                        "default_action": "accept",
+                        "name": "V6-INGRESS",
+                        "rules": [
+                            {
+                                "action": "accept",
+                                "number": 10,
+                                "protocol": "icmpv6",
+                            }
+                        ],
+                    }
+                ],
+            },
+            {
+                "afi": "ipv4",
+                "rule_sets": [
+                    {
+                        "default_action": "drop",
+                        "description": "Inbound IPv4 rules",
+                        "enable_default_log": True,
+                        "name": "V4-INGRESS",
+                        "rules": [
+                            {
+                                "action": "accept",
+                                "destination": {"port": "22"},
+                                "number": 20,
+                                "protocol": "tcp",
+                                "recent": {"count": 5, "time": 60},
+                                "source": {
+                                    "address": "192.0.2.0/24",
+                                    "group": {"network_group": "MGMT"},
+                                },
+                                "state": {"established": True, "new": True},
+                                "tcp": {"flags": "SYN"},
+                            },
+                            {
+                                "action": "drop",
+                                "disabled": True,
+                                "icmp": {"type_name": "echo-request"},
+                                "limit": {"burst": 10},
+                                "number": 101,
+                                "protocol": "icmp",
+                                "time": {"weekdays": "Mon,Tue"},
+                            },
+                        ],
+                    },
+                    {
+                        "default_action": "reject",
+                        "name": "V4-EGRESS",
+                        "rules": [{"number": 5}],
+                    },
+                ],
+            },
+        ]
+        self.assertEqual(parsed_list, result["parsed"])
@@ -0,0 +1,127 @@
+# (c) 2021 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.vyos.vyos.tests.unit.compat.mock import patch
+from ansible_collections.vyos.vyos.plugins.modules import (
+    vyos_lag_interfaces,
+)
+from ansible_collections.vyos.vyos.tests.unit.modules.utils import (
+    set_module_args,
+)
+from .vyos_module import TestVyosModule, load_fixture
+
+
+class TestVyosLagInterfacesModule(TestVyosModule):
+
+    module = vyos_lag_interfaces
+
+    def setUp(self):
+        super(TestVyosLagInterfacesModule, self).setUp()
+        self.mock_get_config = patch(
+            "ansible_collections.ansible.netcommon.plugins.module_utils.network.common.network.Config.get_config"
+        )
+        self.get_config = self.mock_get_config.start()
+
+        self.mock_load_config = patch(
+            "ansible_collections.ansible.netcommon.plugins.module_utils.network.common.network.Config.load_config"
+        )
+        self.load_config = self.mock_load_config.start()
+
+        self.mock_get_resource_connection_config = patch(
+            "ansible_collections.ansible.netcommon.plugins.module_utils.network.common.cfg.base.get_resource_connection"
+        )
+        self.get_resource_connection_config = (
+            self.mock_get_resource_connection_config.start()
+        )
+
+        self.mock_get_resource_connection_facts = patch(
+            "ansible_collections.ansible.netcommon.plugins.module_utils.network.common.facts.facts.get_resource_connection"
+        )
+        self.get_resource_connection_facts = (
+            self.mock_get_resource_connection_facts.start()
+        )
+
+    def tearDown(self):
+        super(TestVyosLagInterfacesModule, self).tearDown()
+        self.mock_get_resource_connection_config.stop()
+        self.mock_get_resource_connection_facts.stop()
+        self.mock_get_config.stop()
+        self.mock_load_config.stop()
+
+    def load_fixtures(self, commands=None):
+        connection = self.get_resource_connection_facts.return_value
+        connection.get_facts_cache.return_value = None
+        connection.get_config.return_value = load_fixture(
+            "vyos_lag_interfaces_config.cfg"
+        )
+
+    def test_vyos_lag_interfaces_gathered(self):
+        set_module_args(dict(state="gathered"))
+        result = self.execute_module(changed=False)
+        gathered = [
+            {
+                "name": "bond1",
+                "hash_policy": "layer2",
+                "mode": "active-backup",
+                "members": [
+                    {"member": "eth1"},
+                    {"member": "eth2"},
+                    {"member": "eth5"},
+                ],
+            },
+            {
+                "name": "bond2",
+                "mode": "802.3ad",
+                "primary": "eth4",
+                "members": [{"member": "eth3"}, {"member": "eth4"}],
+            },
+        ]
+        self.assertEqual(result["gathered"], gathered)
+
+    def test_vyos_lag_interfaces_merged_idempotent(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="bond1",
+                        members=[
+                            dict(member="eth1"),
+                            dict(member="eth2"),
+                            dict(member="eth5"),
+                        ],
+                    ),
+                    dict(name="bond2", members=[dict(member="eth3")]),
+                ],
+                state="merged",
+            )
+        )
+        self.execute_module(changed=False, commands=[])
+
+    def test_vyos_lag_interfaces_merged_new_member(self):
+        set_module_args(
+            dict(
+                config=[dict(name="bond2", members=[dict(member="eth6")])],
+                state="merged",
+            )
+        )
+        commands = ["set interfaces ethernet eth6 bond-group 'bond2'"]
+        self.execute_module(changed=True, commands=commands)
@@ -20,6 +20,8 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import json
+
 from ansible_collections.vyos.vyos.tests.unit.compat.mock import patch
 from ansible_collections.vyos.vyos.plugins.modules import vyos_static_routes
 from ansible_collections.vyos.vyos.tests.unit.modules.utils import (
@@ -287,3 +289,149 @@ class TestVyosStaticRoutesModule(TestVyosModule):
         )
         commands = ["delete protocols static route"]
         self.execute_module(changed=True, commands=commands)
+
+    def test_vyos_static_routes_merged_computed_after(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        address_families=[
+                            dict(
+                                afi="ipv4",
+                                routes=[
+                                    dict(
+                                        dest="192.0.2.32/28",
+                                        next_hops=[
+                                            dict(
+                                                forward_router_address="192.0.2.9",
+                                                admin_distance=10,
+                                            )
+                                        ],
+                                    ),
+                                    dict(
+                                        dest="192.0.2.48/28",
+                                        blackhole_config=dict(
+                                            type="blackhole"
+                                        ),
+                                    ),
+                                ],
+                            )
+                        ]
+                    )
+                ],
+                state="merged",
+                verify_after=False,
+            )
+        )
+        result = self.execute_module(changed=True)
+        self.assertEqual(self.execute_show_command.call_count, 1)
+        self.assertEqual(
+            result["after"],
+            [
+                {
+                    "address_families": [
+                        {
+                            "afi": "ipv4",
+                            "routes": [
+                                {
+                                    "dest": "192.0.2.32/28",
+                                    "next_hops": [
+                                        {
+                                            "forward_router_address": "192.0.2.9",
+                                            "admin_distance": 10,
+                                        },
+                                        {
+                                            "forward_router_address": "192.0.2.10"
+                                        },
+                                    ],
+                                },
+                                {
+                                    "dest": "192.0.2.48/28",
+                                    "blackhole_config": {"type": "blackhole"},
+                                },
+                            ],
+                        }
+                    ]
+                }
+            ],
+        )
+
+    def test_vyos_static_routes_merged_computed_after_json(self):
+        self.mock_execute_show_command.stop()
+        connection = self.get_resource_connection_config.return_value
+        connection.get_capabilities.return_value = json.dumps(
+            {"format": ["text", "set", "json"]}
+        )
+        connection.get_config.return_value = json.dumps(
+            {
+                "protocols": {
+                    "static": {
+                        "route": {
+                            "192.0.2.32/28": {
+                                "next-hop": {"192.0.2.9": {}, "192.0.2.10": {}}
+                            },
+                            "198.51.100.0/24": {
+                                "blackhole": {"distance": "5"}
+                            },
+                        }
+                    }
+                }
+            }
+        )
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        address_families=[
+                            dict(
+                                afi="ipv4",
+                                routes=[
+                                    dict(
+                                        dest="192.0.2.48/28",
+                                        blackhole_config=dict(
+                                            type="blackhole"
+                                        ),
+                                    )
+                                ],
+                            )
+                        ]
+                    )
+                ],
+                state="merged",
+                verify_after=False,
+            )
+        )
+        result = self.execute_module(changed=True)
+        connection.get_config.assert_called_once_with(format="json")
+        self.assertEqual(
+            result["after"][0]["address_families"][0]["routes"],
+            [
+                {
+                    "dest": "192.0.2.32/28",
+                    "next_hops": [
+                        {"forward_router_address": "192.0.2.9"},
+                        {"forward_router_address": "192.0.2.10"},
+                    ],
+                },
+                {
+                    "dest": "198.51.100.0/24",
+                    "blackhole_config": {"distance": 5},
+                },
+                {
+                    "dest": "192.0.2.48/28",
+                    "blackhole_config": {"type": "blackhole"},
+                },
+            ],
+        )
+
+    def test_vyos_static_routes_deleted_computed_after(self):
+        set_module_args(
+            dict(
+                config=[dict(address_families=[dict(afi="ipv4")])],
+                state="deleted",
+                verify_after=False,
+            )
+        )
+        result = self.execute_module(changed=True)
+        self.assertEqual(self.execute_show_command.call_count, 1)
+        self.assertEqual(result["after"], [])
@@ -0,0 +1,630 @@
+# (c) 2021 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import base64
+import os
+import shutil
+import tempfile
+
+from ansible.errors import AnsibleConnectionFailure
+from ansible_collections.vyos.vyos.tests.unit.compat import unittest
+from ansible_collections.vyos.vyos.tests.unit.compat.mock import MagicMock
+from ansible_collections.vyos.vyos.plugins.cliconf.vyos import Cliconf
+
+RUNNING = """set interfaces ethernet eth0 address 'dhcp'
+set interfaces ethernet eth1 description 'uplink'
+set protocols bgp 65536 neighbor 192.0.2.25 remote-as '65535'
+set policy route-map RM1 rule 10 action 'permit'
+set system host-name 'vyos'"""
+
+
+class TestVyosCliconf(unittest.TestCase):
+    def setUp(self):
+        self.connection = MagicMock()
+        self.sent = []
+
+        def send(command, **kwargs):
+            self.sent.append(command)
+            if command == b"show configuration commands":
+                return RUNNING
+            return ""
+
+        self.connection.send.side_effect = send
+        self.cliconf = Cliconf(self.connection)
+        self.cliconf.get_option = {"config_snapshot": True}.get
+
+    def test_snapshot_disabled_by_default(self):
+        self.cliconf.get_option = {}.get
+        self.cliconf.get_config()
+        self.cliconf.get_config(flags=["| grep interfaces"])
+        self.assertEqual(
+            self.sent,
+            [
+                b"show configuration commands",
+                b"show configuration commands| grep interfaces",
+            ],
+        )
+
+    def test_get_config_filtered_views_share_one_fetch(self):
+        self.assertEqual(self.cliconf.get_config(), RUNNING)
+        self.assertEqual(
+            self.cliconf.get_config(flags=["| grep interfaces"]),
+            "set interfaces ethernet eth0 address 'dhcp'\n"
+            "set interfaces ethernet eth1 description 'uplink'",
+        )
+        self.assertEqual(
+            self.cliconf.get(
+                'show configuration commands |  match "set protocols bgp"'
+            ),
+            "set protocols bgp 65536 neighbor 192.0.2.25 remote-as '65535'",
+        )
+        self.assertEqual(
+            self.cliconf.get("show configuration commands | grep route-map"),
+            "set policy route-map RM1 rule 10 action 'permit'",
+        )
+        self.assertEqual(self.sent, [b"show configuration commands"])
+
+    def test_unsupported_filter_goes_to_device(self):
+        self.cliconf.get_config(flags=["| no-more"])
+        self.assertEqual(self.sent, [b"show configuration commands| no-more"])
+
+    def test_commit_invalidates_snapshot(self):
+        self.cliconf.get_config()
+        self.cliconf.commit()
+        self.cliconf.get_config(flags=["| grep system"])
+        self.assertEqual(
+            self.sent,
+            [
+                b"show configuration commands",
+                b"commit",
+                b"show configuration commands",
+            ],
+        )
+
+    def test_discard_and_configure_invalidate_snapshot(self):
+        for command in (self.cliconf.discard_changes, None):
+            self.cliconf.get_config()
+            if command:
+                command()
+            else:
+                self.cliconf.send_command("configure")
+        self.cliconf.get_config()
+        self.assertEqual(self.sent.count(b"show configuration commands"), 3)
+
+    def test_edit_config_not_minimized_by_default(self):
+        candidate = [
+            "delete interfaces ethernet eth1 description",
+            "delete interfaces ethernet eth1",
+        ]
+        self.cliconf.edit_config(candidate)
+        self.assertEqual(self.sent[1:-2], [cmd.encode() for cmd in candidate])
+
+    def test_edit_config_folds_redundant_commands(self):
+        self.cliconf.get_option = {
+            "config_snapshot": True,
+            "config_minimize": True,
+        }.get
+        self.cliconf.edit_config(
+            [
+                "set interfaces ethernet eth1 description 'lan'",
+                "delete interfaces ethernet eth1 address",
+                "delete interfaces ethernet eth1 description",
+                "set system host-name 'vyos01'",
+                "delete interfaces ethernet eth1",
+            ]
+        )
+        self.assertEqual(
+            self.sent[1:-2],
+            [
+                b"set interfaces ethernet eth1 description 'lan'",
+                b"set system host-name 'vyos01'",
+                b"delete interfaces ethernet eth1",
+            ],
+        )
+
+        # the snapshot tells that eth1 exists before the first command
+        self.cliconf.get_config()
+        del self.sent[:]
+        self.cliconf.edit_config(
+            [
+                "set interfaces ethernet eth1 description 'lan'",
+                "delete interfaces ethernet eth1",
+            ]
+        )
+        self.assertEqual(
+            self.sent[:2], [b"configure", b"delete interfaces ethernet eth1"]
+        )
+
+
+RUNNING_JSON = (
+    """{"interfaces": {"ethernet": {"eth0": {"address": ["dhcp"]}}}}"""
+)
+
+VERSION = """Version:          VyOS %s
+Release Train:    equuleus
+HW model:         VMware Virtual Platform"""
+
+
+class TestVyosCliconfConfigJson(unittest.TestCase):
+    def setUp(self):
+        self.connection = MagicMock()
+        self.sent = []
+        self.version = "1.3.0"
+
+        def send(command, **kwargs):
+            self.sent.append(command)
+            if command == b"show version":
+                return VERSION % self.version
+            if command == b"show configuration json":
+                return RUNNING_JSON
+            return ""
+
+        self.connection.send.side_effect = send
+        self.cliconf = Cliconf(self.connection)
+        self.cliconf.get_option = {
+            "config_json": True,
+            "config_snapshot": True,
+        }.get
+
+    def test_get_config_json(self):
+        self.assertIn("json", self.cliconf.get_option_values()["format"])
+        self.assertEqual(self.cliconf.get_config(format="json"), RUNNING_JSON)
+        self.assertEqual(self.cliconf.get_config(format="json"), RUNNING_JSON)
+        self.assertEqual(self.sent.count(b"show configuration json"), 1)
+        self.assertRaises(
+            ValueError,
+            self.cliconf.get_config,
+            flags=["| grep interfaces"],
+            format="json",
+        )
+
+    def test_json_not_supported(self):
+        self.version = "1.2.9-S1"
+        self.assertEqual(
+            self.cliconf.get_option_values()["format"], ["text", "set"]
+        )
+        self.assertRaises(ValueError, self.cliconf.get_config, format="json")
+        self.assertNotIn(b"show configuration json", self.sent)
+
+    def test_json_disabled(self):
+        for options in ({"config_json": False}, {}):
+            self.cliconf.get_option = options.get
+            self.assertNotIn(
+                "json", self.cliconf.get_option_values()["format"]
+            )
+        self.assertNotIn(b"show version", self.sent)
+
+
+COMMITS = """0   2021-10-18 10:42:07 by vyos via cli
+    daily changes
+1   2021-10-17 09:12:55 by vyos via cli
+"""
+
+
+class TestVyosCliconfFactsCache(unittest.TestCase):
+    def setUp(self):
+        self.connection = MagicMock()
+        self.connection.get_option.side_effect = {
+            "host": "2001:db8::1",
+            "port": 22,
+        }.get
+        self.sent = []
+        self.commits = COMMITS
+
+        def send(command, **kwargs):
+            self.sent.append(command)
+            if command == b"show system commit":
+                return self.commits
+            if command == b"show configuration commands":
+                return RUNNING
+            return ""
+
+        self.connection.send.side_effect = send
+        self.cache_dir = tempfile.mkdtemp()
+        self.cliconf = Cliconf(self.connection)
+        self.cliconf.get_option = {
+            "config_snapshot": True,
+            "facts_cache": self.cache_dir,
+        }.get
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_facts_cache_disabled(self):
+        self.cliconf.get_option = {}.get
+        self.assertIsNone(self.cliconf.get_facts_cache())
+        self.cliconf.set_facts_cache({"revision": "0"}, {"lldp_global": None})
+        self.assertEqual(self.sent, [])
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_facts_cache_keyed_by_commit(self):
+        commit = {"revision": "0", "datetime": "2021-10-18 10:42:07"}
+        cache = self.cliconf.get_facts_cache()
+        self.assertEqual(cache, {"commit": commit, "resources": {}})
+
+        self.cliconf.set_facts_cache(commit, {"lldp_global": None})
+        self.cliconf.set_facts_cache(
+            commit, {"interfaces": [{"name": "eth0"}]}
+        )
+        self.assertEqual(os.listdir(self.cache_dir), ["2001_db8__1_22.json"])
+        cache = self.cliconf.get_facts_cache()
+        self.assertEqual(
+            cache["resources"],
+            {"lldp_global": None, "interfaces": [{"name": "eth0"}]},
+        )
+        self.assertEqual(self.sent, [b"show system commit"] * 2)
+
+        self.commits = "0   2021-10-18 11:03:40 by vyos via cli\n" + COMMITS
+        cache = self.cliconf.get_facts_cache()
+        self.assertEqual(cache["commit"]["datetime"], "2021-10-18 11:03:40")
+        self.assertEqual(cache["resources"], {})
+
+    def test_facts_cache_directory_mode(self):
+        directory = os.path.join(self.cache_dir, "facts")
+        self.cliconf.get_option = {"facts_cache": directory}.get
+        self.cliconf.set_facts_cache({"revision": "0"}, {"lldp_global": None})
+        self.assertEqual(os.stat(directory).st_mode & 0o777, 0o700)
+
+    def test_facts_cache_without_commits(self):
+        self.commits = ""
+        self.assertEqual(
+            self.cliconf.get_facts_cache(), {"commit": None, "resources": {}}
+        )
+        self.cliconf.set_facts_cache(None, {"lldp_global": None})
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_new_commit_invalidates_snapshot(self):
+        self.cliconf.get_facts_cache()
+        self.cliconf.get_config()
+        self.cliconf.get_facts_cache()
+        self.cliconf.get_config()
+        self.commits = "0   2021-10-18 11:03:40 by vyos via cli\n" + COMMITS
+        self.cliconf.get_facts_cache()
+        self.cliconf.get_config()
+        self.assertEqual(self.sent.count(b"show configuration commands"), 2)
+
+
+class TestVyosCliconfBatchedEditConfig(unittest.TestCase):
+    def setUp(self):
+        self.connection = MagicMock()
+        self.sent = []
+        self.pending = []
+
+        def send(command, **kwargs):
+            self.sent.append(command)
+            lines = command.decode().split("\n")
+            if lines == ["compare"]:
+                return "No changes between working and active configurations"
+            out = []
+            for line in lines:
+                if "invalid" in line:
+                    out.append(
+                        "\n  Configuration path: [%s] is not valid\n"
+                        "  Set failed" % " ".join(line.split()[1:4])
+                    )
+                out.append("[edit]")
+            if any("failed" in line for line in out):
+                raise AnsibleConnectionFailure(out[-2] if len(out) > 1 else "")
+            # only the first acknowledgement comes back with the paste
+            self.pending = out[1:]
+            return out[0]
+
+        def receive(*args, **kwargs):
+            out, self.pending = self.pending, []
+            return "\n".join(out)
+
+        self.connection.send.side_effect = send
+        self.connection.receive.side_effect = receive
+        self.connection.get_prompt.return_value = b"vyos@vyos:~$"
+        self.cliconf = Cliconf(self.connection)
+        self.cliconf._config_batch_size = lambda: 2
+
+    def test_edit_config_pastes_batches(self):
+        candidate = [
+            "set system host-name 'vyos01'",
+            "set interfaces ethernet eth1 description 'uplink'",
+            "set service lldp",
+        ]
+        resp = self.cliconf.edit_config(candidate, commit=False)
+        self.assertEqual(
+            self.sent,
+            [
+                b"configure",
+                b"set system host-name 'vyos01'\n"
+                b"set interfaces ethernet eth1 description 'uplink'",
+                b"set service lldp",
+                b"compare",
+                b"exit",
+            ],
+        )
+        self.assertEqual(resp["request"], candidate)
+        self.assertEqual(resp["response"], ["[edit]"] * 3)
+
+    def test_edit_config_sends_prompted_commands_alone(self):
+        candidate = [
+            "set system host-name 'vyos01'",
+            {
+                "command": "load /config/x",
+                "prompt": "\\[y/N\\]",
+                "answer": "y",
+            },
+            "set service lldp",
+        ]
+        self.cliconf.edit_config(candidate, commit=False)
+        self.assertEqual(
+            self.sent[1:4],
+            [
+                b"set system host-name 'vyos01'",
+                b"load /config/x",
+                b"set service lldp",
+            ],
+        )
+
+    def test_edit_config_reports_failed_command(self):
+        candidate = [
+            "set system host-name 'vyos01'",
+            "set interfaces invalid eth1 description 'uplink'",
+        ]
+        with self.assertRaises(AnsibleConnectionFailure) as exc:
+            self.cliconf.edit_config(candidate, commit=False)
+        self.assertIn(
+            "failed command: set interfaces invalid eth1 description 'uplink'",
+            exc.exception.message,
+        )
+        self.assertEqual(self.sent[-1], b"run echo ansible-batch-end")
+
+
+class TestVyosCliconfDeferredCommit(unittest.TestCase):
+    def setUp(self):
+        self.connection = MagicMock()
+        self.sent = []
+        self.changes = []
+        self.config_mode = False
+        self.commit_error = None
+
+        def send(command, **kwargs):
+            command = command.decode()
+            self.sent.append(command)
+            if command == "configure":
+                self.config_mode = True
+            elif command.startswith(("set ", "delete ")):
+                if command not in self.changes:
+                    self.changes.append(command)
+                return "[edit]"
+            elif command == "compare":
+                if not self.changes:
+                    return (
+                        "No changes between working and active configurations"
+                    )
+                return "\n".join("+ %s" % line for line in self.changes)
+            elif command.startswith("commit"):
+                if self.commit_error:
+                    raise AnsibleConnectionFailure(self.commit_error)
+                self.changes = []
+            elif command in ("exit", "exit discard"):
+                self.changes = []
+                self.config_mode = False
+            elif command == "show | commands":
+                return "\n".join([RUNNING] + self.changes)
+            return ""
+
+        def get_prompt():
+            return b"vyos@vyos# " if self.config_mode else b"vyos@vyos:~$ "
+
+        self.connection.send.side_effect = send
+        self.connection.get_prompt.side_effect = get_prompt
+        self.cliconf = Cliconf(self.connection)
+        self.cliconf.get_option = {
+            "config_snapshot": True,
+            "facts_cache": "/nonexistent",
+        }.get
+
+    def test_commits_coalesce_until_disabled(self):
+        self.assertIsNone(self.cliconf.defer_commit(True))
+        resp = self.cliconf.edit_config(
+            ["set system host-name 'vyos01'"], comment="hostname"
+        )
+        self.assertEqual(resp["diff"], "+ set system host-name 'vyos01'")
+
+        self.cliconf.set_cli_prompt_context()
+        resp = self.cliconf.edit_config(["set system host-name 'vyos01'"])
+        self.assertNotIn("diff", resp)
+
+        resp = self.cliconf.edit_config(["set service lldp"], comment="lldp")
+        self.assertIn("+ set service lldp", resp["diff"])
+        self.assertEqual(self.sent.count("configure"), 1)
+        self.assertNotIn("exit", self.sent)
+
+        self.assertEqual(
+            self.cliconf.defer_commit(False),
+            "+ set system host-name 'vyos01'\n+ set service lldp",
+        )
+        self.assertEqual(
+            self.sent[-2:], ['commit comment "hostname; lldp"', "exit"]
+        )
+        self.assertFalse(self.config_mode)
+        self.assertIsNone(self.cliconf.defer_commit(False))
+
+    def test_session_commands(self):
+        self.cliconf.defer_commit(True)
+        self.cliconf.edit_config(["set service lldp"])
+        del self.sent[:]
+
+        self.assertIn("set service lldp", self.cliconf.get_config())
+        self.assertEqual(
+            self.cliconf.get_config(flags=["| grep lldp"]),
+            "set service lldp",
+        )
+        self.cliconf.get("show version")
+        self.assertIsNone(self.cliconf.get_facts_cache())
+        self.assertNotIn("json", self.cliconf.get_option_values()["format"])
+        self.assertEqual(self.sent, ["show | commands", "run show version"])
+
+        # the check mode cannot load a candidate without losing the session
+        resp = self.cliconf.edit_config(["set system time-zone UTC"], False)
+        self.assertEqual(resp["request"], ["set system time-zone UTC"])
+        self.assertEqual(self.sent, ["show | commands", "run show version"])
+
+        self.cliconf.run_commands(["ping 192.0.2.1 count 1"])
+        self.assertEqual(
+            self.sent[2:], ["commit", "exit", "ping 192.0.2.1 count 1"]
+        )
+
+    def test_failed_commit_discards_pending_changes(self):
+        self.cliconf.defer_commit(True)
+        self.cliconf.edit_config(["set service lldp"])
+        self.commit_error = "Commit failed"
+        with self.assertRaises(AnsibleConnectionFailure) as exc:
+            self.cliconf.defer_commit(False)
+        self.assertIn("deferred changes failed", exc.exception.message)
+        self.assertEqual(self.sent[-1], "exit discard")
+        self.assertFalse(self.config_mode)
+
+        self.commit_error = None
+        self.cliconf.edit_config(["set service lldp"])
+        self.assertEqual(self.sent[-2:], ["commit", "exit"])
+
+    def test_discard_deferred(self):
+        self.assertIsNone(self.cliconf.discard_deferred())
+        self.cliconf.defer_commit(True)
+        self.cliconf.edit_config(["set service lldp"])
+        self.assertEqual(self.cliconf.discard_deferred(), "+ set service lldp")
+        self.assertEqual(self.sent[-1], "exit discard")
+        self.assertNotIn("commit", self.sent)
+        self.assertFalse(self.config_mode)
+        self.assertIsNone(self.cliconf.discard_deferred())
+
+
+class TestVyosCliconfReplaceConfig(unittest.TestCase):
+    def setUp(self):
+        self.connection = MagicMock()
+        self.sent = []
+        self.files = {}
+        self.active = "system {\n    host-name vyos\n}\n"
+        self.candidate = None
+        self.commit_error = None
+
+        def send(command, **kwargs):
+            command = command.decode()
+            self.sent.append(command.split("\n", 1)[0])
+            words = command.split()
+            if command.startswith("base64 -d > "):
+                data = "".join(command.split("\n")[1:-1])
+                self.files[words[3]] = base64.b64decode(data).decode()
+            elif command == "configure":
+                self.candidate = self.active
+            elif words[0] == "load":
+                if words[1] not in self.files:
+                    raise AnsibleConnectionFailure("Cannot open configuration")
+                self.candidate = self.files[words[1]]
+            elif command == "compare":
+                if self.candidate == self.active:
+                    return (
+                        "No changes between working and active configurations"
+                    )
+                return "[edit system]\n-host-name vyos"
+            elif command.startswith("commit"):
+                if self.commit_error:
+                    raise AnsibleConnectionFailure(self.commit_error)
+                self.active = self.candidate
+            elif command in ("exit", "exit discard"):
+                self.candidate = None
+            elif words[:2] == ["rm", "-f"]:
+                self.files.pop(words[2], None)
+            return ""
+
+        def get_prompt():
+            return b"vyos@vyos# " if self.candidate else b"vyos@vyos:~$ "
+
+        self.connection.send.side_effect = send
+        self.connection.get_prompt.side_effect = get_prompt
+        self.cliconf = Cliconf(self.connection)
+        self.cliconf.get_option = {"config_snapshot": True}.get
+
+    def test_replace_uploads_loads_and_commits(self):
+        config = "system {\n    host-name vyos01\n}"
+        resp = self.cliconf.edit_config(config, replace=True, comment="new")
+        self.assertEqual(resp["diff"], "[edit system]\n-host-name vyos")
+        self.assertEqual(self.active, config + "\n")
+        path = resp["request"][0].split()[1]
+        self.assertTrue(path.startswith("/tmp/ansible-"))
+        self.assertEqual(
+            self.sent,
+            [
+                "base64 -d > %s << 'ANSIBLE_EOF'" % path,
+                "configure",
+                "load %s" % path,
+                "compare",
+                'commit comment "new"',
+                "exit",
+                "rm -f %s" % path,
+            ],
+        )
+        self.assertEqual(self.files, {})
+
+        resp = self.cliconf.edit_config(config, replace=True)
+        self.assertNotIn("diff", resp)
+        self.assertNotIn("commit", self.sent[7:])
+
+    def test_replace_check_mode_discards(self):
+        resp = self.cliconf.edit_config(
+            "system {\n    host-name vyos01\n}", commit=False, replace=True
+        )
+        self.assertIn("diff", resp)
+        path = resp["request"][0].split()[1]
+        self.assertEqual(
+            self.sent[-3:], ["compare", "exit discard", "rm -f %s" % path]
+        )
+        self.assertIn("host-name vyos\n", self.active)
+
+    def test_replace_rejects_set_commands(self):
+        for candidate in (
+            ["set system host-name vyos01"],
+            "system {\n    host-name vyos01\n}\ndelete service ssh",
+        ):
+            with self.assertRaises(ValueError) as exc:
+                self.cliconf.edit_config(candidate, replace=True)
+            self.assertIn("curly-brace format", str(exc.exception))
+        self.assertEqual(self.sent, [])
+
+    def test_replace_from_device_file(self):
+        self.files["/config/intended.boot"] = "system {\n}\n"
+        resp = self.cliconf.edit_config(replace="/config/intended.boot")
+        self.assertEqual(resp["request"], ["load /config/intended.boot"])
+        self.assertEqual(self.active, "system {\n}\n")
+        self.assertNotIn("rm -f /config/intended.boot", self.sent)
+
+    def test_replace_failure_discards_and_cleans_up(self):
+        self.commit_error = "Commit failed"
+        with self.assertRaises(AnsibleConnectionFailure) as exc:
+            self.cliconf.edit_config("system {\n}", replace=True)
+        self.assertIn("commit failed", exc.exception.message)
+        self.assertEqual(self.sent[-2], "exit discard")
+        self.assertEqual(self.files, {})
+        self.assertIn("host-name vyos", self.active)
+
+        self.assertRaises(
+            AnsibleConnectionFailure,
+            self.cliconf.edit_config,
+            replace="/config/missing.boot",
+        )
+        self.assertEqual(self.sent[-1], "exit discard")
@@ -0,0 +1,257 @@
+# (c) 2021 Red Hat Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+
+from ansible.module_utils.connection import ConnectionError
+from ansible_collections.vyos.vyos.tests.unit.compat import unittest
+from ansible_collections.vyos.vyos.plugins.httpapi.vyos import HttpApi
+from ansible_collections.vyos.vyos.tests.unit.plugins.httpapi.vyos_api_server import (
+    HttpApiConnection,
+    VyosApiServer,
+)
+
+RUNNING = [
+    "set interfaces ethernet eth0 address 'dhcp'",
+    "set interfaces ethernet eth1 address '192.0.2.1/24'",
+    "set interfaces ethernet eth1 address '192.0.2.2/24'",
+    "set interfaces ethernet eth1 description 'uplink'",
+    "set system host-name 'vyos'",
+]
+
+
+class TestVyosHttpApi(unittest.TestCase):
+    def setUp(self):
+        self.server = VyosApiServer(RUNNING).start()
+        self.connection = HttpApiConnection(self.server.url)
+        self.httpapi = HttpApi(self.connection)
+        self.httpapi.get_option = {"config_snapshot": True}.get
+        self.connection.httpapi = self.httpapi
+        self.httpapi.login("vyos", "vyos-key")
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_get_config_filtered_views_share_one_fetch(self):
+        self.assertEqual(self.httpapi.get_config(), "\n".join(RUNNING))
+        self.assertEqual(
+            self.httpapi.get(
+                "show configuration commands | grep 'ethernet eth1'"
+            ),
+            "\n".join(RUNNING[1:4]),
+        )
+        self.assertEqual(
+            self.httpapi.get_config(flags=["| match host-name"]), RUNNING[4]
+        )
+        self.assertEqual(self.server.requests, ["/retrieve"])
+        self.assertRaises(
+            ValueError, self.httpapi.get_config, flags=["| no-more"]
+        )
+
+    def test_get_config_formats(self):
+        config = json.loads(self.httpapi.get_config(format="json"))
+        self.assertEqual(
+            config["interfaces"]["ethernet"]["eth1"]["address"],
+            ["192.0.2.1/24", "192.0.2.2/24"],
+        )
+        self.assertEqual(
+            json.loads(self.httpapi.get("show configuration json")), config
+        )
+        self.assertIn(
+            "    host-name vyos", self.httpapi.get("show configuration")
+        )
+
+    def test_get_capabilities(self):
+        capabilities = json.loads(self.httpapi.get_capabilities())
+        self.assertEqual(capabilities["network_api"], "httpapi")
+        self.assertIn("json", capabilities["format"])
+        self.assertEqual(
+            capabilities["device_info"],
+            {
+                "network_os": "vyos",
+                "network_os_version": "VyOS 1.3.0",
+                "network_os_model": "VMware",
+                "network_os_hostname": "vyos",
+            },
+        )
+        self.assertFalse(
+            capabilities["device_operations"]["supports_commit_comment"]
+        )
+        self.assertIsNone(self.httpapi.get_facts_cache())
+
+    def test_edit_config_sends_changes_in_one_request(self):
+        self.httpapi.get_config()
+        candidate = [
+            "set interfaces ethernet eth0 address 'dhcp'",
+            "set interfaces ethernet eth0 description 'lan'",
+            "delete interfaces ethernet eth1 address '192.0.2.2/24'",
+            "delete interfaces ethernet eth2",
+        ]
+        resp = self.httpapi.edit_config(candidate, comment="configured")
+        # the device would fail the request on the delete of eth2
+        self.assertEqual(resp["request"], candidate[:3])
+        self.assertEqual(resp["diff"], "\n".join(candidate[1:3]))
+        self.assertEqual(
+            self.server.requests, ["/retrieve", "/retrieve", "/configure"]
+        )
+        self.assertEqual(self.server.operations, 5)
+        self.assertEqual(
+            self.server.lines(),
+            [
+                "set interfaces ethernet eth0 address dhcp",
+                "set interfaces ethernet eth0 description lan",
+                "set interfaces ethernet eth1 address 192.0.2.1/24",
+                "set interfaces ethernet eth1 description uplink",
+                "set system host-name vyos",
+            ],
+        )
+        # the snapshot taken before the change is not served again
+        self.assertIn(
+            "set interfaces ethernet eth0 description 'lan'",
+            self.httpapi.get_config(),
+        )
+
+    def test_edit_config_folds_redundant_deletes(self):
+        self.httpapi.get_option = {
+            "config_snapshot": True,
+            "config_minimize": True,
+        }.get
+        candidate = [
+            "delete interfaces ethernet eth1 address '192.0.2.2/24'",
+            "delete interfaces ethernet eth1 description",
+            "delete interfaces ethernet eth1",
+        ]
+        resp = self.httpapi.edit_config(candidate)
+        self.assertEqual(resp["diff"], candidate[2])
+        self.assertEqual(self.server.requests, ["/retrieve", "/configure"])
+        # the retrieve of the running configuration and the delete of eth1
+        self.assertEqual(self.server.operations, 2)
+        self.assertNotIn("set interfaces ethernet eth1", self.server.lines())
+
+    def test_edit_config_not_minimized_by_default(self):
+        candidate = [
+            "delete interfaces ethernet eth1 address '192.0.2.2/24'",
+            "delete interfaces ethernet eth1 description",
+            "delete interfaces ethernet eth1",
+        ]
+        resp = self.httpapi.edit_config(candidate)
+        self.assertEqual(resp["request"], candidate)
+        self.assertEqual(resp["diff"], "\n".join(candidate))
+        # the retrieve of the running configuration and the three deletes
+        self.assertEqual(self.server.operations, 4)
+
+    def test_edit_config_sets_again_what_it_deleted(self):
+        candidate = [
+            "delete interfaces ethernet eth1 address",
+            "set interfaces ethernet eth1 address '192.0.2.1/24'",
+        ]
+        resp = self.httpapi.edit_config(candidate)
+        self.assertEqual(resp["request"], candidate)
+        self.assertEqual(resp["diff"], "\n".join(candidate))
+        self.assertIn(
+            "set interfaces ethernet eth1 address 192.0.2.1/24",
+            self.server.lines(),
+        )
+        self.assertNotIn(
+            "set interfaces ethernet eth1 address 192.0.2.2/24",
+            self.server.lines(),
+        )
+
+    def test_edit_config_without_changes(self):
+        resp = self.httpapi.edit_config(RUNNING[:2])
+        self.assertNotIn("diff", resp)
+        self.assertEqual(self.server.requests, ["/retrieve"])
+
+        resp = self.httpapi.edit_config(
+            ["set system domain-name 'example.com'"], commit=False
+        )
+        self.assertEqual(resp["diff"], "set system domain-name 'example.com'")
+        self.assertNotIn("/configure", self.server.requests)
+
+    def test_edit_config_unsupported(self):
+        self.assertRaises(ValueError, self.httpapi.edit_config, ["commit"])
+        self.assertRaises(
+            ValueError,
+            self.httpapi.edit_config,
+            ["set system host-name 'vyos'"],
+            replace="config",
+        )
+        self.assertEqual(self.server.requests, [])
+
+    def test_failed_commit_leaves_config_unchanged(self):
+        before = self.server.lines()
+        with self.assertRaises(ConnectionError) as ctx:
+            self.httpapi.edit_config(
+                ["set system domain-name 'example.com'", "set"]
+            )
+        self.assertIn("commit failed: Invalid path", "%s" % ctx.exception)
+        self.assertEqual(self.server.lines(), before)
+
+    def test_run_commands(self):
+        out = self.httpapi.run_commands(
+            ["show version", {"command": "show system commit"}]
+        )
+        self.assertIn("HW model:", out[0])
+        self.assertEqual(out[1], self.server.show["system commit"])
+
+        self.assertRaises(
+            ConnectionError, self.httpapi.run_commands, ["show nothing"]
+        )
+        out = self.httpapi.run_commands(["show nothing"], check_rc=False)
+        self.assertIsInstance(out[0], ConnectionError)
+        self.assertRaises(
+            ValueError, self.httpapi.run_commands, ["ping 192.0.2.1"]
+        )
+
+    def test_wrong_key_is_not_retried(self):
+        self.connection._options["password"] = "wrong"
+        with self.assertRaises(ConnectionError) as ctx:
+            self.httpapi.get("show version")
+        self.assertEqual(ctx.exception.code, 401)
+        self.assertEqual(self.server.requests, ["/show"])
+
+        self.httpapi.get_option = {"api_key": "vyos-key"}.get
+        self.assertIn("VyOS", self.httpapi.get("show version"))
+
+    def test_get_diff(self):
+        candidate = (
+            "interfaces {\n"
+            "    ethernet eth0 {\n"
+            "        address dhcp\n"
+            "        description lan\n"
+            "    }\n"
+            "}"
+        )
+        diff = self.httpapi.get_diff(
+            candidate=candidate, running=self.httpapi.get_config()
+        )
+        self.assertEqual(
+            diff["config_diff"],
+            ["set interfaces ethernet eth0 description lan"],
+        )
+        self.assertRaises(
+            ValueError,
+            self.httpapi.get_diff,
+            candidate=candidate,
+            running="",
+            path=["interfaces"],
+        )
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+# Copyright 2021 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+A local stand-in for the HTTP API of a VyOS device, for the httpapi plugin
+tests and benchmarks.
+
+The configuration is kept in memory as a tree of path segments and served
+as the json configuration of the device, where a node whose children are
+all valueless is a leaf holding their values. The `/configure` requests
+are applied at once or not at all, as the device does.
+"""
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from io import BytesIO
+
+from ansible.module_utils._text import to_bytes, to_text
+from ansible.module_utils.six.moves import BaseHTTPServer, socketserver
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.six.moves.urllib.parse import parse_qs
+from ansible.module_utils.six.moves.urllib.request import urlopen
+from ansible_collections.vyos.vyos.plugins.module_utils.network.vyos.utils.config_tree import (
+    tokenize,
+)
+
+API_KEY = "vyos-key"
+
+SHOW = {
+    "version": "Version:          VyOS 1.3.0\n"
+    "HW model:         VMware Virtual Platform",
+    "host name": "vyos",
+    "system commit": "0   2021-06-01 10:00:00 by vyos via cli",
+}
+
+
+def to_json(node):
+    """
+    This function renders a configuration node the way the device emits
+    it in the json configuration.
+    """
+    if not node:
+        return {}
+    if all(not child for child in node.values()):
+        values = list(node)
+        return values[0] if len(values) == 1 else values
+    return OrderedDict((key, to_json(child)) for key, child in node.items())
+
+
+def to_raw(node, indent=0):
+    """
+    This function renders a configuration node in the curly-brace format.
+    """
+    lines = []
+    for key, child in node.items():
+        if child and all(not value for value in child.values()):
+            for value in child:
+                lines.append("%s%s %s" % (" " * indent, key, value))
+        elif child:
+            lines.append("%s%s {" % (" " * indent, key))
+            lines.extend(to_raw(child, indent + 4))
+            lines.append("%s}" % (" " * indent))
+        else:
+            lines.append("%s%s" % (" " * indent, key))
+    return lines
+
+
+class ThreadingHTTPServer(
+    socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer
+):
+    daemon_threads = True
+
+
+class VyosApiServer(object):
+    """
+    The stand-in device. A request costs `latency` seconds plus `per_op`
+    for every configuration operation it carries.
+    """
+
+    def __init__(self, config=None, latency=0.0, per_op=0.0, key=API_KEY):
+        self.config = OrderedDict()
+        self.latency = latency
+        self.per_op = per_op
+        self.key = key
+        self.show = dict(SHOW)
+        self.requests = []
+        self.operations = 0
+        for line in config or []:
+            self._set(self.config, tokenize(line)[1:])
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = None
+
+    @property
+    def url(self):
+        return "http://127.0.0.1:%d" % self._httpd.server_address[1]
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+
+    def lines(self):
+        """The configuration as `set` commands without quotes."""
+        out = []
+        stack = [("set", self.config)]
+        while stack:
+            line, node = stack.pop()
+            if not node and line != "set":
+                out.append(line)
+            stack.extend(
+                (line + " " + key, child)
+                for key, child in reversed(list(node.items()))
+            )
+        return out
+
+    def handle(self, path, fields):
+        self.requests.append(path)
+        if fields.get("key") != self.key:
+            return 401, {
+                "success": False,
+                "error": "Valid API key is required",
+            }
+        try:
+            data = json.loads(fields.get("data", ""), object_pairs_hook=dict)
+        except ValueError:
+            return 400, {"success": False, "error": "Invalid JSON"}
+
+        operations = data if isinstance(data, list) else [data]
+        self.operations += len(operations)
+        time.sleep(self.latency + self.per_op * len(operations))
+
+        try:
+            if path == "/configure":
+                config = copy.deepcopy(self.config)
+                for operation in operations:
+                    if operation["op"] == "set":
+                        self._set(config, operation["path"])
+                    elif operation["op"] == "delete":
+                        self._delete(config, operation["path"])
+                    else:
+                        raise ValueError("invalid operation")
+                self.config = config
+                return 200, {"success": True, "data": None, "error": None}
+            if path == "/retrieve" and data.get("op") == "showConfig":
+                node = self._get(data.get("path", []))
+                if data.get("configFormat") == "raw":
+                    out = "\n".join(to_raw(node))
+                else:
+                    out = to_json(node)
+                return 200, {"success": True, "data": out, "error": None}
+            if path == "/show" and data.get("op") == "show":
+                command = " ".join(data.get("path", []))
+                if command not in self.show:
+                    raise ValueError("Invalid command: show %s" % command)
+                return 200, {
+                    "success": True,
+                    "data": self.show[command],
+                    "error": None,
+                }
+        except (KeyError, ValueError) as exc:
+            return 400, {"success": False, "error": "%s" % exc}
+        return 404, {"success": False, "error": "Not found"}
+
+    def _set(self, config, path):
+        if not path:
+            raise ValueError("Invalid path")
+        node = config
+        for token in path:
+            node = node.setdefault(token, OrderedDict())
+
+    def _delete(self, config, path):
+        nodes = [config]
+        for token in path:
+            node = nodes[-1].get(token)
+            if node is None:
+                raise ValueError(
+                    "Nothing to delete (the specified node does not exist)"
+                )
+            nodes.append(node)
+        del nodes[-2][path[-1]]
+        if not nodes[-1] and len(path) > 1 and not nodes[-2]:
+            # the last value of a leaf is gone, so is the leaf
+            del nodes[-3][path[-2]]
+
+    def _get(self, path):
+        node = self.config
+        for token in path:
+            node = node[token]
+        return node
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = to_text(self.rfile.read(length))
+                fields = dict(
+                    (key, values[0]) for key, values in parse_qs(body).items()
+                )
+                status, data = server.handle(self.path, fields)
+                out = to_bytes(json.dumps(data))
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", "%d" % len(out))
+                self.end_headers()
+                self.wfile.write(out)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+class HttpApiConnection(object):
+    """
+    A stand-in for the httpapi connection plugin, sending the requests of
+    the httpapi plugin to the stand-in device.
+    """
+
+    def __init__(self, url, password=API_KEY):
+        self.url = url
+        self.httpapi = None
+        self.messages = []
+        self._auth = None
+        self._options = {"password": password}
+
+    def get_option(self, option):
+        return self._options.get(option)
+
+    def queue_message(self, level, message):
+        self.messages.append((level, message))
+
+    def send(self, path, data, **kwargs):
+        try:
+            response = urlopen(self.url + path, data=to_bytes(data))
+        except HTTPError as exc:
+            response = self.httpapi.handle_httperror(exc)
+            if response is True or response is False:
+                raise
+        return response, BytesIO(response.read())